@@ -6,7 +6,7 @@ that are not already in the assets table. It uses the existing ingestion pipelin
 to ensure consistency.
 
 Usage:
-    ./scripts/batch_ingest_assets.py [--dry-run] [--kind bumper|break|all]
+    ./scripts/batch_ingest_assets.py [--dry-run] [--kind bumper|break|all] [--workers N]
 
 Exit codes:
     0: Success
@@ -15,12 +15,15 @@ Exit codes:
 
 import argparse
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from ai_radio.audio import extract_metadata
 from ai_radio.config import config
 from ai_radio.ingest import ingest_audio_file
 from ai_radio.db_assets import get_asset_by_path
@@ -60,7 +63,8 @@ def batch_ingest(
     directory: Path,
     kind: str,
     dry_run: bool = False,
-    skip_existing: bool = True
+    skip_existing: bool = True,
+    workers: int = 1,
 ) -> tuple[int, int, int]:
     """Batch ingest all files in directory.
 
@@ -69,6 +73,7 @@ def batch_ingest(
         kind: Asset kind (bumper/break)
         dry_run: If True, only show what would be ingested
         skip_existing: If True, skip files already in database
+        workers: Number of files to normalize at once
 
     Returns:
         Tuple of (success_count, skip_count, error_count)
@@ -98,6 +103,8 @@ def batch_ingest(
     unique_files = list(files_by_stem.values())
     logger.info(f"Processing {len(unique_files)} unique files (after deduplication)")
 
+    to_ingest = []
+    seen_ids = {}
     for file_path in unique_files:
         logger.info(f"Processing: {file_path.name}")
 
@@ -118,23 +125,48 @@ def batch_ingest(
             finally:
                 conn.close()
 
+        # Identical content maps to one asset_id and output file; ingesting
+        # both at once would race on them
         try:
-            # Ingest the file
-            output_path = config.paths.bumpers_path if kind == "bumper" else config.paths.breaks_path
-            result = ingest_audio_file(
-                source_path=file_path,
-                kind=kind,
-                db_path=config.paths.db_path,
-                output_dir=output_path,
-                target_lufs=-18.0,
-                true_peak=-1.0,
-            )
-            logger.info(f"  ✅ Ingested successfully (asset_id={result['id']})")
-            success_count += 1
+            asset_id = extract_metadata(file_path).sha256_id
+        except ValueError:
+            asset_id = None  # Let ingest_audio_file report it
+        if asset_id is not None and asset_id in seen_ids:
+            logger.info(f"  ⏭️  Same content as {seen_ids[asset_id].name}")
+            skip_count += 1
+            continue
+        if asset_id is not None:
+            seen_ids[asset_id] = file_path
+        to_ingest.append(file_path)
+
+    if not to_ingest:
+        return success_count, skip_count, error_count
+
+    output_path = config.paths.bumpers_path if kind == "bumper" else config.paths.breaks_path
+
+    def ingest(file_path: Path) -> dict:
+        return ingest_audio_file(
+            source_path=file_path,
+            kind=kind,
+            db_path=config.paths.db_path,
+            output_dir=output_path,
+            target_lufs=-18.0,
+            true_peak=-1.0,
+        )
 
-        except Exception as e:
-            logger.error(f"  ❌ Failed to ingest: {e}")
-            error_count += 1
+    # Each ingest spends its time in an ffmpeg child process, so threads are
+    # enough to overlap the encodes
+    with ThreadPoolExecutor(max_workers=min(workers, len(to_ingest))) as executor:
+        futures = {executor.submit(ingest, file_path): file_path for file_path in to_ingest}
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                result = future.result()
+                logger.info(f"  ✅ Ingested {file_path.name} (asset_id={result['id']})")
+                success_count += 1
+            except Exception as e:
+                logger.error(f"  ❌ Failed to ingest {file_path.name}: {e}")
+                error_count += 1
 
     return success_count, skip_count, error_count
 
@@ -160,8 +192,16 @@ def main():
         action="store_true",
         help="Re-ingest files even if already in database",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Files to normalize concurrently; lower it on slow disks (default: CPU count)",
+    )
 
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     total_success = 0
     total_skip = 0
@@ -180,6 +220,7 @@ def main():
             kind="bumper",
             dry_run=args.dry_run,
             skip_existing=not args.force,
+            workers=args.workers,
         )
         total_success += success
         total_skip += skip
@@ -195,6 +236,7 @@ def main():
             kind="break",
             dry_run=args.dry_run,
             skip_existing=not args.force,
+            workers=args.workers,
         )
         total_success += success
         total_skip += skip
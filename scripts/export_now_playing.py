@@ -671,40 +671,50 @@ def get_current_playing() -> tuple[dict | None, dict | None]:
     return current, stream_info
 
 
+def build_now_playing_state() -> dict:
+    """Build the full now-playing state pushed to SSE clients.
+
+    Returns:
+        Dict with current track, stream info, both queues and recent history
+    """
+    # FAST PATH: Only get essential data to minimize latency
+    # Get current track from database (fast)
+    current, stream_info = get_current_playing()
+
+    # Get recent plays for history (fast database query)
+    history = get_recent_plays(16)  # Get 16 to ensure we have 15 after filtering
+
+    # If we have a current track, filter it out of history
+    if current and current.get("asset_id"):
+        history = [h for h in history if h.get("asset_id") != current["asset_id"]]
+
+    # Limit history to 15 items
+    history = history[:15]
+
+    # Get both queues separately to expose queue structure to frontend
+    queues = get_both_queues(breaks_limit=3, music_limit=5)
+
+    # Build output with stream info and both queues
+    return {
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "system_status": "online",
+        "crossfade": {
+            "music_sec": 4.0,    # Music tracks: 4s crossfade (2s fade-out + 2s fade-in)
+            "breaks_sec": 0.0    # Breaks/station IDs: hard cut, no crossfade
+        },
+        "stream": stream_info if stream_info else {},
+        "current": current,
+        "breaks_queue": queues["breaks_queue"],
+        "music_queue": queues["music_queue"],
+        "history": history
+    }
+
+
 def export_now_playing():
     """Export current stream status to JSON file with atomic write."""
     try:
-        # FAST PATH: Only get essential data to minimize latency
-        # Get current track from database (fast)
-        current, stream_info = get_current_playing()
-
-        # Get recent plays for history (fast database query)
-        history = get_recent_plays(16)  # Get 16 to ensure we have 15 after filtering
-
-        # If we have a current track, filter it out of history
-        if current and current.get("asset_id"):
-            history = [h for h in history if h.get("asset_id") != current["asset_id"]]
-
-        # Limit history to 15 items
-        history = history[:15]
-
-        # Get both queues separately to expose queue structure to frontend
-        queues = get_both_queues(breaks_limit=3, music_limit=5)
-
-        # Build output with stream info and both queues
-        output = {
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "system_status": "online",
-            "crossfade": {
-                "music_sec": 4.0,    # Music tracks: 4s crossfade (2s fade-out + 2s fade-in)
-                "breaks_sec": 0.0    # Breaks/station IDs: hard cut, no crossfade
-            },
-            "stream": stream_info if stream_info else {},
-            "current": current,
-            "breaks_queue": queues["breaks_queue"],
-            "music_queue": queues["music_queue"],
-            "history": history
-        }
+        output = build_now_playing_state()
+        current = output["current"]
 
         logger.info(f"Broadcasting state: current={current['title'] if current else 'None'}")
 
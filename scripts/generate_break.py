@@ -14,7 +14,7 @@ Usage:
     ./scripts/generate_break.py
 
 Exit codes:
-    0: Break generated successfully
+    0: Break generated successfully (or skipped: another run in progress)
     1: Break generation failed
 """
 
@@ -25,7 +25,7 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from ai_radio.break_generator import generate_break
+from ai_radio.break_generator import BreakGenerationInProgress, generate_break
 from ai_radio.config import config
 from ai_radio.ingest import ingest_audio_file
 
@@ -45,12 +45,17 @@ def main() -> int:
     """Generate radio break and return exit code.
 
     Returns:
-        0 if successful, 1 if failed
+        0 if successful or skipped because a run is in progress, 1 if failed
     """
     logger.info("Starting break generation service")
 
     try:
-        result = generate_break()
+        try:
+            result = generate_break()
+        except BreakGenerationInProgress:
+            # Overlapping timer run, not a failure: don't trip systemd alerting
+            logger.info("Break generation already in progress, skipping")
+            return 0
 
         if result:
             logger.info(
@@ -60,7 +65,15 @@ def main() -> int:
                 f"news={result.includes_news})"
             )
 
-            # Auto-ingest break immediately
+            # Auto-ingest break immediately, reusing the mix's loudness
+            # measurements instead of decoding the break again
+            loudness_stats = None
+            if result.loudness_lufs is not None and result.true_peak_dbtp is not None:
+                loudness_stats = {
+                    "loudness_lufs": result.loudness_lufs,
+                    "true_peak_dbtp": result.true_peak_dbtp,
+                }
+
             try:
                 logger.info("📥 Auto-ingesting break into assets table...")
                 ingest_audio_file(
@@ -68,6 +81,7 @@ def main() -> int:
                     kind="break",
                     db_path=config.paths.db_path,
                     ingest_existing=True,
+                    loudness_stats=loudness_stats,
                 )
                 logger.info("✅ Break ingested successfully")
             except Exception as e:
@@ -24,6 +24,7 @@ Run after each break generation (ExecStartPost) or via cron.
 
 import json
 import logging
+import os
 import re
 import sys
 from datetime import datetime, timedelta, timezone
@@ -63,22 +64,22 @@ def generate_index() -> bool:
     cutoff = datetime.now() - timedelta(hours=LOOKBACK_HOURS)
     entries = []
 
-    for path in breaks_dir.glob("break_*.mp3"):
-        if path.is_symlink():
-            continue
-
-        ts = parse_break_timestamp(path.name)
-        if ts is None or ts < cutoff:
-            continue
-
-        entries.append(
-            {
-                "filename": path.name,
-                "timestamp": ts.isoformat(),
-                "url": f"/api/breaks/{path.name}",
-                "size_bytes": path.stat().st_size,
-            }
-        )
+    # One directory pass: DirEntry.is_symlink() comes from the readdir
+    # entry type, so only matching breaks cost a stat (for their size)
+    with os.scandir(breaks_dir) as it:
+        for entry in it:
+            ts = parse_break_timestamp(entry.name)
+            if ts is None or ts < cutoff or entry.is_symlink():
+                continue
+
+            entries.append(
+                {
+                    "filename": entry.name,
+                    "timestamp": ts.isoformat(),
+                    "url": f"/api/breaks/{entry.name}",
+                    "size_bytes": entry.stat(follow_symlinks=False).st_size,
+                }
+            )
 
     # Most recent first
     entries.sort(key=lambda e: e["timestamp"], reverse=True)
@@ -8,15 +8,18 @@ No file I/O - full state is sent directly via HTTP.
 import asyncio
 import json
 import logging
+import os
 import signal
+import socket
 import sys
 from pathlib import Path
 from typing import Set, Optional
 
 from aiohttp import web
 
-# Add src to path for imports
+# Add src and scripts to path for imports (once, at startup)
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
 
 from ai_radio.config import config
 
@@ -31,7 +34,26 @@ logger = logging.getLogger(__name__)
 clients: Set[web.StreamResponse] = set()
 
 # Last broadcasted state (sent to new clients immediately)
-last_state: Optional[str] = None
+last_state: Optional[dict] = None
+
+# Last broadcasted SSE frame, already minified and encoded for the wire
+last_message: Optional[bytes] = None
+
+# Pre-encoded keepalive comment frame (same bytes for every client)
+KEEPALIVE_FRAME = b": keepalive\n\n"
+
+# Coalesce bursts of /notify POSTs: only the latest state is broadcast
+BROADCAST_DEBOUNCE_SEC = 0.05
+pending_state: Optional[dict] = None
+broadcast_handle: Optional[asyncio.TimerHandle] = None
+broadcast_tasks: Set[asyncio.Task] = set()
+
+
+def encode_sse_frame(state: dict) -> bytes:
+    """Serialize parsed state as minified JSON wrapped in an SSE data frame."""
+    # Minify JSON (no newlines) for SSE compatibility
+    data_str = json.dumps(state, separators=(',', ':'))
+    return f"data: {data_str}\n\n".encode()
 
 
 async def sse_handler(request: web.Request) -> web.StreamResponse:
@@ -72,18 +94,18 @@ async def sse_handler(request: web.Request) -> web.StreamResponse:
     logger.info(f"Client connected. Total clients: {len(clients)}")
 
     try:
-        # Send current state immediately if we have it
-        global last_state
-        if last_state:
-            # Minify JSON (remove newlines) for SSE compatibility
-            data_compact = json.loads(last_state)
-            data_str = json.dumps(data_compact, separators=(',', ':'))
-            await response.write(f"data: {data_str}\n\n".encode())
+        # Send current state immediately if we have it (frame is pre-encoded,
+        # so a new client costs one write rather than a JSON round trip)
+        global last_message
+        if last_message is None and last_state:
+            last_message = encode_sse_frame(last_state)
+        if last_message:
+            await response.write(last_message)
 
         # Keep connection alive with periodic pings
         while True:
             await asyncio.sleep(30)  # Send keepalive every 30 seconds
-            await response.write(": keepalive\n\n".encode())
+            await response.write(KEEPALIVE_FRAME)
 
     except (ConnectionResetError, asyncio.CancelledError):
         pass
@@ -94,19 +116,23 @@ async def sse_handler(request: web.Request) -> web.StreamResponse:
     return response
 
 
-async def broadcast_update(data: str):
-    """Broadcast update to all connected clients and store as last_state."""
-    global last_state
+async def broadcast_update(state: dict):
+    """Broadcast update to all connected clients and store as last_state.
+
+    Args:
+        state: Already-parsed state payload (parsed once in notify_handler)
+    """
+    global last_state, last_message
 
     # Store this as the last state for new clients
-    last_state = data
+    last_state = state
+    last_message = None
 
     if not clients:
         return
 
     # Log summary of what we're broadcasting
     try:
-        state = json.loads(data)
         current_title = state.get('current', {}).get('title', 'None') if state.get('current') else 'None'
         next_title = state.get('next', {}).get('title', 'None') if state.get('next') else 'None'
         history_count = len(state.get('history', []))
@@ -115,10 +141,9 @@ async def broadcast_update(data: str):
     except:
         logger.info(f"Broadcasting update to {len(clients)} clients")
 
-    # Minify JSON (remove newlines) for SSE compatibility
-    data_compact = json.loads(data)
-    data_str = json.dumps(data_compact, separators=(',', ':'))
-    message = f"data: {data_str}\n\n".encode()
+    # Encode once, then every client write reuses the same bytes
+    message = encode_sse_frame(state)
+    last_message = message
 
     # Send to all clients, remove disconnected ones
     disconnected = set()
@@ -134,6 +159,35 @@ async def broadcast_update(data: str):
         clients.discard(client)
 
 
+def schedule_broadcast(state: dict) -> None:
+    """Queue state for broadcast, coalescing updates within the debounce window.
+
+    Only the latest state matters to SSE consumers, so N rapid updates
+    collapse into a single fanout to every client.
+    """
+    global pending_state, broadcast_handle
+
+    pending_state = state
+    if broadcast_handle is None:
+        loop = asyncio.get_running_loop()
+        broadcast_handle = loop.call_later(BROADCAST_DEBOUNCE_SEC, _flush_pending_broadcast)
+
+
+def _flush_pending_broadcast() -> None:
+    """Timer callback: broadcast the most recent pending state."""
+    global pending_state, broadcast_handle
+
+    broadcast_handle = None
+    state, pending_state = pending_state, None
+    if state is None:
+        return
+
+    # Hold a reference so the task isn't garbage collected mid-flight
+    task = asyncio.create_task(broadcast_update(state))
+    broadcast_tasks.add(task)
+    task.add_done_callback(broadcast_tasks.discard)
+
+
 async def notify_handler(request: web.Request) -> web.Response:
     """HTTP POST endpoint for receiving full state updates.
 
@@ -141,20 +195,20 @@ async def notify_handler(request: web.Request) -> web.Response:
     directly to SSE clients. No file I/O needed.
     """
     try:
-        # Get JSON payload from request body
-        data = await request.text()
+        # Get JSON payload from request body (raw bytes; json.loads decodes UTF-8)
+        data = await request.read()
 
         if not data:
             return web.Response(text="Empty payload", status=400)
 
-        # Validate it's valid JSON
+        # Parse once: validates the payload and is reused for the broadcast
         try:
-            json.loads(data)
-        except json.JSONDecodeError:
+            state = json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError):
             return web.Response(text="Invalid JSON", status=400)
 
-        # Broadcast to all connected clients
-        await broadcast_update(data)
+        # Broadcast to all connected clients (debounced)
+        schedule_broadcast(state)
         return web.Response(text="OK")
 
     except Exception as e:
@@ -166,42 +220,156 @@ async def fetch_initial_state():
     """Fetch initial state after server starts."""
     global last_state
     try:
-        # Import the functions we need from export_now_playing
-        sys.path.insert(0, str(Path(__file__).parent))
-        from export_now_playing import get_current_playing, get_recent_plays, get_both_queues
-        from datetime import datetime, timezone
+        # Import the state builder from export_now_playing
+        from export_now_playing import build_now_playing_state
 
         logger.info("Fetching initial state...")
 
         # Build state directly without POSTing to ourselves
-        current, stream_info = get_current_playing()
-        history = get_recent_plays(16)
-        if current and current.get("asset_id"):
-            history = [h for h in history if h.get("asset_id") != current["asset_id"]]
-        history = history[:15]
-        queues = get_both_queues(breaks_limit=3, music_limit=5)
-
-        output = {
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "system_status": "online",
-            "crossfade": {
-                "music_sec": 4.0,    # Music tracks: 4s crossfade (2s fade-out + 2s fade-in)
-                "breaks_sec": 0.0    # Breaks/station IDs: hard cut, no crossfade
-            },
-            "stream": stream_info if stream_info else {},
-            "current": current,
-            "breaks_queue": queues["breaks_queue"],
-            "music_queue": queues["music_queue"],
-            "history": history
-        }
+        output = build_now_playing_state()
+        current = output["current"]
 
         # Store as last_state directly
-        last_state = json.dumps(output)
+        last_state = output
         logger.info(f"Initial state loaded: current={current['title'] if current else 'None'}")
     except Exception as e:
         logger.warning(f"Could not fetch initial state: {e}")
 
 
+class ExportTriggerProtocol(asyncio.DatagramProtocol):
+    """Receives export triggers from record_play.py on a Unix datagram socket.
+
+    Replaces the in-process export + HTTP POST on Liquidsoap's callback path
+    with a single sendto(); the daemon rebuilds and broadcasts the state.
+    """
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        request_export()
+
+
+# Export coalescing: triggers that arrive mid-export cause exactly one rerun
+export_running = False
+export_requested = False
+export_tasks: Set[asyncio.Task] = set()
+
+# Bound trigger socket (None when not listening)
+export_transport: Optional[asyncio.DatagramTransport] = None
+
+# Kill switch: after this many consecutive failed exports the socket is
+# closed (record_play.py then exports in-process) and re-bound after a delay
+EXPORT_FAILURE_LIMIT = 3
+EXPORT_REBIND_DELAY_SEC = 60.0
+export_failures = 0
+export_rebind_handle: Optional[asyncio.TimerHandle] = None
+
+
+def request_export() -> None:
+    """Rebuild now-playing state in the background and broadcast it."""
+    global export_running, export_requested
+
+    if export_running:
+        export_requested = True
+        return
+
+    export_running = True
+    task = asyncio.create_task(run_exports())
+    export_tasks.add(task)
+    task.add_done_callback(export_tasks.discard)
+
+
+async def run_exports() -> None:
+    """Build state off the event loop (DB + socket I/O) until no rerun is pending."""
+    global export_running, export_requested, export_failures
+    from export_now_playing import build_now_playing_state
+
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            export_requested = False
+            try:
+                state = await loop.run_in_executor(None, build_now_playing_state)
+                export_failures = 0
+                schedule_broadcast(state)
+            except Exception as e:
+                # Transient errors (database is locked, a slow Liquidsoap or
+                # Icecast query) are logged and the next trigger retries
+                export_failures += 1
+                logger.error(f"Triggered export failed ({export_failures} in a row): {e}")
+                if export_failures >= EXPORT_FAILURE_LIMIT:
+                    # A datagram can't report failure back to record_play.py,
+                    # so a persistently broken export (e.g. the DB not writable
+                    # for WAL) would silently stop updates. Stop listening for
+                    # a while instead: sendto() then fails and record_play.py
+                    # falls back to exporting in-process.
+                    disable_export_listener()
+                    break
+            if not export_requested:
+                break
+    finally:
+        export_running = False
+
+
+async def start_export_listener(app: Optional[web.Application]) -> None:
+    """Bind the export trigger socket."""
+    global export_transport
+    sock_path = config.paths.export_sock_path
+    try:
+        sock_path.unlink(missing_ok=True)
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            ExportTriggerProtocol,
+            local_addr=str(sock_path),
+            family=socket.AF_UNIX,
+        )
+        os.chmod(sock_path, 0o660)
+        export_transport = transport
+        logger.info(f"Listening for export triggers on {sock_path}")
+    except OSError as e:
+        # record_play.py falls back to exporting in-process
+        logger.warning(f"Could not bind export trigger socket {sock_path}: {e}")
+
+
+def close_export_listener() -> None:
+    """Close and remove the export trigger socket."""
+    global export_transport
+    if export_transport is not None:
+        export_transport.close()
+        export_transport = None
+        config.paths.export_sock_path.unlink(missing_ok=True)
+
+
+def disable_export_listener() -> None:
+    """Close the trigger socket and re-bind it after EXPORT_REBIND_DELAY_SEC."""
+    global export_failures, export_rebind_handle
+    logger.error(
+        f"Disabling export socket for {EXPORT_REBIND_DELAY_SEC:.0f}s; "
+        "record_play.py will export in-process"
+    )
+    close_export_listener()
+    export_failures = 0
+
+    loop = asyncio.get_running_loop()
+    export_rebind_handle = loop.call_later(EXPORT_REBIND_DELAY_SEC, _rebind_export_listener)
+
+
+def _rebind_export_listener() -> None:
+    """Timer callback: bind the trigger socket again."""
+    global export_rebind_handle
+    export_rebind_handle = None
+    task = asyncio.create_task(start_export_listener(None))
+    export_tasks.add(task)
+    task.add_done_callback(export_tasks.discard)
+
+
+async def stop_export_listener(app: web.Application) -> None:
+    """Close the export trigger socket on shutdown."""
+    global export_rebind_handle
+    if export_rebind_handle is not None:
+        export_rebind_handle.cancel()
+        export_rebind_handle = None
+    close_export_listener()
+
+
 async def init_app() -> web.Application:
     """Initialize the web application."""
     app = web.Application()
@@ -211,6 +379,8 @@ async def init_app() -> web.Application:
 
     # Schedule initial state fetch after server starts
     app.on_startup.append(lambda app: asyncio.create_task(fetch_initial_state()))
+    app.on_startup.append(start_export_listener)
+    app.on_cleanup.append(stop_export_listener)
 
     return app
 
@@ -243,7 +413,11 @@ async def shutdown(app: web.Application):
 
 async def cleanup(app: web.Application):
     """Final cleanup after shutdown."""
+    global broadcast_handle
     logger.info("Cleaning up...")
+    if broadcast_handle is not None:
+        broadcast_handle.cancel()
+        broadcast_handle = None
     clients.clear()
 
 
@@ -5,16 +5,18 @@ Picks a random existing station ID file and queues it to play at the next
 track boundary at :15, :30, and :45 minutes past each hour.
 """
 import logging
+import os
 import random
+import re
 import sqlite3
 import sys
 from datetime import datetime
 from pathlib import Path
-from zoneinfo import ZoneInfo
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from ai_radio.config import config
+from ai_radio.db import connect, transaction
 from ai_radio.liquidsoap_client import LiquidsoapClient
 
 logging.basicConfig(
@@ -24,34 +26,63 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 STATION_ID_TIMES = [15, 30, 45]  # Minutes when station IDs should play
+STATE_KEY = "station_id_scheduled"
+
+# Resolved once at import; every timestamp in this script uses station time
+STATION_TZ = config.station.station_zone
+
+# Station ID bumper filenames: station_id_*.wav / station_id_*.mp3
+STATION_ID_FILE_RE = re.compile(r"station_id_.*\.(?:wav|mp3)\Z")
+
+# SQL kept as module constants so sqlite3's per-connection statement cache
+# (keyed on the SQL text) reuses the compiled statement
+# Claim a slot atomically: the upsert only writes (and only RETURNs a row)
+# when the stored "hour:target" differs, so exactly one concurrent run wins
+_SQL_CLAIM_STATE = """
+    INSERT INTO scheduler_state (key, value, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at
+    WHERE scheduler_state.value != excluded.value
+    RETURNING key
+"""
+_SQL_RELEASE_STATE = "DELETE FROM scheduler_state WHERE key = ? AND value = ?"
+# Ingested station IDs are bumper assets named station_id_*
+_SQL_RANDOM_STATION_ID = """
+    SELECT path FROM assets
+    WHERE kind = 'bumper' AND path GLOB '*/station_id_*'
+    ORDER BY RANDOM() LIMIT 1
+"""
+
 
+def claim_scheduler_state(conn: sqlite3.Connection, key: str, value: str) -> bool:
+    """Atomically record a scheduler slot unless it is already recorded.
+
+    Args:
+        conn: Database connection
+        key: State key
+        value: Slot identifier (e.g. "hour:target")
 
-def get_scheduler_state(conn: sqlite3.Connection, key: str) -> str | None:
-    """Get scheduler state from database."""
-    cursor = conn.cursor()
-    cursor.execute("SELECT value FROM scheduler_state WHERE key = ?", (key,))
-    row = cursor.fetchone()
-    return row[0] if row else None
+    Returns:
+        True if this call claimed the slot, False if it was already claimed
+    """
+    now = datetime.now(STATION_TZ).isoformat()
+    with transaction(conn):
+        claimed = conn.execute(_SQL_CLAIM_STATE, (key, value, now)).fetchall()
+    return bool(claimed)
 
 
-def set_scheduler_state(conn: sqlite3.Connection, key: str, value: str) -> None:
-    """Set scheduler state in database."""
-    cursor = conn.cursor()
-    now = datetime.now(ZoneInfo(config.station_tz)).isoformat()
-    cursor.execute(
-        """INSERT INTO scheduler_state (key, value, updated_at)
-           VALUES (?, ?, ?)
-           ON CONFLICT(key) DO UPDATE SET value=?, updated_at=?""",
-        (key, value, now, value, now)
-    )
-    conn.commit()
+def release_scheduler_state(conn: sqlite3.Connection, key: str, value: str) -> None:
+    """Drop a claimed slot so a later run can retry it."""
+    with transaction(conn):
+        conn.execute(_SQL_RELEASE_STATE, (key, value))
 
 
 def should_schedule_station_id(conn: sqlite3.Connection) -> tuple[bool, int | None]:
     """Check if we should schedule a station ID now.
 
     Schedules during the minute before target time (e.g., during minute :14 for :15 target).
-    Uses database state to prevent duplicate scheduling across hour boundaries.
+    Claims the "hour:target" slot in scheduler_state with a single conditional
+    upsert, so overlapping runs can't both schedule the same station ID.
 
     Args:
         conn: Database connection
@@ -59,7 +90,7 @@ def should_schedule_station_id(conn: sqlite3.Connection) -> tuple[bool, int | No
     Returns:
         (should_schedule, target_minute): Whether to schedule and which minute target
     """
-    now = datetime.now(ZoneInfo(config.station_tz))
+    now = datetime.now(STATION_TZ)
     current_minute = now.minute
     current_hour = now.hour
 
@@ -68,18 +99,10 @@ def should_schedule_station_id(conn: sqlite3.Connection) -> tuple[bool, int | No
         schedule_minute = target - 1  # One minute before target
 
         if current_minute == schedule_minute:
-            # Check if we already scheduled for this target in this hour
-            state_key = f"station_id_scheduled"
-            state_value = get_scheduler_state(conn, state_key)
-
-            if state_value:
-                try:
-                    last_hour, last_target = state_value.split(":")
-                    if int(last_hour) == current_hour and int(last_target) == target:
-                        logger.info(f"Station ID already scheduled for {current_hour:02d}:{target:02d}")
-                        return False, None
-                except ValueError:
-                    pass  # Corrupt state, proceed to schedule
+            # Claim this target for this hour (format: "hour:target")
+            if not claim_scheduler_state(conn, STATE_KEY, f"{current_hour}:{target}"):
+                logger.info(f"Station ID already scheduled for {current_hour:02d}:{target:02d}")
+                return False, None
 
             logger.info(f"Scheduling station ID for :{target:02d}")
             return True, target
@@ -87,36 +110,57 @@ def should_schedule_station_id(conn: sqlite3.Connection) -> tuple[bool, int | No
     return False, None
 
 
-def get_random_station_id() -> Path | None:
-    """Pick a random station ID file from the bumpers directory.
+def get_random_station_id(conn: sqlite3.Connection | None = None) -> Path | None:
+    """Pick a random station ID file.
+
+    Uses the ingested bumper assets as a manifest (one indexed query on the
+    already-open connection); only scans the bumpers directory when the
+    database has no usable station IDs.
+
+    Args:
+        conn: Database connection (optional; skips the manifest lookup if None)
 
     Returns:
         Path to random station ID file, or None if no files found
     """
+    if conn is not None:
+        row = conn.execute(_SQL_RANDOM_STATION_ID).fetchone()
+        if row and Path(row[0]).exists():
+            return Path(row[0])
+        logger.warning("No ingested station IDs found, scanning bumpers directory")
+
     bumpers_path = config.paths.base_path / "assets" / "bumpers"
 
     if not bumpers_path.exists():
         logger.error(f"Bumpers directory not found: {bumpers_path}")
         return None
 
-    # Get all station ID files (both .wav and .mp3)
-    station_ids = list(bumpers_path.glob("station_id_*.wav")) + list(bumpers_path.glob("station_id_*.mp3"))
-
-    if not station_ids:
+    # Pick uniformly among station ID files (.wav and .mp3) in one directory
+    # pass with reservoir sampling (k=1), without building the full list
+    selected = None
+    seen = 0
+    with os.scandir(bumpers_path) as entries:
+        for entry in entries:
+            if STATION_ID_FILE_RE.match(entry.name):
+                seen += 1
+                if random.randrange(seen) == 0:
+                    selected = entry.path
+
+    if selected is None:
         logger.error(f"No station ID files found in {bumpers_path}")
         return None
 
-    # Pick a random one
-    selected = random.choice(station_ids)
-    return selected
+    return Path(selected)
 
 
 def main():
     """Entry point"""
     conn = None
+    claimed_slot = None
+    queued = False
     try:
         # Connect to database
-        conn = sqlite3.connect(config.paths.db_path)
+        conn = connect(config.paths.db_path)
 
         # Check if we should schedule
         should_schedule, target_minute = should_schedule_station_id(conn)
@@ -125,8 +169,10 @@ def main():
             logger.info("No station ID scheduling needed at this time")
             sys.exit(0)
 
+        claimed_slot = f"{datetime.now(STATION_TZ).hour}:{target_minute}"
+
         # Pick a random station ID file
-        station_id_file = get_random_station_id()
+        station_id_file = get_random_station_id(conn)
 
         if not station_id_file:
             logger.error("Failed to find station ID file")
@@ -138,12 +184,8 @@ def main():
         client = LiquidsoapClient()
 
         if client.push_track("breaks", str(station_id_file)):
+            queued = True
             logger.info(f"Queued station ID: {station_id_file.name}")
-
-            # Record that we scheduled for this target in this hour (format: "hour:target")
-            now = datetime.now(ZoneInfo(config.station_tz))
-            set_scheduler_state(conn, "station_id_scheduled", f"{now.hour}:{target_minute}")
-
             sys.exit(0)
         else:
             logger.error("Failed to queue station ID")
@@ -154,6 +196,12 @@ def main():
         sys.exit(1)
     finally:
         if conn:
+            # Nothing was queued for the claimed slot: free it for the next run
+            if claimed_slot and not queued:
+                try:
+                    release_scheduler_state(conn, STATE_KEY, claimed_slot)
+                except Exception as e:
+                    logger.error(f"Failed to release slot {claimed_slot}: {e}")
             conn.close()
 
 
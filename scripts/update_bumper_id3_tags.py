@@ -12,6 +12,8 @@ Usage:
 import logging
 import sqlite3
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 # Add src to path for imports
@@ -31,6 +33,50 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Concurrent tag writers (bounded by disk concurrency, not CPU)
+MAX_WORKERS = 8
+
+
+def _update_one(bumper: tuple[str, str, str], artist_frame: TPE1) -> bool:
+    """Write title/artist ID3 tags to a single bumper file.
+
+    Args:
+        bumper: (asset_id, path, title) row from the assets table
+        artist_frame: Shared TPE1 frame (the artist is the same for every file)
+
+    Returns:
+        True if the file was updated
+    """
+    asset_id, path, title = bumper
+    file_path = Path(path)
+
+    if not file_path.exists():
+        logger.warning(f"File not found: {path}")
+        return False
+
+    try:
+        # Load MP3 file
+        audio = MP3(file_path, ID3=ID3)
+
+        # Ensure ID3 tag exists
+        if audio.tags is None:
+            audio.add_tags()
+
+        # Set title and artist
+        audio.tags["TIT2"] = TIT2(encoding=3, text=title)
+        audio.tags["TPE1"] = artist_frame
+
+        # Save changes
+        audio.save()
+
+        logger.info(f"Updated: {title} ({file_path.name})")
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to update {path}: {e}")
+        return False
+
+
 def update_bumper_id3_tags() -> int:
     """Update ID3 tags on all bumper files.
 
@@ -55,38 +101,16 @@ def update_bumper_id3_tags() -> int:
 
     logger.info(f"Found {len(bumpers)} bumpers to update")
 
-    updated_count = 0
-    error_count = 0
-
-    for asset_id, path, title in bumpers:
-        file_path = Path(path)
-
-        if not file_path.exists():
-            logger.warning(f"File not found: {path}")
-            error_count += 1
-            continue
-
-        try:
-            # Load MP3 file
-            audio = MP3(file_path, ID3=ID3)
-
-            # Ensure ID3 tag exists
-            if audio.tags is None:
-                audio.add_tags()
-
-            # Set title and artist
-            audio.tags["TIT2"] = TIT2(encoding=3, text=title)
-            audio.tags["TPE1"] = TPE1(encoding=3, text=config.music_artist)
-
-            # Save changes
-            audio.save()
+    # Artist is constant: build its frame once (mutagen serializes on save,
+    # so one read-only frame can be shared across files and threads)
+    update_one = partial(_update_one, artist_frame=TPE1(encoding=3, text=config.music_artist))
 
-            logger.info(f"Updated: {title} ({file_path.name})")
-            updated_count += 1
+    # Tag writes are independent file I/O: run them in parallel
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(update_one, bumpers))
 
-        except Exception as e:
-            logger.error(f"Failed to update {path}: {e}")
-            error_count += 1
+    updated_count = sum(results)
+    error_count = len(results) - updated_count
 
     logger.info(f"✅ Updated {updated_count} files")
     if error_count > 0:
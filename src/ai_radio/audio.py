@@ -1,10 +1,17 @@
 """Audio processing utilities for asset management."""
 
+import atexit
 import hashlib
 import json
+import logging
+import math
+import mmap
 import re
+import os
 import subprocess
+import threading
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +19,21 @@ from mutagen import File as MutagenFile
 
 from ai_radio.config import config
 
+logger = logging.getLogger(__name__)
+
+# Files at or above this size are hashed through mmap; smaller files are
+# read in one call (mapping has a fixed setup cost that isn't worth it)
+MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+# Loudness stats as printed by ffmpeg-normalize --print-stats ("output_i": -18.0)
+# and by ffmpeg loudnorm print_format=json ("output_i" : "-18.00")
+_STATS_RE = re.compile(
+    r'"(input_i|input_tp|output_i|output_tp)"\s*:\s*"?(-?(?:\d+(?:\.\d*)?|inf))'
+)
+
+# Bytes read from each end of a file for its content fingerprint
+FINGERPRINT_BYTES = 4096
+
 
 @dataclass
 class AudioMetadata:
@@ -32,16 +54,156 @@ class AudioMetadata:
         if self.album is None:
             self.album = "Unknown Album"
 
-    @property
+    @cached_property
     def sha256_id(self) -> str:
-        """Generate SHA256 hash of file contents for asset ID."""
-        hasher = hashlib.sha256()
-        with open(self.path, "rb") as f:
-            # Read in chunks for large files
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
+        """Generate SHA256 hash of file contents for asset ID.
+
+        The algorithm is part of the asset ID contract (play_history and
+        migrate_to_sha256_ids.py key on it), so it must stay SHA256.
+        Computed once per instance; re-scans of an unchanged file (same
+        size and mtime) are served from the module-level digest cache.
+        """
+        st = self.path.stat()
+        return _hash_path(str(self.path), st.st_size, st.st_mtime_ns)
+
+
+class _HashCache:
+    """Persistent fingerprint -> SHA256 map, stored as JSON in the state dir.
+
+    Lets library re-scans skip the full-file hash for files whose size,
+    mtime and first/last FINGERPRINT_BYTES are unchanged. Loaded lazily on
+    first use; new entries are written back every FLUSH_EVERY misses and at
+    interpreter exit. It's only a cache: unreadable or corrupt files are
+    ignored, and nothing is written if the state directory doesn't exist.
+
+    Entries for deleted, moved or re-encoded files are never looked up
+    again, so the map is an LRU capped at MAX_ENTRIES (dict order, least
+    recently used first): stale fingerprints age out, and the file (and the
+    rewrite on each flush) stays under ~8 MB.
+    """
+
+    FLUSH_EVERY = 256
+    MAX_ENTRIES = 65536
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: Optional[dict[str, str]] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, str]:
+        if self._entries is None:
+            try:
+                entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                entries = {}
+            if not isinstance(entries, dict):
+                entries = {}
+            if len(entries) > self.MAX_ENTRIES:
+                entries = dict(list(entries.items())[-self.MAX_ENTRIES:])
+            self._entries = entries
+        return self._entries
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        with self._lock:
+            entries = self._load()
+            digest = entries.pop(fingerprint, None)
+            if digest is not None:
+                entries[fingerprint] = digest  # Now most recently used
+            return digest
+
+    def put(self, fingerprint: str, digest: str) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[fingerprint] = digest
+            if len(entries) > self.MAX_ENTRIES:
+                del entries[next(iter(entries))]
+            self._pending += 1
+            if self._pending >= self.FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending or not self.path.parent.is_dir():
+            return
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(self._entries, separators=(",", ":")))
+            os.replace(tmp, self.path)
+            self._pending = 0
+        except OSError as e:
+            logger.warning(f"Failed to write hash cache {self.path}: {e}")
+
+
+_hash_cache = _HashCache(config.paths.hash_cache_path)
+atexit.register(_hash_cache.flush)
+
+
+def _fingerprint(fd: int, size: int, mtime_ns: int) -> str:
+    """Cheap content fingerprint: size, mtime and a hash of both file ends."""
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(os.pread(fd, FINGERPRINT_BYTES, 0))
+    hasher.update(os.pread(fd, FINGERPRINT_BYTES, max(0, size - FINGERPRINT_BYTES)))
+    return f"{size}:{mtime_ns}:{hasher.hexdigest()}"
+
+
+@lru_cache(maxsize=4096)
+def _hash_path(path: str, size: int, mtime_ns: int) -> str:
+    """SHA256 of a file's contents, memoized on (path, size, mtime_ns).
+
+    size and mtime_ns are only part of the cache key, so a modified file
+    misses the cache and is re-hashed. Misses consult the persistent
+    fingerprint cache before reading the whole file.
+    """
+    with open(path, "rb") as f:
+        fingerprint = _fingerprint(f.fileno(), size, mtime_ns)
+        digest = _hash_cache.get(fingerprint)
+        if digest is None:
+            digest = _hash_file(f, size)
+            _hash_cache.put(fingerprint, digest)
+    return digest
+
+
+def _advise_sequential(fd: int, size: int) -> None:
+    """Tell the kernel the file will be read once, front to back.
+
+    Widens read-ahead and starts it early. The pages are deliberately not
+    dropped afterwards (no POSIX_FADV_DONTNEED): ingest normalizes the same
+    file right after hashing it, and ffmpeg benefits from the warm cache.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass  # Advice only; some filesystems reject it
+
+
+def _hash_file(f, size: int) -> str:
+    """SHA256 of an open binary file, read from the start."""
+    hasher = hashlib.sha256()
+    if size < MMAP_THRESHOLD:
+        hasher.update(f.read())
         return hasher.hexdigest()
 
+    _advise_sequential(f.fileno(), size)
+    try:
+        # Hash the whole mapping in one update() call
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            hasher.update(mm)
+    except (OSError, ValueError):
+        # Filesystems that can't be mapped: let hashlib drive the
+        # reads (reuses one buffer and hashes with the GIL released)
+        f.seek(0)
+        return hashlib.file_digest(f, "sha256").hexdigest()
+    return hasher.hexdigest()
+
 
 def extract_metadata(file_path: Path) -> AudioMetadata:
     """Extract metadata from audio file using mutagen.
@@ -96,13 +258,13 @@ def set_artist_metadata(file_path: Path, artist_name: Optional[str] = None) -> N
 
     Args:
         file_path: Path to audio file to modify
-        artist_name: Artist name to set (default: config.music_artist)
+        artist_name: Artist name to set (default: config.audio.music_artist)
 
     Raises:
         ValueError: If file cannot be modified
     """
     if artist_name is None:
-        artist_name = config.music_artist
+        artist_name = config.audio.music_artist
 
     if not file_path.exists():
         raise ValueError(f"File not found: {file_path}")
@@ -125,16 +287,24 @@ def normalize_audio(
     output_path: Path,
     target_lufs: float = -18.0,
     true_peak: float = -1.0,
+    two_pass: bool = False,
 ) -> dict:
-    """Normalize audio file to broadcast standards using ffmpeg-normalize.
+    """Normalize audio file to broadcast standards.
+
+    By default runs a single ffmpeg pass with the loudnorm filter (EBU R128)
+    and reads the measurements loudnorm prints as JSON. two_pass=True uses
+    ffmpeg-normalize's measure-then-apply pipeline instead (linear gain,
+    roughly twice the decode work).
 
-    After normalization, sets artist ID3 tag on output file using config.music_artist.
+    Sets the artist ID3 tag on the output to config.audio.music_artist (inline in
+    the ffmpeg pass; two_pass re-tags the file with mutagen afterwards).
 
     Args:
         input_path: Source audio file
         output_path: Destination for normalized audio
         target_lufs: Target loudness in LUFS (default: -18.0 for broadcast)
         true_peak: True peak limit in dBTP (default: -1.0)
+        two_pass: Use ffmpeg-normalize two-pass normalization
 
     Returns:
         dict with loudness_lufs and true_peak_dbtp values
@@ -148,7 +318,7 @@ def normalize_audio(
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    try:
+    if two_pass:
         # Run ffmpeg-normalize with EBU R128 standard
         # Use --print-stats to capture loudness measurements
         cmd = [
@@ -171,7 +341,31 @@ def normalize_audio(
             str(true_peak),
             "--print-stats",
         ]
+    else:
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-nostats",
+            "-y",
+            "-i",
+            str(input_path),
+            "-af",
+            f"loudnorm=I={target_lufs}:TP={true_peak}:LRA=11:print_format=json",
+            "-c:a",
+            "libmp3lame",
+            "-b:a",
+            "192k",
+            "-ar",
+            "44100",
+            # Tag the artist in the same pass (source tags are copied as-is)
+            "-metadata",
+            f"artist={config.audio.music_artist}",
+            "-id3v2_version",
+            "3",
+            str(output_path),
+        ]
 
+    try:
         result = subprocess.run(
             cmd,
             capture_output=True,
@@ -180,34 +374,22 @@ def normalize_audio(
             timeout=600,  # 10 minutes - prevents hangs on malformed files
         )
 
-        # Parse the output to extract actual OUTPUT loudness measurements
-        # ffmpeg-normalize prints JSON-like stats with --print-stats
-        # Check both stdout and stderr as output location varies
-        output_i = None
-        output_tp = None
-
-        # Combine stdout and stderr for parsing
-        combined_output = result.stdout + "\n" + result.stderr
-
-        # Find all JSON-like blocks in output
-        for line in combined_output.split("\n"):
-            # Look for output measurements in JSON format
-            if '"output_i":' in line:
-                match = re.search(r'"output_i":\s*(-?\d+\.?\d*)', line)
-                if match:
-                    output_i = float(match.group(1))
-            if '"output_tp":' in line:
-                match = re.search(r'"output_tp":\s*(-?\d+\.?\d*)', line)
-                if match:
-                    output_tp = float(match.group(1))
+        # Parse the OUTPUT loudness measurements. Both ffmpeg-normalize
+        # (--print-stats) and loudnorm (print_format=json) print JSON-like
+        # stats; check stdout and stderr as output location varies
+        stats = parse_loudness_stats(result.stdout + "\n" + result.stderr)
+        output_i = stats.get("output_i")
+        output_tp = stats.get("output_tp")
 
         # Use actual output measurements, fallback to target if parsing fails
         # (parsing might fail with older ffmpeg-normalize versions)
         loudness_lufs = output_i if output_i is not None else target_lufs
         true_peak_dbtp = output_tp if output_tp is not None else true_peak
 
-        # Set artist ID3 tag on normalized output (uses config.music_artist)
-        set_artist_metadata(output_path)
+        if two_pass:
+            # ffmpeg-normalize can't take the tag inline; set artist ID3 tag
+            # on normalized output (uses config.audio.music_artist)
+            set_artist_metadata(output_path)
 
         return {
             "loudness_lufs": loudness_lufs,
@@ -224,6 +406,23 @@ def normalize_audio(
         )
 
 
+def parse_loudness_stats(output: str) -> dict[str, float]:
+    """Extract input/output loudness stats from ffmpeg-normalize or loudnorm output.
+
+    One pass of a precompiled regex over the whole buffer; when a field
+    appears more than once the last value wins. Non-finite values (silent
+    input measures -inf) are treated as missing.
+    """
+    stats = {}
+    for key, value in _STATS_RE.findall(output):
+        number = float(value)
+        if math.isfinite(number):
+            stats[key] = number
+        else:
+            stats.pop(key, None)
+    return stats
+
+
 def measure_loudness(input_path: Path) -> dict:
     """Measure audio loudness without creating an output file.
 
@@ -262,23 +461,10 @@ def measure_loudness(input_path: Path) -> dict:
         # Parse the output to extract INPUT loudness measurements
         # ffmpeg-normalize prints JSON-like stats with --print-stats
         # Check both stdout and stderr as output location varies
-        input_i = None
-        input_tp = None
-
-        # Combine stdout and stderr for parsing
         combined_output = result.stdout + "\n" + result.stderr
-
-        # Find all JSON-like blocks in output
-        for line in combined_output.split("\n"):
-            # Look for input measurements in JSON format
-            if '"input_i":' in line:
-                match = re.search(r'"input_i":\s*(-?\d+\.?\d*)', line)
-                if match:
-                    input_i = float(match.group(1))
-            if '"input_tp":' in line:
-                match = re.search(r'"input_tp":\s*(-?\d+\.?\d*)', line)
-                if match:
-                    input_tp = float(match.group(1))
+        stats = parse_loudness_stats(combined_output)
+        input_i = stats.get("input_i")
+        input_tp = stats.get("input_tp")
 
         if input_i is None or input_tp is None:
             missing_fields = []
@@ -289,8 +475,8 @@ def measure_loudness(input_path: Path) -> dict:
 
             debug_message = (
                 "Failed to parse loudness stats from ffmpeg-normalize output. "
-                f"Regex-based parsing for fields {', '.join(missing_fields)} did not find any matches. "
-                "This may indicate that ffmpeg-normalize changed its output format.\n"
+                f"Regex-based parsing for fields {', '.join(missing_fields)} did not find any finite values. "
+                "This may indicate silent input (-inf) or that ffmpeg-normalize changed its output format.\n"
                 "Full combined stdout/stderr from ffmpeg-normalize:\n"
                 f"{combined_output}"
             )
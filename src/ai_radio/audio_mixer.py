@@ -5,17 +5,50 @@ Applies sidechain compression (ducking) to reduce bed volume during speech.
 Normalizes output to EBU R128 broadcast standard (-18 LUFS, -1.0 dBTP).
 """
 
+import glob
 import logging
+import os
 import subprocess
+import threading
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from mutagen import File as MutagenFile
+
+from .audio import parse_loudness_stats
 from .config import config
 
 logger = logging.getLogger(__name__)
 
+# Sample format of cached bed decodes (ffmpeg output/input options)
+BED_RAW_FORMAT = ("-f", "s16le", "-ar", "44100", "-ac", "2")
+
+
+@dataclass(frozen=True, slots=True)
+class _MixConfig:
+    """Mixer settings, read from config.audio once at import."""
+
+    bed_volume_db: float
+    bed_preroll_seconds: float
+    bed_fadein_seconds: float
+    bed_postroll_seconds: float
+    bed_fadeout_seconds: float
+
+
+# mix_voice_with_bed builds an AudioMixer per break; snapshotting here keeps
+# that to plain attribute copies instead of a walk through the config object
+_MIX_CONFIG = _MixConfig(
+    bed_volume_db=config.audio.bed_volume_db,
+    bed_preroll_seconds=config.audio.bed_preroll_seconds,
+    bed_fadein_seconds=config.audio.bed_fadein_seconds,
+    bed_postroll_seconds=config.audio.bed_postroll_seconds,
+    bed_fadeout_seconds=config.audio.bed_fadeout_seconds,
+)
+
 
 @dataclass
 class MixedAudio:
@@ -28,6 +61,46 @@ class MixedAudio:
     bed_file: Path  # Source bed file
     bed_volume_db: float  # Bed volume in dB
     normalized: bool  # Whether loudness normalization was applied
+    loudness_lufs: Optional[float] = None  # Measured output loudness (return_stats=True)
+    true_peak_dbtp: Optional[float] = None  # Measured output true peak (return_stats=True)
+
+
+@lru_cache(maxsize=256)
+def _probe_duration(path: str, size: int, mtime_ns: int) -> float:
+    """Read a file's duration, memoized on (path, size, mtime_ns).
+
+    Parses the audio headers in-process with mutagen; only forks ffprobe
+    for files mutagen can't read. Failures raise instead of returning None
+    so they are never cached.
+
+    Raises:
+        subprocess.SubprocessError: If ffprobe exits non-zero
+        ValueError: If ffprobe output isn't a number
+    """
+    try:
+        audio = MutagenFile(path)
+        if audio is not None and audio.info and audio.info.length:
+            return float(audio.info.length)
+    except Exception as e:
+        logger.debug(f"mutagen could not read {path}, falling back to ffprobe: {e}")
+
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            path,
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        raise subprocess.SubprocessError(f"ffprobe failed: {result.stderr}")
+
+    return float(result.stdout.strip())
 
 
 class AudioMixer:
@@ -40,48 +113,88 @@ class AudioMixer:
 
     def __init__(self):
         """Initialize audio mixer with config settings."""
-        self.bed_volume_db = config.bed_volume_db
-        self.bed_preroll_seconds = config.bed_preroll_seconds
-        self.bed_fadein_seconds = config.bed_fadein_seconds
-        self.bed_postroll_seconds = config.bed_postroll_seconds
-        self.bed_fadeout_seconds = config.bed_fadeout_seconds
+        mix_config = _MIX_CONFIG
+        self.bed_volume_db = mix_config.bed_volume_db
+        self.bed_preroll_seconds = mix_config.bed_preroll_seconds
+        self.bed_fadein_seconds = mix_config.bed_fadein_seconds
+        self.bed_postroll_seconds = mix_config.bed_postroll_seconds
+        self.bed_fadeout_seconds = mix_config.bed_fadeout_seconds
         self.target_lufs = -18.0  # EBU R128 standard
         self.true_peak_limit = -1.0  # True peak ceiling
+        # Decoded PCM copies of beds, reused across mixes
+        self.bed_cache_path = config.paths.tmp_path / "bed_cache"
 
-    def get_audio_duration(self, audio_path: Path) -> Optional[float]:
-        """Get duration of audio file in seconds using ffprobe.
+    def _ensure_bed_raw(self, bed_path: Path) -> Optional[Path]:
+        """Return a cached raw PCM decode of a bed, decoding it on first use.
+
+        Beds are a small fixed set, so decoding each once and feeding ffmpeg
+        raw samples afterwards removes the bed's MP3 decode from every mix.
+        The cache name embeds the bed's mtime, so replacing a bed invalidates
+        its entry.
 
         Args:
-            audio_path: Path to audio file
+            bed_path: Bed audio file
 
         Returns:
-            Duration in seconds, or None if unable to determine
+            Path to {stem}.{mtime_ns}.raw (BED_RAW_FORMAT), or None if the
+            decode failed and the bed should be read directly
         """
-        if not audio_path.exists():
-            logger.error(f"Audio file not found: {audio_path}")
-            return None
-
         try:
+            mtime_ns = bed_path.stat().st_mtime_ns
+            raw_path = self.bed_cache_path / f"{bed_path.stem}.{mtime_ns}.raw"
+            if raw_path.exists():
+                return raw_path
+
+            self.bed_cache_path.mkdir(parents=True, exist_ok=True)
+            # Decode to a private temp name, then rename into place, so
+            # concurrent mixes never read a half-written cache file
+            tmp_raw = raw_path.with_name(f"{raw_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
             result = subprocess.run(
-                [
-                    "ffprobe",
-                    "-v", "error",
-                    "-show_entries", "format=duration",
-                    "-of", "default=noprint_wrappers=1:nokey=1",
-                    str(audio_path),
-                ],
+                ["ffmpeg", "-y", "-v", "error", "-i", str(bed_path), *BED_RAW_FORMAT, str(tmp_raw)],
                 capture_output=True,
                 text=True,
                 check=False,
             )
-
             if result.returncode != 0:
-                logger.error(f"ffprobe failed: {result.stderr}")
+                logger.warning(f"Bed decode failed, mixing from {bed_path.name}: {result.stderr}")
+                tmp_raw.unlink(missing_ok=True)
                 return None
+            os.replace(tmp_raw, raw_path)
+
+            # Drop decodes of earlier versions of this bed ({stem}.{digits}.raw)
+            prefix_len = len(bed_path.stem) + 1
+            for stale in self.bed_cache_path.glob(f"{glob.escape(bed_path.stem)}.*.raw"):
+                if stale != raw_path and stale.name[prefix_len:-4].isdigit():
+                    stale.unlink(missing_ok=True)
+
+            logger.info(f"Cached decoded bed: {raw_path.name}")
+            return raw_path
 
-            duration = float(result.stdout.strip())
-            return duration
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"Bed cache unavailable, mixing from {bed_path.name}: {e}")
+            return None
+
+    def get_audio_duration(self, audio_path: Path) -> Optional[float]:
+        """Get duration of audio file in seconds (mutagen, falling back to ffprobe).
+
+        Results are cached per (path, size, mtime), so probing the same
+        unchanged file again (e.g. on a mix retry) doesn't spawn ffprobe.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Duration in seconds, or None if unable to determine
+        """
+        st = None
+        with suppress(FileNotFoundError):
+            st = audio_path.stat()
+        if st is None:
+            logger.error(f"Audio file not found: {audio_path}")
+            return None
 
+        try:
+            return _probe_duration(str(audio_path), st.st_size, st.st_mtime_ns)
         except (ValueError, subprocess.SubprocessError) as e:
             logger.error(f"Failed to get audio duration: {e}")
             return None
@@ -94,6 +207,7 @@ class AudioMixer:
         bed_volume_db: Optional[float] = None,
         metadata_title: Optional[str] = None,
         metadata_artist: Optional[str] = None,
+        return_stats: bool = False,
     ) -> Optional[MixedAudio]:
         """Mix voice audio with background bed using ducking.
 
@@ -105,6 +219,11 @@ class AudioMixer:
             bed_path: Path to background bed music file
             output_path: Path for mixed output file
             bed_volume_db: Bed volume in dB (default: from config)
+            metadata_title: Optional ID3 title tag
+            metadata_artist: Optional ID3 artist tag
+            return_stats: Have loudnorm print its measurements and return the
+                output loudness/true peak on MixedAudio, so callers can skip a
+                separate measurement pass over the mixed file
 
         Returns:
             MixedAudio with metadata, or None if mixing fails
@@ -147,6 +266,13 @@ class AudioMixer:
             # 6. Apply sidechain compression (ducking) using delayed voice as trigger
             # 7. Mix delayed voice and ducked bed
             # 8. Normalize to EBU R128 standard
+            #
+            # The apad is load-bearing, not wasted work: it pads the voice only
+            # up to the bed's trimmed length (nothing is computed and then
+            # discarded). sidechaincompress ends its output when either input
+            # hits EOF, so an unpadded trigger would cut the bed's post-roll
+            # and fade-out. amix would also rescale the bed once the voice
+            # input dropped out.
             # Convert total_duration to milliseconds for apad
             total_duration_ms = int(total_duration * 1000)
 
@@ -158,18 +284,23 @@ class AudioMixer:
                 f"afade=t=out:st={fadeout_start}:d={self.bed_fadeout_seconds}[bed];"
                 f"[bed][voice_for_sidechain]sidechaincompress=threshold=0.02:ratio=3:attack=5:release=200[ducked];"
                 f"[ducked][voice_for_mix]amix=inputs=2:duration=shortest[mixed];"
-                f"[mixed]loudnorm=I={self.target_lufs}:TP={self.true_peak_limit}:LRA=11[normalized]"
+                f"[mixed]loudnorm=I={self.target_lufs}:TP={self.true_peak_limit}:LRA=11"
+                f"{':print_format=json' if return_stats else ''}[normalized]"
             )
 
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
+            # Prefer the pre-decoded bed (raw PCM) over decoding the MP3 again
+            bed_raw = self._ensure_bed_raw(bed_path)
+            bed_input = [*BED_RAW_FORMAT, "-i", str(bed_raw)] if bed_raw else ["-i", str(bed_path)]
+
             # Run ffmpeg
             cmd = [
                 "ffmpeg",
                 "-y",  # Overwrite output file
                 "-i", str(voice_path),  # Input 0: voice
-                "-i", str(bed_path),  # Input 1: bed
+                *bed_input,  # Input 1: bed
                 "-filter_complex", filter_complex,
                 "-map", "[normalized]",
                 "-map_metadata", "-1",  # Strip all metadata (prevents copying bed's ID3 tags)
@@ -202,6 +333,8 @@ class AudioMixer:
 
             logger.info(f"Mixed audio saved: {output_path}")
 
+            stats = parse_loudness_stats(result.stderr) if return_stats else {}
+
             return MixedAudio(
                 file_path=output_path,
                 duration=total_duration,
@@ -210,6 +343,8 @@ class AudioMixer:
                 bed_file=bed_path,
                 bed_volume_db=bed_volume_db,
                 normalized=True,
+                loudness_lufs=stats.get("output_i"),
+                true_peak_dbtp=stats.get("output_tp"),
             )
 
         except subprocess.SubprocessError as e:
@@ -224,6 +359,7 @@ def mix_voice_with_bed(
     bed_volume_db: Optional[float] = None,
     metadata_title: Optional[str] = None,
     metadata_artist: Optional[str] = None,
+    return_stats: bool = False,
 ) -> Optional[MixedAudio]:
     """Convenience function to mix voice with background bed.
 
@@ -234,11 +370,29 @@ def mix_voice_with_bed(
         bed_volume_db: Optional bed volume override
         metadata_title: Optional ID3 title tag
         metadata_artist: Optional ID3 artist tag
+        return_stats: Return measured output loudness on MixedAudio
 
     Returns:
         MixedAudio or None if mixing fails
     """
     mixer = AudioMixer()
     return mixer.mix_with_bed(
-        voice_path, bed_path, output_path, bed_volume_db, metadata_title, metadata_artist
+        voice_path, bed_path, output_path, bed_volume_db, metadata_title, metadata_artist,
+        return_stats=return_stats,
     )
+
+
+def prepare_bed(bed_path: Path) -> Optional[Path]:
+    """Decode a bed into the mix cache ahead of time.
+
+    Lets callers warm the cache while other work (e.g. TTS) is in flight,
+    so the following mix starts from raw PCM instead of decoding the bed
+    itself. A no-op when the bed is already cached.
+
+    Args:
+        bed_path: Bed audio file
+
+    Returns:
+        Path to the cached raw PCM, or None if the bed couldn't be decoded
+    """
+    return AudioMixer()._ensure_bed_raw(bed_path)
@@ -10,14 +10,24 @@ Coordinates the full content generation pipeline:
 Implements producer pattern: only generates new breaks when needed.
 """
 
+import asyncio
+import itertools
 import logging
+import os
 import random
+import threading
+import time
+from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from .audio_mixer import mix_voice_with_bed
+import fasteners
+
+from .audio_mixer import mix_voice_with_bed, prepare_bed
+from .break_scheduler import RACY_WINDOW_NS, breaks_index
 from .config import config
 from .news import get_news
 from .script_writer import generate_bulletin
@@ -26,8 +36,20 @@ from .weather import get_weather
 
 logger = logging.getLogger(__name__)
 
+# Break title, e.g. "Mon Dec 29, 2025 4 PM News Break"; {hour}/{am_pm} are
+# filled in before strftime
+BREAK_TITLE_TEMPLATE = "%a %b %d, %Y {hour} {am_pm} News Break"
+
+# Sequence for temp voice filenames; with the pid this keeps names unique
+# across generators in one process and across concurrent processes
+_voice_counter = itertools.count()
+
 
-@dataclass
+class BreakGenerationInProgress(Exception):
+    """Raised when another process is already generating a break."""
+
+
+@dataclass(frozen=True, slots=True)
 class GeneratedBreak:
     """Generated radio break with metadata."""
 
@@ -37,6 +59,8 @@ class GeneratedBreak:
     includes_weather: bool
     includes_news: bool
     script_text: str  # Original bulletin script
+    loudness_lufs: Optional[float] = None  # Measured by the mix's loudnorm pass
+    true_peak_dbtp: Optional[float] = None
 
 
 class BreakGenerator:
@@ -53,9 +77,14 @@ class BreakGenerator:
     def __init__(self):
         """Initialize break generator with config paths."""
         self.breaks_path = config.paths.breaks_path
+        self.archive_path = config.paths.breaks_archive_path
         self.beds_path = config.paths.beds_path
         self.tmp_path = config.paths.tmp_path
-        self.freshness_minutes = config.break_freshness_minutes
+        self.freshness_minutes = config.operational.break_freshness_minutes
+        self.station_zone = config.station.station_zone
+        # (beds dir st_mtime_ns, bed filenames); rebuilt when the dir changes
+        self._bed_cache: Optional[tuple[int, tuple[str, ...]]] = None
+        self._bed_cache_lock = threading.Lock()
 
     def _select_random_bed(self) -> Optional[Path]:
         """Select random background bed file from beds directory.
@@ -63,19 +92,34 @@ class BreakGenerator:
         Returns:
             Path to selected bed file, or None if no beds available
         """
-        if not self.beds_path.exists():
+        try:
+            dir_mtime_ns = self.beds_path.stat().st_mtime_ns
+        except FileNotFoundError:
             logger.error(f"Beds directory not found: {self.beds_path}")
             return None
 
-        # Find all audio files in beds directory (MP3 or WAV)
-        bed_files = list(self.beds_path.glob("*.mp3")) + list(self.beds_path.glob("*.wav"))
-
-        if not bed_files:
+        # Adding, removing or renaming a bed bumps the directory mtime, so
+        # the listing is only re-scanned when it can have changed. A listing
+        # of a just-modified directory isn't kept: another change within the
+        # same timestamp tick would leave the mtime as is.
+        with self._bed_cache_lock:
+            if self._bed_cache is not None and self._bed_cache[0] == dir_mtime_ns:
+                bed_names = self._bed_cache[1]
+            else:
+                with os.scandir(self.beds_path) as entries:
+                    bed_names = tuple(
+                        entry.name for entry in entries
+                        if entry.name.endswith((".mp3", ".wav")) and entry.is_file()
+                    )
+                if time.time_ns() - dir_mtime_ns > RACY_WINDOW_NS:
+                    self._bed_cache = (dir_mtime_ns, bed_names)
+
+        if not bed_names:
             logger.error(f"No bed files found in {self.beds_path}")
             return None
 
-        # Select random bed
-        selected_bed = random.choice(bed_files)
+        selected_name = random.choice(bed_names)
+        selected_bed = self.beds_path / selected_name
         logger.info(f"Selected bed file: {selected_bed.name}")
 
         return selected_bed
@@ -89,43 +133,88 @@ class BreakGenerator:
         """
         try:
             # Ensure archive directory exists
-            archive_path = config.paths.breaks_archive_path
+            archive_path = self.archive_path
             archive_path.mkdir(parents=True, exist_ok=True)
 
-            # Get all breaks, sorted by creation time (newest first)
-            breaks = sorted(
-                self.breaks_path.glob("break_*.mp3"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )
-
-            # Archive older breaks beyond the keep limit
-            if len(breaks) > keep:
-                for old_break in breaks[keep:]:
-                    archive_dest = archive_path / old_break.name
-                    old_break.rename(archive_dest)
-                    logger.info(f"Archived old break: {old_break.name}")
-
-            # Clean up very old archived breaks
-            archived_breaks = sorted(
-                archive_path.glob("break_*.mp3"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )
-
-            if len(archived_breaks) > archive_keep:
-                for very_old_break in archived_breaks[archive_keep:]:
-                    very_old_break.unlink()
-                    logger.info(f"Deleted very old archived break: {very_old_break.name}")
+            # One listing per directory, taken before anything moves. Breaks
+            # beyond the keep limit are merged with the archive (a rename
+            # keeps the mtime), so the archive needn't be re-scanned and
+            # breaks that wouldn't survive in it are deleted in place
+            # instead of being renamed first.
+            overflow = breaks_index(self.breaks_path).entries()[keep:]
+            candidates = {path.name: (mtime, path) for mtime, path in breaks_index(archive_path).entries()}
+            candidates.update((path.name, (mtime, path)) for mtime, path in overflow)
+            ranked = sorted(candidates.values(), key=lambda item: item[0], reverse=True)
+
+            for rank, (_, path) in enumerate(ranked):
+                in_archive = path.parent == archive_path
+                if rank < archive_keep:
+                    if not in_archive:
+                        os.replace(path, archive_path / path.name)
+                        logger.info(f"Archived old break: {path.name}")
+                else:
+                    os.unlink(path)
+                    if in_archive:
+                        logger.info(f"Deleted very old archived break: {path.name}")
+                    else:
+                        logger.info(f"Deleted old break beyond archive limit: {path.name}")
 
         except Exception as e:
             logger.warning(f"Failed to archive old breaks: {e}")
 
+    def _housekeeping(self) -> None:
+        """Clear out old temp files and archive old breaks.
+
+        Runs alongside the data fetch rather than after the mix, so it never
+        adds to the time a break takes. The break being generated isn't
+        counted yet; at most one extra break stays active until the next run.
+        """
+        # Clean up any orphaned temp files from previous failed runs
+        cleanup_old_temp_files(max_age_minutes=60)
+        # Archive old breaks to prevent disk space exhaustion
+        self._archive_old_breaks(keep=100)
+
     def generate(self) -> Optional[GeneratedBreak]:
         """Generate complete radio break from scratch.
 
+        Blocking entry point for scripts and timers: runs generate_async()
+        on a new event loop. Call generate_async() directly from async code.
+
+        Returns:
+            GeneratedBreak with metadata, or None if generation fails
+
+        Raises:
+            BreakGenerationInProgress: If another run holds the generation lock
+        """
+        return asyncio.run(self.generate_async())
+
+    async def generate_async(self) -> Optional[GeneratedBreak]:
+        """Generate complete radio break from scratch.
+
+        Only one generation runs at a time: if another process is already
+        generating (TTS and mixing can outlast the timer interval), this
+        raises straight away instead of paying for a second pipeline.
+
+        Returns:
+            GeneratedBreak with metadata, or None if generation fails
+
+        Raises:
+            BreakGenerationInProgress: If another run holds the generation lock
+        """
+        lock = fasteners.InterProcessLock(self.tmp_path / "generate.lock")
+        if not lock.acquire(blocking=False):
+            raise BreakGenerationInProgress(self.tmp_path / "generate.lock")
+        try:
+            return await self._run_pipeline()
+        finally:
+            lock.release()
+
+    async def _run_pipeline(self) -> Optional[GeneratedBreak]:
+        """Run the break generation pipeline.
+
         Executes full pipeline:
-        1. Fetch weather and news data
+        1. Fetch weather and news data (concurrently with bed selection
+           and housekeeping)
         2. Generate bulletin script
         3. Synthesize voice
         4. Mix with random bed
@@ -134,15 +223,18 @@ class BreakGenerator:
         Returns:
             GeneratedBreak with metadata, or None if generation fails
         """
-        # Clean up any orphaned temp files from previous failed runs
-        cleanup_old_temp_files(max_age_minutes=60)
-
         logger.info("Starting break generation pipeline")
 
-        # Step 1: Collect data
+        # Step 1: Collect data. Weather and news (network) and bed selection /
+        # housekeeping (disk) are independent, so they overlap: wall time is
+        # the slowest of them rather than their sum
         logger.info("Fetching weather and news data")
-        weather = get_weather()
-        news = get_news()
+        weather, news, bed_path, _ = await asyncio.gather(
+            asyncio.to_thread(get_weather),
+            asyncio.to_thread(get_news),
+            asyncio.to_thread(self._select_random_bed),
+            asyncio.to_thread(self._housekeeping),
+        )
 
         if not weather and not news:
             logger.error("No weather or news data available")
@@ -153,9 +245,13 @@ class BreakGenerator:
             f"news={'✓' if news else '✗'}"
         )
 
+        # Decode the bed into the mix cache while the script and voice are
+        # generated (network-bound), so the mix doesn't pay for it afterwards
+        bed_prep = asyncio.create_task(asyncio.to_thread(prepare_bed, bed_path)) if bed_path else None
+
         # Step 2: Generate script
         logger.info("Generating bulletin script with Claude")
-        bulletin = generate_bulletin(weather=weather, news=news)
+        bulletin = await asyncio.to_thread(generate_bulletin, weather=weather, news=news)
 
         if not bulletin:
             logger.error("Failed to generate bulletin script")
@@ -169,12 +265,15 @@ class BreakGenerator:
         # Ensure tmp directory exists
         self.tmp_path.mkdir(parents=True, exist_ok=True)
 
-        # Generate unique voice filename
-        voice_filename = f"voice_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
+        # Generate unique voice filename. WAV keeps the voice uncompressed
+        # until the mix, so the break is only lossy-encoded once.
+        voice_filename = f"voice_{os.getpid()}_{next(_voice_counter)}.wav"
         voice_path = self.tmp_path / voice_filename
 
         try:
-            voice_audio = synthesize_bulletin(bulletin.script_text, voice_path)
+            voice_audio = await asyncio.to_thread(
+                synthesize_bulletin, bulletin.script_text, voice_path
+            )
 
             if not voice_audio:
                 logger.error("Failed to synthesize voice")
@@ -182,24 +281,21 @@ class BreakGenerator:
 
             logger.info(f"Voice synthesized: {voice_audio.duration_estimate:.1f}s")
 
-            # Step 4: Select random bed
-            bed_path = self._select_random_bed()
-
+            # Step 4: Use the bed selected during data collection
             if not bed_path:
                 logger.error("No bed file available for mixing")
                 return None
 
             # Step 5: Mix voice with bed
             logger.info(f"Mixing voice with bed: {bed_path.name}")
+            await bed_prep
 
             # Ensure breaks directory exists
             self.breaks_path.mkdir(parents=True, exist_ok=True)
 
             # Generate unique output filename and metadata
             # Use station timezone for metadata title (Chicago time)
-            from datetime import timedelta
-            from zoneinfo import ZoneInfo
-            now = datetime.now(ZoneInfo(config.station_tz))
+            now = datetime.now(self.station_zone)
             output_filename = f"break_{now.strftime('%Y%m%d_%H%M%S')}.mp3"
             output_path = self.breaks_path / output_filename
 
@@ -207,21 +303,16 @@ class BreakGenerator:
             # If generated at 3:52 PM, will air at 4:00 PM
             next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
 
-            # Format title as "Mon Dec 29, 2025 4 PM News Break"
-            # Show hour only (no minutes) since it airs on the hour
-            hour_12 = next_hour.hour % 12
-            if hour_12 == 0:
-                hour_12 = 12
-            am_pm = "AM" if next_hour.hour < 12 else "PM"
-
-            metadata_title = next_hour.strftime(f"%a %b %d, %Y {hour_12} {am_pm} News Break")
+            metadata_title = format_break_title(next_hour)
 
-            mixed_audio = mix_voice_with_bed(
+            mixed_audio = await asyncio.to_thread(
+                mix_voice_with_bed,
                 voice_path=voice_path,
                 bed_path=bed_path,
                 output_path=output_path,
                 metadata_title=metadata_title,
-                metadata_artist=config.music_artist,
+                metadata_artist=config.audio.music_artist,
+                return_stats=True,
             )
 
             if not mixed_audio:
@@ -230,9 +321,6 @@ class BreakGenerator:
 
             logger.info(f"Break generated successfully: {output_path.name}")
 
-            # Archive old breaks to prevent disk space exhaustion
-            self._archive_old_breaks(keep=100)
-
             return GeneratedBreak(
                 file_path=output_path,
                 duration=mixed_audio.duration,
@@ -240,15 +328,33 @@ class BreakGenerator:
                 includes_weather=bulletin.includes_weather,
                 includes_news=bulletin.includes_news,
                 script_text=bulletin.script_text,
+                loudness_lufs=mixed_audio.loudness_lufs,
+                true_peak_dbtp=mixed_audio.true_peak_dbtp,
             )
 
         finally:
-            # Always clean up temporary voice file
-            if voice_path.exists():
+            # Always clean up temporary voice file (one unlink, no exists() probe)
+            with suppress(FileNotFoundError):
                 voice_path.unlink()
                 logger.debug(f"Cleaned up temporary voice file: {voice_path.name}")
 
 
+@lru_cache(maxsize=48)
+def format_break_title(next_hour: datetime) -> str:
+    """Format the ID3 title for a break airing at next_hour.
+
+    Shows the hour only (no minutes) since breaks air on the hour, e.g.
+    "Mon Dec 29, 2025 4 PM News Break". Memoized: every break generated
+    for the same hour gets the same title.
+    """
+    hour_12 = next_hour.hour % 12
+    if hour_12 == 0:
+        hour_12 = 12
+    am_pm = "AM" if next_hour.hour < 12 else "PM"
+
+    return next_hour.strftime(BREAK_TITLE_TEMPLATE.format(hour=hour_12, am_pm=am_pm))
+
+
 def cleanup_old_temp_files(max_age_minutes: int = 60) -> int:
     """Clean up orphaned temporary files older than specified age.
 
@@ -269,12 +375,17 @@ def cleanup_old_temp_files(max_age_minutes: int = 60) -> int:
     cleaned_count = 0
 
     try:
-        for temp_file in tmp_path.glob("voice_*.mp3"):
-            file_age = current_time - temp_file.stat().st_mtime
-            if file_age > max_age_seconds:
-                temp_file.unlink()
-                cleaned_count += 1
-                logger.info(f"Cleaned up old temp file: {temp_file.name} (age: {file_age/60:.1f}min)")
+        # .wav voice files, plus .mp3 ones left by older versions. One scandir
+        # pass; DirEntry.stat() reuses the entry instead of a stat per path
+        with os.scandir(tmp_path) as entries:
+            for entry in entries:
+                if not (entry.name.startswith("voice_") and entry.name.endswith((".wav", ".mp3"))):
+                    continue
+                file_age = current_time - entry.stat().st_mtime
+                if file_age > max_age_seconds:
+                    os.unlink(entry.path)
+                    cleaned_count += 1
+                    logger.info(f"Cleaned up old temp file: {entry.name} (age: {file_age/60:.1f}min)")
     except Exception as e:
         logger.warning(f"Failed to clean up temp files: {e}")
 
@@ -286,6 +397,9 @@ def generate_break() -> Optional[GeneratedBreak]:
 
     Returns:
         GeneratedBreak or None if generation fails
+
+    Raises:
+        BreakGenerationInProgress: If another run holds the generation lock
     """
     generator = BreakGenerator()
     return generator.generate()
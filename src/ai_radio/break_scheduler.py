@@ -4,7 +4,10 @@ Handles selecting and validating breaks for playback.
 """
 
 import logging
+import os
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -26,6 +29,65 @@ class StaleBreakError(Exception):
         )
 
 
+# A directory modified this recently may change again within the same
+# timestamp tick, so its listing isn't trusted for reuse
+RACY_WINDOW_NS = 1_000_000_000
+
+
+class BreaksIndex:
+    """Newest-first listing of the break_*.mp3 files in one directory.
+
+    The listing is cached on the directory's st_mtime_ns, which changes
+    whenever a break is added, removed or renamed, so an unchanged
+    directory costs one stat() instead of a scan plus a stat per file.
+    Break files are written once under unique names; rewriting one in
+    place (which doesn't touch the directory) is not picked up.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._cache: Optional[tuple[int, tuple[tuple[float, Path], ...]]] = None
+        self._lock = threading.Lock()
+
+    def entries(self) -> tuple[tuple[float, Path], ...]:
+        """Return (mtime, path) for every break, newest first.
+
+        A missing directory has no breaks.
+        """
+        try:
+            dir_mtime_ns = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            return ()
+
+        with self._lock:
+            if self._cache is not None and self._cache[0] == dir_mtime_ns:
+                return self._cache[1]
+
+            # One scandir pass; DirEntry.stat() reuses the entry instead of
+            # re-resolving the path
+            found = []
+            try:
+                with os.scandir(self.directory) as dir_entries:
+                    for entry in dir_entries:
+                        name = entry.name
+                        if name.startswith("break_") and name.endswith(".mp3"):
+                            found.append((entry.stat().st_mtime, Path(entry.path)))
+            except FileNotFoundError:
+                return ()  # Removed since the stat above
+            found.sort(key=lambda item: item[0], reverse=True)
+            listing = tuple(found)
+
+            if time.time_ns() - dir_mtime_ns > RACY_WINDOW_NS:
+                self._cache = (dir_mtime_ns, listing)
+            return listing
+
+
+@lru_cache(maxsize=None)
+def breaks_index(directory: Path) -> BreaksIndex:
+    """Return the shared BreaksIndex for a directory."""
+    return BreaksIndex(directory)
+
+
 def get_fresh_break(breaks_dir: Optional[Path] = None) -> Path:
     """Find the most recent break file and verify it's fresh.
 
@@ -42,21 +104,15 @@ def get_fresh_break(breaks_dir: Optional[Path] = None) -> Path:
     if breaks_dir is None:
         breaks_dir = config.paths.breaks_path
 
-    # Get all break files sorted by modification time (newest first)
-    breaks = sorted(
-        breaks_dir.glob("break_*.mp3"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True
-    )
-
+    breaks = breaks_index(breaks_dir).entries()
     if not breaks:
         raise FileNotFoundError(f"No breaks available in {breaks_dir}")
 
-    next_break = breaks[0]
+    newest_mtime, next_break = breaks[0]
     logger.info(f"Found most recent break: {next_break.name}")
 
     # Check break freshness
-    age_seconds = time.time() - next_break.stat().st_mtime
+    age_seconds = time.time() - newest_mtime
     freshness_seconds = config.operational.break_freshness_minutes * 60
 
     if age_seconds > freshness_seconds:
@@ -24,7 +24,7 @@ from .audio_mixing import AudioMixingConfig
 from .operational import OperationalConfig
 
 # Global singleton (backward compatibility)
-config = RadioConfig()
+config = RadioConfig.load()
 
 __all__ = [
     "config",
@@ -1,10 +1,11 @@
 """Announcer personality and style configuration."""
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .settings_base import RadioSettings
 
-class AnnouncerPersonalityConfig(BaseSettings):
+
+class AnnouncerPersonalityConfig(RadioSettings):
     """Announcer personality and delivery style.
 
     Defines the CHARACTER - how the DJ behaves, talks, and delivers content.
@@ -34,14 +35,6 @@ class AnnouncerPersonalityConfig(BaseSettings):
         RADIO_LISTENER_RELATIONSHIP: How to relate to listeners
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="RADIO_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # Core persona
     announcer_name: str = Field(default="DJ Coco", description="Persona name")
     energy_level: int = Field(default=5, ge=1, le=10, description="Energy level 1-10, cap at 8-9, never 10")
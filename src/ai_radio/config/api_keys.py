@@ -3,10 +3,11 @@
 from typing import Optional
 
 from pydantic import Field, SecretStr
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .settings_base import RadioSettings
 
-class APIKeysConfig(BaseSettings):
+
+class APIKeysConfig(RadioSettings):
     """API keys and secrets for AI Radio Station.
 
     All keys are optional (None by default) and use SecretStr to prevent
@@ -18,14 +19,6 @@ class APIKeysConfig(BaseSettings):
         RADIO_GEMINI_API_KEY: Google Gemini API key
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="RADIO_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # API keys - all optional, protected with SecretStr
     llm_api_key: Optional[SecretStr] = Field(default=None, description="LLM provider API key")
     tts_api_key: Optional[SecretStr] = Field(default=None, description="OpenAI TTS API key")
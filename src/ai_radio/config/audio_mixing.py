@@ -1,10 +1,11 @@
 """Audio mixing and production configuration."""
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .settings_base import RadioSettings
 
-class AudioMixingConfig(BaseSettings):
+
+class AudioMixingConfig(RadioSettings):
     """Audio mixing and production settings.
 
     Environment variables:
@@ -16,14 +17,6 @@ class AudioMixingConfig(BaseSettings):
         RADIO_MUSIC_ARTIST: Artist name for ingested music
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="RADIO_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # Audio bed volume and timing
     bed_volume_db: float = Field(default=-18.0, description="Background bed volume in dB")
     bed_preroll_seconds: float = Field(default=3.0, description="Bed starts before voice (ride in)")
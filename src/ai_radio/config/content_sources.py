@@ -3,10 +3,11 @@
 from typing import Optional
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .settings_base import RadioSettings
 
-class ContentSourcesConfig(BaseSettings):
+
+class ContentSourcesConfig(RadioSettings):
     """Content sources for news and weather data.
 
     Environment variables:
@@ -19,14 +20,6 @@ class ContentSourcesConfig(BaseSettings):
         RADIO_HALLUCINATION_KERNELS: Seed topics for fake news (JSON array)
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="RADIO_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # NWS Weather Configuration
     nws_office: Optional[str] = Field(default=None, description="NWS office code")
     nws_grid_x: Optional[int] = Field(default=None, description="NWS grid X coordinate")
@@ -1,13 +1,15 @@
 """Filesystem paths configuration."""
 
 import os
+from functools import cached_property
 from pathlib import Path
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .settings_base import RadioSettings
 
-class PathsConfig(BaseSettings):
+
+class PathsConfig(RadioSettings):
     """Filesystem paths for AI Radio Station.
 
     All paths can be overridden via environment variables with RADIO_ prefix.
@@ -16,82 +18,90 @@ class PathsConfig(BaseSettings):
         RADIO_BASE_PATH: Base directory (default: /srv/ai_radio)
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="RADIO_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # Base path
     base_path: Path = Field(default=Path("/srv/ai_radio"))
 
-    # Derived paths as properties
-    @property
+    # Derived paths, built once per instance (base_path is fixed after load)
+    @cached_property
     def assets_path(self) -> Path:
         return self.base_path / "assets"
 
-    @property
+    @cached_property
     def music_path(self) -> Path:
         return self.assets_path / "music"
 
-    @property
+    @cached_property
     def beds_path(self) -> Path:
         return self.assets_path / "beds"
 
-    @property
+    @cached_property
     def breaks_path(self) -> Path:
         return self.assets_path / "breaks"
 
-    @property
+    @cached_property
     def breaks_archive_path(self) -> Path:
         return self.breaks_path / "archive"
 
-    @property
+    @cached_property
     def bumpers_path(self) -> Path:
         return self.assets_path / "bumpers"
 
-    @property
+    @cached_property
     def safety_path(self) -> Path:
         return self.assets_path / "safety"
 
-    @property
+    @cached_property
     def startup_path(self) -> Path:
         return self.assets_path / "startup.mp3"
 
-    @property
+    @cached_property
     def drops_path(self) -> Path:
         return self.base_path / "drops"
 
-    @property
+    @cached_property
     def tmp_path(self) -> Path:
         return self.base_path / "tmp"
 
-    @property
+    @cached_property
     def public_path(self) -> Path:
         return self.base_path / "public"
 
-    @property
+    @cached_property
     def state_path(self) -> Path:
         return self.base_path / "state"
 
-    @property
+    @cached_property
     def recent_weather_phrases_path(self) -> Path:
         return self.state_path / "recent_weather_phrases.json"
 
-    @property
+    @cached_property
+    def segment_cache_path(self) -> Path:
+        return self.state_path / "segment_cache.json"
+
+    @cached_property
+    def hash_cache_path(self) -> Path:
+        return self.state_path / "hash_cache.json"
+
+    @cached_property
+    def feed_cache_path(self) -> Path:
+        return self.state_path / "feed_cache.json"
+
+    @cached_property
     def db_path(self) -> Path:
         return self.base_path / "db" / "radio.sqlite3"
 
-    @property
+    @cached_property
     def logs_path(self) -> Path:
         return self.base_path / "logs" / "jobs.jsonl"
 
-    @property
+    @cached_property
     def liquidsoap_sock_path(self) -> Path:
         return Path("/run/liquidsoap/radio.sock")
 
+    @cached_property
+    def export_sock_path(self) -> Path:
+        return Path("/run/ai_radio/export.sock")
+
     @property
     def beds_dir_resolved(self) -> Path | None:
         """Return beds directory if it exists, checking multiple locations in priority order.
@@ -0,0 +1,93 @@
+"""Shared settings base for the domain configs."""
+
+import json
+from collections.abc import Mapping
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Optional
+
+from pydantic.fields import FieldInfo
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    ForceDecode,
+    NoDecode,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+
+# .env values parsed once by RadioConfig.load(), visible to every domain config
+# built during that call. A mapping rather than os.environ, so secrets aren't
+# inherited by child processes (ffmpeg, ffprobe, ...)
+ENV_FILE_VALUES: ContextVar[Mapping[str, Optional[str]]] = ContextVar(
+    "radio_env_file_values", default={}
+)
+
+
+@lru_cache(maxsize=64)
+def _decode_json(raw: str) -> Any:
+    """Parse a JSON env value once per distinct string."""
+    return json.loads(raw)
+
+
+class _CachedJsonEnvSource(EnvSettingsSource):
+    """Env source that decodes each complex (JSON) value only once.
+
+    RADIO_NEWS_RSS_FEEDS and RADIO_HALLUCINATION_KERNELS are re-read every
+    time a config is built; validation copies the decoded value, so the
+    cached object is never handed out or mutated.
+    """
+
+    def decode_complex_value(self, field_name: str, field: FieldInfo, value: Any) -> Any:
+        if field and (
+            NoDecode in field.metadata
+            or (self.config.get("enable_decoding") is False and ForceDecode not in field.metadata)
+        ):
+            return value
+        return _decode_json(value)
+
+
+class _EnvFileValuesSource(_CachedJsonEnvSource):
+    """Env source over the .env mapping parsed once by RadioConfig.load()."""
+
+    def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+        values = ENV_FILE_VALUES.get()
+        if self.case_sensitive:
+            return dict(values)
+        return {key.lower(): value for key, value in values.items()}
+
+
+class RadioSettings(BaseSettings):
+    """Base class for AI Radio settings models.
+
+    Holds the settings every domain config shares: RADIO_-prefixed
+    environment variables and read-only instances. Settings come from
+    os.environ, then from the .env values RadioConfig.load() parsed once.
+    Subclasses only declare what differs (model_config is merged).
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="RADIO_",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,
+        validate_default=False,
+    )
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            init_settings,
+            _CachedJsonEnvSource(settings_cls),
+            _EnvFileValuesSource(settings_cls),
+            dotenv_settings,
+            file_secret_settings,
+        )
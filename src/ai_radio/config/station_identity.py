@@ -1,12 +1,15 @@
 """Station identity and location configuration."""
 
+from functools import cached_property
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .settings_base import RadioSettings
 
-class StationIdentityConfig(BaseSettings):
+
+class StationIdentityConfig(RadioSettings):
     """Station identity and location metadata.
 
     Environment variables:
@@ -17,14 +20,6 @@ class StationIdentityConfig(BaseSettings):
         RADIO_STATION_LON: Station longitude for weather data
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="RADIO_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # Station identity
     station_name: str = Field(default="WKRP Coconut Island", description="Station name for on-air identification")
     station_location: str = Field(default="Coconut Island", description="Station location for brand identity")
@@ -34,6 +29,11 @@ class StationIdentityConfig(BaseSettings):
     station_lat: Optional[float] = Field(default=None, description="Station latitude for weather data")
     station_lon: Optional[float] = Field(default=None, description="Station longitude for weather data")
 
+    @cached_property
+    def station_zone(self) -> ZoneInfo:
+        """Station timezone, resolved once per config."""
+        return ZoneInfo(self.station_tz)
+
     @field_validator("station_lat")
     @classmethod
     def validate_latitude(cls, v: Optional[float]) -> Optional[float]:
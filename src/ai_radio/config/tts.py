@@ -1,10 +1,13 @@
 """Text-to-speech (TTS) configuration."""
 
+from typing import Literal
+
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from .settings_base import RadioSettings
 
 
-class TTSConfig(BaseSettings):
+class TTSConfig(RadioSettings):
     """Text-to-speech provider configuration.
 
     Note: API keys are in APIKeysConfig.
@@ -16,16 +19,8 @@ class TTSConfig(BaseSettings):
         RADIO_TTS_VOICE: OpenAI TTS voice name
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="RADIO_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # TTS Provider
-    tts_provider: str = Field(
+    tts_provider: Literal["openai", "gemini"] = Field(
         default="gemini",
         description="TTS provider: 'openai' or 'gemini'"
     )
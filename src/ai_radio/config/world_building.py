@@ -1,10 +1,11 @@
 """World-building and setting configuration."""
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .settings_base import RadioSettings
 
-class WorldBuildingConfig(BaseSettings):
+
+class WorldBuildingConfig(RadioSettings):
     """World-building and setting configuration.
 
     Defines the SETTING - the world/universe in which the station exists.
@@ -15,14 +16,6 @@ class WorldBuildingConfig(BaseSettings):
         RADIO_WORLD_FRAMING: How to frame content through station personality
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="RADIO_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     world_setting: str = Field(
         default="laid-back tropical island paradise",
         description="The world/universe setting for the station"
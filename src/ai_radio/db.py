@@ -0,0 +1,69 @@
+"""SQLite connection helpers.
+
+Scripts on Liquidsoap's callback path (record_play.py, schedule_station_id.py)
+open a fresh connection per invocation, so connection setup matters.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# Applied on every connection. journal_mode=WAL is persistent: the first
+# connection switches the database file for every process that opens it, and
+# from then on even read-only readers must be able to create the -wal/-shm
+# files next to it. Sandboxed units (ProtectSystem=strict) that touch the
+# database therefore need /srv/ai_radio/db in ReadWritePaths. Re-issuing it
+# is a cheap no-op once set; the rest are per-connection.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-30000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def connect(db_path: Path | str) -> sqlite3.Connection:
+    """Open a SQLite connection tuned for short-lived writers.
+
+    WAL with synchronous=NORMAL lets writers proceed without blocking readers
+    and avoids an fsync per commit; busy_timeout waits out brief lock
+    contention instead of failing with "database is locked".
+
+    The connection is in autocommit mode (isolation_level=None): the sqlite3
+    module issues no implicit BEGINs, so single statements commit on their
+    own and multi-statement writes use transaction() explicitly.
+
+    Args:
+        db_path: Database path
+
+    Returns:
+        Open sqlite3 connection
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run a block in a BEGIN IMMEDIATE transaction.
+
+    Takes the write lock up front (waiting up to busy_timeout) rather than
+    upgrading mid-transaction, commits on success and rolls back on error.
+
+    Args:
+        conn: Connection from connect()
+
+    Yields:
+        The same connection
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
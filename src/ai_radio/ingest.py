@@ -27,6 +27,7 @@ def ingest_audio_file(
     target_lufs: float = -18.0,
     true_peak: float = -1.0,
     ingest_existing: bool = False,  # NEW parameter
+    loudness_stats: Optional[dict] = None,
 ) -> dict:
     """Ingest audio file into asset library.
 
@@ -38,6 +39,9 @@ def ingest_audio_file(
         target_lufs: Target loudness in LUFS
         true_peak: True peak limit in dBTP
         ingest_existing: If True, register existing file in-place without normalization
+        loudness_stats: Already-measured loudness_lufs/true_peak_dbtp for an
+            existing file (e.g. from the mixer's loudnorm pass); skips
+            re-measuring it when ingest_existing=True
 
     Returns:
         dict with asset information
@@ -93,9 +97,10 @@ def ingest_audio_file(
         if ingest_existing:
             # Register existing file without normalization
             print(f"📍 Registering existing file (no normalization)...")
-            from ai_radio.audio import measure_loudness
+            if loudness_stats is None:
+                from ai_radio.audio import measure_loudness
 
-            loudness_stats = measure_loudness(source_path)
+                loudness_stats = measure_loudness(source_path)
             print(f"   Loudness: {loudness_stats['loudness_lufs']:.1f} LUFS")
             print(f"   True Peak: {loudness_stats['true_peak_dbtp']:.1f} dBTP")
 
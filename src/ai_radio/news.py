@@ -8,6 +8,7 @@ Selects diverse content from multiple categories.
 import json
 import logging
 import random
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -77,6 +78,46 @@ def load_recent_hallucinated_headlines() -> list[str]:
         return []
 
 
+def load_feed_cache() -> dict[str, dict]:
+    """Load the per-feed records (HTTP validators and entries) from the last fetch.
+
+    Returns:
+        Records keyed by feed URL, or an empty dict if none are saved
+    """
+    try:
+        cache_file = config.paths.feed_cache_path
+        if cache_file.exists():
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+    except Exception as e:
+        logger.warning(f"Failed to load feed cache: {e}")
+    return {}
+
+
+def save_feed_cache(records: dict[str, dict]) -> None:
+    """Save per-feed records for conditional requests on the next fetch.
+
+    Skipped when the state directory does not exist.
+
+    Args:
+        records: Records keyed by feed URL
+    """
+    try:
+        cache_file = config.paths.feed_cache_path
+        if not cache_file.parent.is_dir():
+            return
+
+        lock = fasteners.InterProcessLock(cache_file.with_suffix('.lock'))
+        with lock:
+            temp_file = cache_file.with_suffix('.tmp')
+            with open(temp_file, 'w') as f:
+                json.dump(records, f)
+            temp_file.replace(cache_file)
+
+    except Exception as e:
+        logger.warning(f"Failed to save feed cache: {e}")
+
+
 @dataclass
 class NewsHeadline:
     """Single news headline with metadata."""
@@ -108,6 +149,7 @@ class RSSNewsClient:
         self.categorized_feeds = config.news_rss_feeds
         self.max_headlines_per_feed = 10  # Increased to get better today's news coverage
         self.timeout = 10.0
+        self.max_parallel_feeds = 8  # Concurrent feed fetches
         self.user_agent = "AIRadioStation/1.0 (+https://github.com/your-username/ai-radio-station)"
         self.categories_to_select = 3
         self.articles_per_category = 1
@@ -191,11 +233,109 @@ OUTPUT: Just the headline text, nothing else."""
             logger.error(f"Failed to generate hallucinated headline: {e}")
             return None
 
+    def _fetch_feed(
+        self,
+        client: httpx.Client,
+        category: str,
+        feed_url: str,
+        cached: Optional[dict] = None,
+    ) -> Optional[dict]:
+        """Fetch one RSS feed, revalidating the copy from the last fetch.
+
+        Sends If-None-Match/If-Modified-Since from the cached record, so an
+        unchanged feed comes back as a bodiless 304 and is not parsed again.
+
+        Args:
+            client: Shared HTTP client
+            category: Feed category (for logging)
+            feed_url: RSS feed URL
+            cached: Record returned by the previous fetch of this feed
+
+        Returns:
+            Feed record (validators, feed title and raw entries), or None if
+            the feed failed
+        """
+        try:
+            logger.info(f"Fetching RSS feed ({category}): {feed_url}")
+
+            headers = {"User-Agent": self.user_agent}
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+            response = client.get(feed_url, headers=headers)
+            if cached and response.status_code == 304:
+                logger.info(f"RSS feed unchanged since last fetch: {feed_url}")
+                return cached
+            response.raise_for_status()
+
+            # Parse the fetched content
+            feed = feedparser.parse(response.content)
+
+            if feed.bozo:
+                logger.warning(f"RSS feed parsing error for {feed_url}: {feed.bozo_exception}")
+                return None
+
+            if not feed.entries:
+                logger.warning(f"RSS feed has no entries: {feed_url}")
+                return None
+
+            # Keep entries (limited per feed) unfiltered: a later 304 reuses
+            # them against a later cutoff
+            entries = []
+            for entry in feed.entries[: self.max_headlines_per_feed]:
+                published = None
+                if hasattr(entry, "published_parsed") and entry.published_parsed:
+                    try:
+                        published = datetime(*entry.published_parsed[:6]).isoformat()
+                    except (TypeError, ValueError):
+                        pass
+
+                entries.append({
+                    "title": entry.get("title", "Untitled"),
+                    "link": entry.get("link", ""),
+                    "published": published,
+                })
+
+            return {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "title": feed.feed.get("title", "Unknown Source"),
+                "entries": entries,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to fetch RSS feed {feed_url}: {e}")
+            return None
+
+    def _recent_headlines(self, record: dict, today_cutoff: datetime) -> list[NewsHeadline]:
+        """Build headlines from a feed record, dropping entries before today_cutoff."""
+        headlines = []
+        for entry in record["entries"]:
+            published = datetime.fromisoformat(entry["published"]) if entry["published"] else None
+
+            # Filter for today's news only
+            if published and published < today_cutoff:
+                continue
+
+            headlines.append(NewsHeadline(
+                title=entry["title"],
+                source=record["title"],
+                link=entry["link"],
+                published=published,
+            ))
+
+        logger.info(f"Fetched {len(headlines)} today's headlines from {record['title']}")
+        return headlines
+
     def fetch_headlines(self) -> Optional[NewsData]:
         """Fetch headlines with category-based selection.
 
         Strategy:
-        1. Fetch all feeds grouped by category
+        1. Fetch all feeds concurrently, grouped by category (feeds unchanged
+           since the last fetch answer 304 and reuse the saved entries)
         2. Filter for today's articles only (published within last 24 hours)
         3. Select 3 random categories
         4. Pick 1 random article from each selected category
@@ -203,69 +343,45 @@ OUTPUT: Just the headline text, nothing else."""
         Returns:
             NewsData with selected headlines, or None if all feeds fail.
         """
-        # Fetch headlines grouped by category
-        headlines_by_category: dict[str, list[NewsHeadline]] = {}
-        successful_feeds = 0
         today_cutoff = datetime.now() - timedelta(hours=24)
+        jobs = [
+            (category, feed_url)
+            for category, feed_urls in self.categorized_feeds.items()
+            for feed_url in feed_urls
+        ]
+        if not jobs:
+            logger.error("No headlines fetched from any RSS feed")
+            return None
 
-        for category, feed_urls in self.categorized_feeds.items():
-            category_headlines = []
-
-            for feed_url in feed_urls:
-                try:
-                    logger.info(f"Fetching RSS feed ({category}): {feed_url}")
-
-                    # Fetch with explicit timeout using httpx
-                    with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                        response = client.get(
-                            feed_url,
-                            headers={"User-Agent": self.user_agent}
-                        )
-                        response.raise_for_status()
-
-                    # Parse the fetched content
-                    feed = feedparser.parse(response.content)
-
-                    if feed.bozo:
-                        logger.warning(f"RSS feed parsing error for {feed_url}: {feed.bozo_exception}")
-                        continue
-
-                    if not feed.entries:
-                        logger.warning(f"RSS feed has no entries: {feed_url}")
-                        continue
-
-                    feed_title = feed.feed.get("title", "Unknown Source")
-                    successful_feeds += 1
-
-                    # Extract headlines (limited per feed)
-                    for entry in feed.entries[: self.max_headlines_per_feed]:
-                        published = None
-                        if hasattr(entry, "published_parsed") and entry.published_parsed:
-                            try:
-                                published = datetime(*entry.published_parsed[:6])
-                            except (TypeError, ValueError):
-                                pass
-
-                        # Filter for today's news only
-                        if published and published < today_cutoff:
-                            continue
-
-                        headline = NewsHeadline(
-                            title=entry.get("title", "Untitled"),
-                            source=feed_title,
-                            link=entry.get("link", ""),
-                            published=published,
-                        )
-                        category_headlines.append(headline)
-
-                    logger.info(f"Fetched {len(category_headlines)} today's headlines from {feed_title}")
-
-                except Exception as e:
-                    logger.error(f"Failed to fetch RSS feed {feed_url}: {e}")
-                    continue
+        feed_cache = load_feed_cache()
 
-            if category_headlines:
-                headlines_by_category[category] = category_headlines
+        # Feeds are independent network round-trips: fetch them in parallel
+        # over one pooled client, so the total is the slowest feed rather
+        # than the sum (map keeps results in job order)
+        with httpx.Client(timeout=self.timeout, follow_redirects=True) as client, \
+                ThreadPoolExecutor(max_workers=min(len(jobs), self.max_parallel_feeds)) as executor:
+            results = list(executor.map(
+                lambda job: self._fetch_feed(client, job[0], job[1], feed_cache.get(job[1])),
+                jobs,
+            ))
+
+        # Group headlines by category; failed feeds keep their old record
+        headlines_by_category: dict[str, list[NewsHeadline]] = {}
+        successful_feeds = 0
+        new_feed_cache = {}
+        for (category, feed_url), record in zip(jobs, results):
+            if record is None:
+                if feed_url in feed_cache:
+                    new_feed_cache[feed_url] = feed_cache[feed_url]
+                continue
+            successful_feeds += 1
+            new_feed_cache[feed_url] = record
+            headlines = self._recent_headlines(record, today_cutoff)
+            if headlines:
+                headlines_by_category.setdefault(category, []).extend(headlines)
+
+        if new_feed_cache != feed_cache:
+            save_feed_cache(new_feed_cache)
 
         if not headlines_by_category:
             logger.error("No headlines fetched from any RSS feed")
@@ -4,14 +4,51 @@ import logging
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterable, Optional
+
+from .db import connect, transaction
 
 logger = logging.getLogger(__name__)
 
+# Cached (hour_epoch, iso_string) for the most recent hour bucket
+_hour_bucket_cache: tuple[int, str] | None = None
+
+
+def hour_bucket(now: datetime) -> str:
+    """Return the ISO 8601 hour bucket for a UTC timestamp.
+
+    Truncates with integer arithmetic on the epoch and only re-formats the
+    string when the hour changes, so repeated calls within the same hour
+    cost a single integer comparison.
+
+    Args:
+        now: Timezone-aware UTC datetime
+
+    Returns:
+        ISO 8601 string for the start of the hour (e.g. 2026-01-01T12:00:00+00:00)
+    """
+    global _hour_bucket_cache
+
+    hour_epoch = (int(now.timestamp()) // 3600) * 3600
+    if _hour_bucket_cache is None or _hour_bucket_cache[0] != hour_epoch:
+        _hour_bucket_cache = (
+            hour_epoch,
+            datetime.fromtimestamp(hour_epoch, timezone.utc).isoformat(),
+        )
+    return _hour_bucket_cache[1]
+
+
+_SQL_INSERT_PLAY = """
+    INSERT INTO play_history (asset_id, played_at, source, hour_bucket)
+    VALUES (?, ?, ?, ?)
+"""
+
 
 def record_play(
     db_path: Path,
     asset_id: str,
-    source: str = "music"
+    source: str = "music",
+    conn: Optional[sqlite3.Connection] = None
 ) -> bool:
     """Record that an asset was played.
 
@@ -19,41 +56,63 @@ def record_play(
         db_path: Database path
         asset_id: Asset ID
         source: Play source (music|override|break|bumper)
+        conn: Existing connection to reuse (e.g. the one used for the asset
+            lookup); a new connection is opened when omitted
 
     Returns:
         True if successful
     """
-    try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+    if record_plays(db_path, [(asset_id, source, datetime.now(timezone.utc))], conn=conn):
+        logger.info(f"Recorded play: {asset_id} from {source}")
+        return True
+    return False
 
-        now = datetime.now(timezone.utc)
-        played_at = now.isoformat()
 
-        # Calculate hour_bucket (SOW Section 6 requirement)
-        hour_bucket = now.replace(
-            minute=0,
-            second=0,
-            microsecond=0
-        ).isoformat()
+def record_plays(
+    db_path: Path,
+    plays: Iterable[tuple[str, str, datetime]],
+    conn: Optional[sqlite3.Connection] = None
+) -> int:
+    """Record many plays with one executemany in a single transaction.
 
-        cursor.execute(
-            """
-            INSERT INTO play_history (asset_id, played_at, source, hour_bucket)
-            VALUES (?, ?, ?, ?)
-            """,
-            (asset_id, played_at, source, hour_bucket)
-        )
+    Amortizes connection setup and the commit across a batch (e.g. when
+    backfilling history or replaying queued play events).
 
-        conn.commit()
-        conn.close()
+    Args:
+        db_path: Database path
+        plays: (asset_id, source, played_at) tuples; played_at is UTC
+        conn: Existing connection to reuse. If it already has an open
+            transaction the rows join it and the caller commits.
 
-        logger.info(f"Recorded play: {asset_id} from {source}")
-        return True
+    Returns:
+        Number of plays recorded (0 on failure)
+    """
+    # hour_bucket: SOW Section 6 requirement
+    rows = [
+        (asset_id, played_at.isoformat(), source, hour_bucket(played_at))
+        for asset_id, source, played_at in plays
+    ]
+    if not rows:
+        return 0
+
+    try:
+        if conn is None:
+            owned = connect(db_path)
+            try:
+                with transaction(owned):
+                    owned.executemany(_SQL_INSERT_PLAY, rows)
+            finally:
+                owned.close()
+        elif conn.in_transaction:
+            conn.executemany(_SQL_INSERT_PLAY, rows)
+        else:
+            with transaction(conn):
+                conn.executemany(_SQL_INSERT_PLAY, rows)
+        return len(rows)
 
     except sqlite3.Error as e:
         logger.error(f"Failed to record play: {e}")
-        return False
+        return 0
 
 
 def get_recently_played_ids(
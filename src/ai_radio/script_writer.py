@@ -4,9 +4,11 @@ Generates natural, conversational radio bulletin scripts from weather and news d
 Uses Anthropic Claude API with structured prompts for consistent output.
 """
 
+import hashlib
 import json
 import logging
 import re
+import time
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
@@ -17,7 +19,7 @@ import fasteners
 from anthropic import Anthropic, APIError
 
 from .config import config
-from .news import NewsData
+from .news import NewsData, NewsHeadline
 from .weather import WeatherData, ForecastPeriod
 
 logger = logging.getLogger(__name__)
@@ -110,15 +112,89 @@ def load_recent_weather_phrases() -> list[str]:
         return []
 
 
+def _segment_cache_key(model: str, system_prompt: str, prompt: str, temperature: float) -> str:
+    """Key a script segment on everything the LLM sees."""
+    payload = json.dumps([model, system_prompt, prompt, temperature])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_cached_segment(key: str) -> Optional[str]:
+    """Return a segment generated from the same prompt within the cache TTL.
+
+    Disabled unless config.script_cache_ttl_minutes is set. Only exact
+    prompt matches hit: the prompts carry the weather readings, headlines,
+    time context and phrases to avoid, so an unchanged prompt means the
+    model would be asked for the same thing again.
+
+    Args:
+        key: Key from _segment_cache_key()
+
+    Returns:
+        Cached segment text, or None on a miss
+    """
+    try:
+        ttl_minutes = config.script_cache_ttl_minutes
+        if ttl_minutes <= 0:
+            return None
+        cache_file = config.paths.segment_cache_path
+        if not cache_file.exists():
+            return None
+        with open(cache_file, 'r') as f:
+            entry = json.load(f).get(key)
+        if entry and time.time() - entry["created_at"] <= ttl_minutes * 60:
+            return entry["text"]
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to read segment cache: {e}")
+        return None
+
+
+def store_cached_segment(key: str, text: str) -> None:
+    """Save a generated segment, dropping entries older than the cache TTL.
+
+    Args:
+        key: Key from _segment_cache_key()
+        text: Generated segment text
+    """
+    try:
+        ttl_minutes = config.script_cache_ttl_minutes
+        if ttl_minutes <= 0:
+            return
+        cache_file = config.paths.segment_cache_path
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Same lock-and-replace pattern as the weather phrase log
+        lock = fasteners.InterProcessLock(cache_file.with_suffix('.lock'))
+        with lock:
+            entries = {}
+            if cache_file.exists() and cache_file.stat().st_size > 0:
+                try:
+                    with open(cache_file, 'r') as f:
+                        entries = json.load(f)
+                except (json.JSONDecodeError, ValueError):
+                    logger.warning("Corrupted segment cache, starting fresh")
+
+            now = time.time()
+            cutoff = now - ttl_minutes * 60
+            entries = {k: v for k, v in entries.items() if v.get("created_at", 0) >= cutoff}
+            entries[key] = {"text": text, "created_at": now}
+
+            temp_file = cache_file.with_suffix('.tmp')
+            with open(temp_file, 'w') as f:
+                json.dump(entries, f)
+            temp_file.replace(cache_file)
+
+    except Exception as e:
+        logger.warning(f"Failed to update segment cache: {e}")
+
+
 def _get_time_of_day() -> str:
     """Determine current time of day period in station timezone.
 
     Returns:
         Time period: "morning", "afternoon", "evening", or "night"
     """
-    from zoneinfo import ZoneInfo
-
-    now = datetime.now(ZoneInfo(config.station_tz))
+    now = datetime.now(config.station.station_zone)
     hour = now.hour
 
     if 5 <= hour < 12:
@@ -137,9 +213,7 @@ def _get_upcoming_holidays() -> str:
     Returns:
         String describing upcoming holidays, or empty string if none
     """
-    from zoneinfo import ZoneInfo
-
-    now = datetime.now(ZoneInfo(config.station_tz))
+    now = datetime.now(config.station.station_zone)
 
     # Major US holidays (month, day, name)
     holidays = [
@@ -171,9 +245,7 @@ def _get_temporal_context() -> dict:
     Returns:
         Dictionary with day_of_week, is_weekend, is_commute_time, time_period
     """
-    from zoneinfo import ZoneInfo
-
-    now = datetime.now(ZoneInfo(config.station_tz))
+    now = datetime.now(config.station.station_zone)
     hour = now.hour
     day_of_week = now.strftime("%A")  # e.g., "Monday"
     is_weekend = now.weekday() >= 5  # Saturday=5, Sunday=6
@@ -203,6 +275,14 @@ def _get_temporal_context() -> dict:
     }
 
 
+def _format_headlines(headlines: list[NewsHeadline]) -> str:
+    """Format headlines as a numbered prompt list, built with one join."""
+    return "".join(
+        f"{i}. {headline.title} (Source: {headline.source})\n"
+        for i, headline in enumerate(headlines, 1)
+    )
+
+
 def _generate_fallback_script(
     weather: Optional["WeatherData"], news: Optional["NewsData"]
 ) -> str:
@@ -264,6 +344,38 @@ class ClaudeScriptWriter:
 
         # Build dynamic system prompt from configuration
         self.system_prompt = self._build_system_prompt()
+        # The system prompt only depends on config, so it's identical for the
+        # weather and news calls of every break: mark it as a cacheable
+        # prefix so repeat requests skip re-processing it
+        if config.llm_prompt_cache_enabled:
+            self.system = [
+                {"type": "text", "text": self.system_prompt, "cache_control": {"type": "ephemeral"}}
+            ]
+        else:
+            self.system = self.system_prompt
+
+    def _complete(self, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Run one segment prompt, reusing a cached result for an identical prompt.
+
+        Raises:
+            APIError: If the API call fails
+        """
+        key = _segment_cache_key(self.model, self.system_prompt, prompt, temperature)
+        cached = load_cached_segment(key)
+        if cached is not None:
+            logger.info("Reusing cached segment for identical prompt")
+            return cached
+
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=self.system,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        text = response.content[0].text.strip()
+        store_cached_segment(key, text)
+        return text
 
     def _build_system_prompt(self) -> str:
         """Build comprehensive system prompt from personality configuration.
@@ -375,9 +487,7 @@ ONLY the script text that will be spoken. NO stage directions, sound effects, or
         Returns:
             Weather segment text, or None if generation fails
         """
-        from zoneinfo import ZoneInfo
-
-        now = datetime.now(ZoneInfo(config.station_tz))
+        now = datetime.now(config.station.station_zone)
         temporal = _get_temporal_context()
         upcoming_holidays = _get_upcoming_holidays()
 
@@ -461,14 +571,8 @@ Pick the MOST RELEVANT weather information for listeners RIGHT NOW based on the
 Write just the weather segment (20-30 seconds when read aloud). Follow the weather format rules from your system prompt. DO NOT include intro, news, or sign-off - ONLY weather."""
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=200,  # Increased for more complex weather
-                temperature=config.weather_script_temperature,
-                system=self.system_prompt,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            weather_text = response.content[0].text.strip()
+            # max_tokens 200: increased for more complex weather
+            weather_text = self._complete(prompt, config.weather_script_temperature, max_tokens=200)
             logger.info("Generated weather segment")
 
             # Log this weather segment's phrases for future avoidance
@@ -488,9 +592,7 @@ Write just the weather segment (20-30 seconds when read aloud). Follow the weath
         Returns:
             News segment text, or None if generation fails
         """
-        from zoneinfo import ZoneInfo
-
-        now = datetime.now(ZoneInfo(config.station_tz))
+        now = datetime.now(config.station.station_zone)
         upcoming_holidays = _get_upcoming_holidays()
 
         prompt = f"""Write ONLY the news portion of a radio bulletin.
@@ -505,20 +607,12 @@ Write just the weather segment (20-30 seconds when read aloud). Follow the weath
 
 **NEWS HEADLINES:**
 """
-        for i, headline in enumerate(news.headlines, 1):
-            prompt += f"{i}. {headline.title} (Source: {headline.source})\n"
+        prompt += _format_headlines(news.headlines)
 
         prompt += "\nWrite just the news segment (20-30 seconds when read aloud). Follow the news format rules from your system prompt. DO NOT include intro, weather, or sign-off - ONLY news."
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=200,
-                temperature=config.news_script_temperature,
-                system=self.system_prompt,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            return response.content[0].text.strip()
+            return self._complete(prompt, config.news_script_temperature, max_tokens=200)
         except APIError as e:
             logger.error(f"News segment generation failed: {e}")
             return None
@@ -580,8 +674,7 @@ Write just the weather segment (20-30 seconds when read aloud). Follow the weath
             # Include time announcement for top-of-hour breaks
             # Round up to the next hour boundary (when the break will actually play)
             from datetime import timedelta
-            from zoneinfo import ZoneInfo
-            now = datetime.now(ZoneInfo(config.station_tz))
+            now = datetime.now(config.station.station_zone)
             # Round up to next hour: if 10:43, round to 11:00; if 10:50, round to 11:00
             next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
 
@@ -803,9 +896,7 @@ ONLY the script text that will be spoken. NO stage directions, sound effects, or
         Returns:
             Weather segment text, or None if generation fails
         """
-        from zoneinfo import ZoneInfo
-
-        now = datetime.now(ZoneInfo(config.station_tz))
+        now = datetime.now(config.station.station_zone)
         temporal = _get_temporal_context()
         upcoming_holidays = _get_upcoming_holidays()
         recent_phrases = load_recent_weather_phrases()
@@ -913,9 +1004,7 @@ Write just the weather segment (20-30 seconds when read aloud). Follow the weath
         Returns:
             News segment text, or None if generation fails
         """
-        from zoneinfo import ZoneInfo
-
-        now = datetime.now(ZoneInfo(config.station_tz))
+        now = datetime.now(config.station.station_zone)
         upcoming_holidays = _get_upcoming_holidays()
 
         prompt = f"""Write ONLY the news portion of a radio bulletin.
@@ -930,8 +1019,7 @@ Write just the weather segment (20-30 seconds when read aloud). Follow the weath
 
 **NEWS HEADLINES:**
 """
-        for i, headline in enumerate(news.headlines, 1):
-            prompt += f"{i}. {headline.title} (Source: {headline.source})\n"
+        prompt += _format_headlines(news.headlines)
 
         prompt += "\nWrite just the news segment (20-30 seconds when read aloud). Follow the news format rules from your system prompt. DO NOT include intro, weather, or sign-off - ONLY news."
 
@@ -1002,8 +1090,7 @@ Write just the weather segment (20-30 seconds when read aloud). Follow the weath
 
             # Combine segments with intro and sign-off
             from datetime import timedelta
-            from zoneinfo import ZoneInfo
-            now = datetime.now(ZoneInfo(config.station_tz))
+            now = datetime.now(config.station.station_zone)
             next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
 
             # Format time
@@ -1171,9 +1258,7 @@ ONLY the script text that will be spoken. NO stage directions, sound effects, or
         Returns:
             Weather segment text, or None if generation fails
         """
-        from zoneinfo import ZoneInfo
-
-        now = datetime.now(ZoneInfo(config.station_tz))
+        now = datetime.now(config.station.station_zone)
         temporal = _get_temporal_context()
         upcoming_holidays = _get_upcoming_holidays()
         recent_phrases = load_recent_weather_phrases()
@@ -1282,9 +1367,7 @@ Write just the weather segment (20-30 seconds when read aloud). Follow the weath
         Returns:
             News segment text, or None if generation fails
         """
-        from zoneinfo import ZoneInfo
-
-        now = datetime.now(ZoneInfo(config.station_tz))
+        now = datetime.now(config.station.station_zone)
         upcoming_holidays = _get_upcoming_holidays()
 
         prompt = f"""Write ONLY the news portion of a radio bulletin.
@@ -1299,8 +1382,7 @@ Write just the weather segment (20-30 seconds when read aloud). Follow the weath
 
 **NEWS HEADLINES:**
 """
-        for i, headline in enumerate(news.headlines, 1):
-            prompt += f"{i}. {headline.title} (Source: {headline.source})\n"
+        prompt += _format_headlines(news.headlines)
 
         prompt += "\nWrite just the news segment (20-30 seconds when read aloud). Follow the news format rules from your system prompt. DO NOT include intro, weather, or sign-off - ONLY news."
 
@@ -1372,8 +1454,7 @@ Write just the weather segment (20-30 seconds when read aloud). Follow the weath
 
             # Combine segments with intro and sign-off
             from datetime import timedelta
-            from zoneinfo import ZoneInfo
-            now = datetime.now(ZoneInfo(config.station_tz))
+            now = datetime.now(config.station.station_zone)
             next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
 
             # Format time
@@ -1490,15 +1571,13 @@ def generate_station_id(target_hour: int) -> Optional[StationIDScript]:
     Returns:
         StationIDScript or None if generation fails
     """
-    from zoneinfo import ZoneInfo
-
     try:
         api_key = config.llm_api_key
         if not api_key:
             raise ValueError("RADIO_LLM_API_KEY not configured")
 
         client = Anthropic(api_key=api_key)
-        now = datetime.now(ZoneInfo(config.station_tz))
+        now = datetime.now(config.station.station_zone)
 
         # Convert 24-hour to 12-hour format
         if target_hour == 0:
@@ -8,7 +8,6 @@ import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Any
-from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +61,7 @@ def select_next_tracks(
 
         # Time-based Malware Groove filtering (1 AM - 8 AM Chicago time only)
         from ai_radio.config import config
-        now = datetime.now(ZoneInfo(config.station_tz))
+        now = datetime.now(config.station.station_zone)
         hour = now.hour
 
         # Exclude Malware Grooves outside of 1 AM - 8 AM window
@@ -2,9 +2,13 @@
 
 Converts bulletin scripts into MP3 audio files for radio broadcast.
 Supports multiple TTS providers for voice comparison and selection.
+
+Output format follows the output path's suffix: ".wav" writes uncompressed
+PCM (for intermediates that are mixed and encoded later), anything else MP3.
 """
 
 import logging
+import wave
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -55,7 +59,7 @@ class OpenAIVoiceSynthesizer:
 
         Args:
             script_text: The bulletin script to synthesize
-            output_path: Path where MP3 file will be saved
+            output_path: Path where audio will be saved (.wav or .mp3)
 
         Returns:
             AudioFile with metadata, or None if synthesis fails
@@ -67,17 +71,20 @@ class OpenAIVoiceSynthesizer:
         try:
             logger.info(f"Synthesizing speech with voice '{self.voice}'")
 
-            # Call OpenAI TTS API
-            response = self.client.audio.speech.create(
+            # Call OpenAI TTS API (WAV for .wav targets: no lossy encode here
+            # when the caller re-encodes after mixing)
+            response_format = "wav" if output_path.suffix == ".wav" else self.format
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Stream chunks to disk as they arrive instead of buffering the
+            # whole body in memory first
+            with self.client.audio.speech.with_streaming_response.create(
                 model=self.model,
                 voice=self.voice,
                 input=script_text,
-                response_format=self.format,
-            )
-
-            # Write audio data to file
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            response.stream_to_file(str(output_path))
+                response_format=response_format,
+            ) as response:
+                response.stream_to_file(str(output_path))
 
             # Estimate duration (rough approximation: 150 words per minute)
             word_count = len(script_text.split())
@@ -111,8 +118,13 @@ class GeminiVoiceSynthesizer:
     Supports both Flash (low latency) and Pro (high quality) models.
     """
 
-    def __init__(self):
-        """Initialize Gemini TTS client with API key from config."""
+    def __init__(self, model_name: Optional[str] = None, voice: Optional[str] = None):
+        """Initialize Gemini TTS client with API key from config.
+
+        Args:
+            model_name: Gemini TTS model (defaults to config.gemini_tts_model)
+            voice: Prebuilt voice name (defaults to config.gemini_tts_voice)
+        """
         self.api_key = config.gemini_api_key
         if not self.api_key:
             raise ValueError("RADIO_GEMINI_API_KEY not configured")
@@ -127,8 +139,8 @@ class GeminiVoiceSynthesizer:
             raise ValueError("google-genai package not installed. Run: pip install google-genai")
 
         self.client = self.genai.Client(api_key=self.api_key)
-        self.model_name = config.gemini_tts_model
-        self.voice = config.gemini_tts_voice
+        self.model_name = model_name or config.gemini_tts_model
+        self.voice = voice or config.gemini_tts_voice
 
     def synthesize(
         self,
@@ -139,7 +151,7 @@ class GeminiVoiceSynthesizer:
 
         Args:
             script_text: The bulletin script to synthesize
-            output_path: Path where MP3 file will be saved
+            output_path: Path where audio will be saved (.wav or .mp3)
 
         Returns:
             AudioFile with metadata, or None if synthesis fails
@@ -227,44 +239,18 @@ city settling outside. That 2am energy.
                 logger.error("No audio inline_data in Gemini response")
                 return None
 
-            # Gemini returns raw PCM data - convert to MP3 using ffmpeg
-            import subprocess
-            import tempfile
-
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write raw PCM to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.pcm', delete=False) as pcm_file:
-                pcm_file.write(audio_data)
-                pcm_path = pcm_file.name
-
-            try:
-                # Convert PCM to MP3 using ffmpeg
-                # Gemini TTS outputs 24kHz 16-bit mono PCM
-                result = subprocess.run(
-                    [
-                        "ffmpeg",
-                        "-y",  # Overwrite output file
-                        "-f", "s16le",  # Format: signed 16-bit little-endian
-                        "-ar", "24000",  # Sample rate: 24kHz
-                        "-ac", "1",  # Audio channels: mono
-                        "-i", pcm_path,  # Input PCM file
-                        "-c:a", "libmp3lame",
-                        "-q:a", "2",  # High quality MP3
-                        str(output_path),
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-
-                if result.returncode != 0:
-                    logger.error(f"ffmpeg PCM conversion failed: {result.stderr}")
-                    return None
-
-            finally:
-                # Clean up temp PCM file
-                Path(pcm_path).unlink(missing_ok=True)
+            # Gemini TTS outputs 24kHz 16-bit mono PCM
+            if output_path.suffix == ".wav":
+                # Wrap the PCM in a WAV header; no ffmpeg process, no encode
+                with wave.open(str(output_path), "wb") as wav_file:
+                    wav_file.setnchannels(1)
+                    wav_file.setsampwidth(2)
+                    wav_file.setframerate(24000)
+                    wav_file.writeframes(audio_data)
+            elif not self._encode_pcm_to_mp3(audio_data, output_path):
+                return None
 
             # Estimate duration (rough approximation: 150 words per minute)
             word_count = len(script_text.split())
@@ -287,6 +273,48 @@ city settling outside. That 2am energy.
             logger.error(f"Gemini TTS error: {e}")
             return None
 
+    def _encode_pcm_to_mp3(self, audio_data: bytes, output_path: Path) -> bool:
+        """Encode Gemini's raw PCM to MP3 using ffmpeg.
+
+        Returns:
+            True if the MP3 was written
+        """
+        import subprocess
+        import tempfile
+
+        # Write raw PCM to temporary file
+        with tempfile.NamedTemporaryFile(suffix='.pcm', delete=False) as pcm_file:
+            pcm_file.write(audio_data)
+            pcm_path = pcm_file.name
+
+        try:
+            # Convert PCM to MP3 using ffmpeg
+            result = subprocess.run(
+                [
+                    "ffmpeg",
+                    "-y",  # Overwrite output file
+                    "-f", "s16le",  # Format: signed 16-bit little-endian
+                    "-ar", "24000",  # Sample rate: 24kHz
+                    "-ac", "1",  # Audio channels: mono
+                    "-i", pcm_path,  # Input PCM file
+                    "-c:a", "libmp3lame",
+                    "-q:a", "2",  # High quality MP3
+                    str(output_path),
+                ],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+
+            if result.returncode != 0:
+                logger.error(f"ffmpeg PCM conversion failed: {result.stderr}")
+                return False
+            return True
+
+        finally:
+            # Clean up temp PCM file
+            Path(pcm_path).unlink(missing_ok=True)
+
 
 def synthesize_bulletin(
     script_text: str,
@@ -302,7 +330,7 @@ def synthesize_bulletin(
 
     Args:
         script_text: Script text to convert to speech
-        output_path: Path for output MP3 file
+        output_path: Path for output audio (.wav for uncompressed, else MP3)
 
     Returns:
         AudioFile or None if synthesis fails
@@ -319,22 +347,13 @@ def synthesize_bulletin(
         try:
             logger.info(f"Attempting Gemini TTS: {model_name} with voice {voice}")
 
-            # Temporarily override config for this attempt
-            original_model = config.gemini_tts_model
-            original_voice = config.gemini_tts_voice
-            config.gemini_tts_model = model_name
-            config.gemini_tts_voice = voice
-
-            try:
-                synthesizer = GeminiVoiceSynthesizer()
-                result = synthesizer.synthesize(script_text, output_path)
-                if result:
-                    logger.info(f"✓ Gemini {model_name} succeeded")
-                    return result
-            finally:
-                # Restore original config
-                config.gemini_tts_model = original_model
-                config.gemini_tts_voice = original_voice
+            # Pass model/voice explicitly rather than mutating the shared
+            # config, so concurrent syntheses can't clobber each other
+            synthesizer = GeminiVoiceSynthesizer(model_name=model_name, voice=voice)
+            result = synthesizer.synthesize(script_text, output_path)
+            if result:
+                logger.info(f"✓ Gemini {model_name} succeeded")
+                return result
 
         except Exception as e:
             if is_quota_error(e):
@@ -1,9 +1,19 @@
 """Tests for backward compatibility property shims."""
 import warnings
 import pytest
+from pydantic import ValidationError
+from ai_radio.config import base
 from ai_radio.config.base import RadioConfig
 
 
+@pytest.fixture(autouse=True)
+def reset_shim_warnings():
+    """Shims warn once per process; start each test with none warned."""
+    base._WARNED.clear()
+    yield
+    base._WARNED.clear()
+
+
 class TestBackwardCompatibility:
     """Tests for deprecated property shims."""
 
@@ -68,3 +78,25 @@ class TestBackwardCompatibility:
             # Should have 3 warnings
             assert len(w) == 3
             assert all(issubclass(warning.category, DeprecationWarning) for warning in w)
+
+    def test_shim_warns_only_once(self):
+        """Repeat access to the same shim should not warn again."""
+        config = RadioConfig()
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+
+            _ = config.station_name
+            _ = config.station_name
+            _ = config.station_name
+
+            assert len(w) == 1
+
+    def test_shims_are_read_only(self):
+        """Assigning through a shim should fail: the config is frozen."""
+        config = RadioConfig()
+
+        with pytest.raises(ValidationError):
+            config.gemini_tts_model = "other-model"
+
+        assert config.tts.gemini_tts_model != "other-model"
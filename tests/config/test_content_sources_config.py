@@ -64,6 +64,16 @@ class TestContentSourcesConfig:
             config = ContentSourcesConfig(_env_file=None)
             assert config.news_rss_feeds == feeds
 
+    def test_news_rss_feeds_from_env_not_shared(self):
+        """Test that the cached JSON decode is not shared between instances."""
+        feeds = {"tech": ["https://example.com/tech.xml"]}
+        import json
+        with patch.dict(os.environ, {"RADIO_NEWS_RSS_FEEDS": json.dumps(feeds)}):
+            config1 = ContentSourcesConfig(_env_file=None)
+            config1.news_rss_feeds["tech"].append("https://example.com/other.xml")
+            config2 = ContentSourcesConfig(_env_file=None)
+            assert config2.news_rss_feeds == feeds
+
     def test_news_rss_feeds_immutable_default(self):
         """Test that news_rss_feeds default is not shared between instances."""
         config1 = ContentSourcesConfig(_env_file=None)
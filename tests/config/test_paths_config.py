@@ -99,3 +99,14 @@ class TestPathsConfig:
         """liquidsoap_sock_path should be hardcoded (not derived)."""
         paths = PathsConfig(base_path=Path("/custom/radio"))
         assert paths.liquidsoap_sock_path == Path("/run/liquidsoap/radio.sock")
+
+    def test_derived_export_sock_path(self):
+        """export_sock_path should be hardcoded (not derived)."""
+        paths = PathsConfig(base_path=Path("/custom/radio"))
+        assert paths.export_sock_path == Path("/run/ai_radio/export.sock")
+
+    def test_derived_paths_are_cached(self):
+        """Derived paths should be built once per instance."""
+        paths = PathsConfig(base_path=Path("/custom/radio"))
+        assert paths.breaks_archive_path is paths.breaks_archive_path
+        assert paths.db_path is paths.db_path
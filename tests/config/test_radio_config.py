@@ -1,5 +1,8 @@
 """Tests for RadioConfig - composition root."""
+import os
+
 import pytest
+from pydantic import ValidationError
 from ai_radio.config.base import RadioConfig
 from ai_radio.config.paths import PathsConfig
 from ai_radio.config.api_keys import APIKeysConfig
@@ -80,6 +83,100 @@ class TestRadioConfigComposition:
         assert config.icecast_url == "http://localhost:8000"
         assert isinstance(config.icecast_admin_password, str)
 
+    def test_icecast_admin_password_resolved_once(self, monkeypatch):
+        """icecast_admin_password should be looked up once per config."""
+        monkeypatch.setenv("ICECAST_ADMIN_PASSWORD", "hackme")
+        config = RadioConfig(_env_file=None)
+        assert config.icecast_admin_password == "hackme"
+
+        monkeypatch.setenv("ICECAST_ADMIN_PASSWORD", "changed")
+        assert config.icecast_admin_password == "hackme"
+
+    def test_icecast_admin_password_from_xml(self, tmp_path, monkeypatch):
+        """icecast_admin_password should fall back to the Icecast XML config."""
+        monkeypatch.delenv("ICECAST_ADMIN_PASSWORD", raising=False)
+        icecast_xml = tmp_path / "icecast.xml"
+        icecast_xml.write_text(
+            "<icecast><authentication>"
+            "<source-password>src</source-password>"
+            "<admin-password>from-xml</admin-password>"
+            "</authentication></icecast>"
+        )
+        monkeypatch.setattr("ai_radio.config.base._ICECAST_CONFIG", icecast_xml)
+
+        config = RadioConfig(_env_file=None)
+
+        assert config.icecast_admin_password == "from-xml"
+
+    def test_icecast_admin_password_only_under_authentication(self, tmp_path, monkeypatch):
+        """An admin-password outside <authentication> should be ignored."""
+        monkeypatch.delenv("ICECAST_ADMIN_PASSWORD", raising=False)
+        icecast_xml = tmp_path / "icecast.xml"
+        icecast_xml.write_text(
+            "<icecast>"
+            "<mount><admin-password>wrong</admin-password></mount>"
+            "<authentication><admin-password>right</admin-password></authentication>"
+            "</icecast>"
+        )
+        monkeypatch.setattr("ai_radio.config.base._ICECAST_CONFIG", icecast_xml)
+
+        config = RadioConfig(_env_file=None)
+
+        assert config.icecast_admin_password == "right"
+
+    def test_config_is_read_only(self):
+        """RadioConfig and its domain configs should reject assignment after load."""
+        config = RadioConfig(_env_file=None)
+        with pytest.raises(ValidationError):
+            config.llm_model = "other"
+        with pytest.raises(ValidationError):
+            config.paths.base_path = "/elsewhere"
+
+    def test_load_reads_env_file_into_domains(self, tmp_path, monkeypatch):
+        """load() should parse .env once and feed every domain from os.environ."""
+        env_file = tmp_path / "radio.env"
+        env_file.write_text(
+            "RADIO_STATION_NAME=Env File FM\n"
+            "RADIO_LLM_MODEL=from-env-file\n"
+            "RADIO_BED_VOLUME_DB=-12\n"
+        )
+        monkeypatch.setenv("RADIO_ENV_FILE", str(env_file))
+        monkeypatch.setenv("RADIO_BED_VOLUME_DB", "-20")
+        monkeypatch.delenv("RADIO_STATION_NAME", raising=False)
+        monkeypatch.delenv("RADIO_LLM_MODEL", raising=False)
+
+        config = RadioConfig.load()
+
+        assert config.station.station_name == "Env File FM"
+        assert config.llm_model == "from-env-file"
+        # Variables already in the environment win over the file
+        assert config.audio.bed_volume_db == -20
+        # The file's values are not copied into the process environment
+        assert "RADIO_STATION_NAME" not in os.environ
+        assert "RADIO_LLM_MODEL" not in os.environ
+
+    def test_load_values_not_visible_to_later_configs(self, tmp_path, monkeypatch):
+        """.env values parsed by load() apply only to the config it builds."""
+        env_file = tmp_path / "radio.env"
+        env_file.write_text("RADIO_LLM_MODEL=from-env-file\n")
+        monkeypatch.setenv("RADIO_ENV_FILE", str(env_file))
+        monkeypatch.delenv("RADIO_LLM_MODEL", raising=False)
+
+        RadioConfig.load()
+
+        assert RadioConfig(_env_file=None).llm_model == "claude-3-5-sonnet-latest"
+
+    def test_load_skips_env_file_when_unset(self, tmp_path, monkeypatch):
+        """RADIO_ENV_FILE='' should skip .env entirely."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".env").write_text("RADIO_LLM_MODEL=from-env-file\n")
+        monkeypatch.setenv("RADIO_ENV_FILE", "")
+        monkeypatch.delenv("RADIO_LLM_MODEL", raising=False)
+
+        config = RadioConfig.load()
+
+        assert config.llm_model == "claude-3-5-sonnet-latest"
+
 
 class TestConfigPackageExports:
     """Tests for config package __init__.py exports."""
@@ -42,6 +42,13 @@ class TestStationIdentityConfig:
         station = StationIdentityConfig(_env_file=None)
         assert station.station_tz == "America/New_York"
 
+    def test_station_zone_resolved_once(self, monkeypatch):
+        """station_zone should parse station_tz once and reuse it."""
+        monkeypatch.setenv("RADIO_STATION_TZ", "America/New_York")
+        station = StationIdentityConfig(_env_file=None)
+        assert station.station_zone.key == "America/New_York"
+        assert station.station_zone is station.station_zone
+
     def test_default_station_lat_none(self):
         """station_lat should default to None."""
         station = StationIdentityConfig(_env_file=None)
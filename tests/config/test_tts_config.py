@@ -1,5 +1,8 @@
 """Tests for TTS (text-to-speech) configuration."""
 
+import pytest
+from pydantic import ValidationError
+
 from ai_radio.config.tts import TTSConfig
 
 
@@ -36,6 +39,12 @@ class TestTTSConfigEnvironment:
         config = TTSConfig()
         assert config.tts_provider == "openai"
 
+    def test_tts_provider_rejects_unknown_provider(self, monkeypatch):
+        """Test an unknown tts_provider fails at load instead of falling back silently."""
+        monkeypatch.setenv("RADIO_TTS_PROVIDER", "elevenlabs")
+        with pytest.raises(ValidationError):
+            TTSConfig()
+
     def test_gemini_tts_model_from_env(self, monkeypatch):
         """Test gemini_tts_model can be overridden via environment variable."""
         monkeypatch.setenv("RADIO_GEMINI_TTS_MODEL", "gemini-2.5-flash-preview-tts")
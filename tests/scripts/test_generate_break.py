@@ -0,0 +1,33 @@
+"""Tests for the generate_break.py service script exit codes."""
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add paths for imports
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+# Load the generate_break script
+script_path = repo_root / "scripts" / "generate_break.py"
+spec = importlib.util.spec_from_file_location("generate_break_script", script_path)
+generate_break_script = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(generate_break_script)
+
+from ai_radio.break_generator import BreakGenerationInProgress
+
+
+def test_main_exits_zero_when_run_in_progress():
+    """An overlapping timer run is skipped, not reported as a failure."""
+    with patch.object(
+        generate_break_script,
+        "generate_break",
+        side_effect=BreakGenerationInProgress("generate.lock"),
+    ):
+        assert generate_break_script.main() == 0
+
+
+def test_main_exits_one_when_generation_fails():
+    """A real generation failure still fails loudly for systemd alerting."""
+    with patch.object(generate_break_script, "generate_break", return_value=None):
+        assert generate_break_script.main() == 1
@@ -1,9 +1,15 @@
 """Tests for audio metadata extraction."""
 
+import hashlib
+import json
+from unittest.mock import Mock, patch
+
 import pytest
 from pathlib import Path
 
-from ai_radio.audio import extract_metadata, AudioMetadata, normalize_audio
+from ai_radio import audio as audio_module
+from ai_radio.audio import extract_metadata, AudioMetadata, measure_loudness, normalize_audio, parse_loudness_stats
+from ai_radio.config import config
 
 
 def test_extract_metadata_from_test_track():
@@ -43,6 +49,121 @@ def test_sha256_id_generation():
     assert len(sha1) == 64  # SHA256 is 64 hex characters
 
 
+@pytest.mark.parametrize("size", [0, 1024, (1 << 20) + 17])
+def test_sha256_id_matches_hashlib(tmp_path, size):
+    """sha256_id matches hashlib for both the small-read and mmap paths."""
+    data = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+    audio_file = tmp_path / "track.mp3"
+    audio_file.write_bytes(data)
+
+    metadata = AudioMetadata(path=audio_file)
+
+    assert metadata.sha256_id == hashlib.sha256(data).hexdigest()
+
+
+def test_sha256_id_falls_back_when_mmap_unavailable(tmp_path, monkeypatch):
+    """sha256_id still hashes files that cannot be memory-mapped."""
+    data = b"\xff" * ((1 << 20) + 1)
+    audio_file = tmp_path / "track.mp3"
+    audio_file.write_bytes(data)
+
+    def no_mmap(*args, **kwargs):
+        raise OSError("mmap not supported")
+
+    monkeypatch.setattr("ai_radio.audio.mmap.mmap", no_mmap)
+    metadata = AudioMetadata(path=audio_file)
+
+    assert metadata.sha256_id == hashlib.sha256(data).hexdigest()
+
+
+def test_sha256_id_advises_sequential_read_for_large_files(tmp_path):
+    """Large files get read-ahead hints before the full hash."""
+    if not hasattr(audio_module.os, "posix_fadvise"):
+        pytest.skip("posix_fadvise not available")
+    data = b"\x01" * ((1 << 20) + 3)
+    audio_file = tmp_path / "track.mp3"
+    audio_file.write_bytes(data)
+
+    with patch.object(audio_module.os, "posix_fadvise") as mock_fadvise:
+        digest = AudioMetadata(path=audio_file).sha256_id
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    advice = [call.args[3] for call in mock_fadvise.call_args_list]
+    assert advice == [audio_module.os.POSIX_FADV_SEQUENTIAL, audio_module.os.POSIX_FADV_WILLNEED]
+
+
+def test_sha256_id_rehashes_modified_file(tmp_path):
+    """A changed file gets a new digest despite the digest cache."""
+    audio_file = tmp_path / "track.mp3"
+    audio_file.write_bytes(b"first")
+    first = AudioMetadata(path=audio_file).sha256_id
+
+    audio_file.write_bytes(b"second take")
+
+    assert AudioMetadata(path=audio_file).sha256_id == hashlib.sha256(b"second take").hexdigest()
+    assert first == hashlib.sha256(b"first").hexdigest()
+
+
+def test_sha256_id_served_from_persistent_hash_cache(tmp_path, monkeypatch):
+    """A fresh process reuses digests saved in the fingerprint cache."""
+    audio_file = tmp_path / "track.mp3"
+    audio_file.write_bytes(b"\x00" * 10000)
+    cache_file = tmp_path / "hash_cache.json"
+
+    cache = audio_module._HashCache(cache_file)
+    monkeypatch.setattr(audio_module, "_hash_cache", cache)
+    expected = AudioMetadata(path=audio_file).sha256_id
+    cache.flush()
+    assert cache_file.exists()
+
+    # Simulate a new process: empty in-memory caches, cache loaded from disk
+    audio_module._hash_path.cache_clear()
+    monkeypatch.setattr(audio_module, "_hash_cache", audio_module._HashCache(cache_file))
+    with patch.object(audio_module, "_hash_file", side_effect=AssertionError("full hash")):
+        assert AudioMetadata(path=audio_file).sha256_id == expected
+
+
+def test_hash_cache_ignores_corrupt_file(tmp_path):
+    """A corrupt cache file is treated as empty rather than failing the scan."""
+    cache_file = tmp_path / "hash_cache.json"
+    cache_file.write_text("{not json")
+
+    cache = audio_module._HashCache(cache_file)
+
+    assert cache.get("1:2:abc") is None
+
+
+def test_hash_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    """The fingerprint cache stays bounded, dropping the least recently used entry."""
+    monkeypatch.setattr(audio_module._HashCache, "MAX_ENTRIES", 2)
+    cache_file = tmp_path / "hash_cache.json"
+    cache = audio_module._HashCache(cache_file)
+
+    cache.put("a", "digest-a")
+    cache.put("b", "digest-b")
+    assert cache.get("a") == "digest-a"  # "b" is now least recently used
+    cache.put("c", "digest-c")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "digest-a"
+    assert cache.get("c") == "digest-c"
+
+    cache.flush()
+    assert len(json.loads(cache_file.read_text())) == 2
+
+
+def test_hash_cache_trims_oversized_file_on_load(tmp_path, monkeypatch):
+    """A cache file written with a larger cap is trimmed to the newest entries."""
+    monkeypatch.setattr(audio_module._HashCache, "MAX_ENTRIES", 2)
+    cache_file = tmp_path / "hash_cache.json"
+    cache_file.write_text(json.dumps({"old": "1", "mid": "2", "new": "3"}))
+
+    cache = audio_module._HashCache(cache_file)
+
+    assert cache.get("old") is None
+    assert cache.get("new") == "3"
+
+
 def test_metadata_defaults_for_missing_tags():
     """Test that missing metadata tags use sensible defaults."""
     test_file = Path("/srv/ai_radio/assets/source_music/test_track.mp3")
@@ -177,3 +298,120 @@ def test_measure_loudness_invalid_audio(tmp_path):
 
     with pytest.raises(ValueError, match="Failed to measure loudness"):
         measure_loudness(invalid_file)
+
+
+LOUDNORM_STDERR = """size=     512kB time=00:00:30.00 bitrate= 139.8kbits/s speed=60x
+[Parsed_loudnorm_0 @ 0x55d5c8a0] 
+{
+	"input_i" : "-23.51",
+	"input_tp" : "-4.20",
+	"input_lra" : "6.30",
+	"input_thresh" : "-34.02",
+	"output_i" : "-18.04",
+	"output_tp" : "-1.02",
+	"output_lra" : "5.10",
+	"output_thresh" : "-28.50",
+	"normalization_type" : "dynamic",
+	"target_offset" : "0.04"
+}
+"""
+
+
+def test_normalize_audio_single_pass_parses_loudnorm_json(tmp_path):
+    """normalize_audio should run one ffmpeg loudnorm pass and read its JSON stats."""
+    input_file = tmp_path / "in.mp3"
+    input_file.write_bytes(b"fake audio")
+    output_file = tmp_path / "out.mp3"
+
+    completed = Mock(stdout="", stderr=LOUDNORM_STDERR)
+    with patch("ai_radio.audio.subprocess.run", return_value=completed) as mock_run, \
+            patch("ai_radio.audio.set_artist_metadata"):
+        result = normalize_audio(input_file, output_file)
+
+    cmd = mock_run.call_args[0][0]
+    assert cmd[0] == "ffmpeg"
+    assert "loudnorm=I=-18.0:TP=-1.0:LRA=11:print_format=json" in cmd
+    assert result == {"loudness_lufs": -18.04, "true_peak_dbtp": -1.02}
+
+
+def test_normalize_audio_single_pass_tags_artist_inline(tmp_path):
+    """The single-pass path should tag the artist in ffmpeg, not re-open the file."""
+    input_file = tmp_path / "in.mp3"
+    input_file.write_bytes(b"fake audio")
+
+    completed = Mock(stdout="", stderr=LOUDNORM_STDERR)
+    with patch("ai_radio.audio.subprocess.run", return_value=completed) as mock_run, \
+            patch("ai_radio.audio.set_artist_metadata") as mock_tag:
+        normalize_audio(input_file, tmp_path / "out.mp3")
+
+    cmd = mock_run.call_args[0][0]
+    assert cmd[cmd.index("-metadata") + 1] == f"artist={config.audio.music_artist}"
+    mock_tag.assert_not_called()
+
+
+def test_normalize_audio_two_pass_uses_ffmpeg_normalize(tmp_path):
+    """normalize_audio(two_pass=True) should keep the ffmpeg-normalize pipeline."""
+    input_file = tmp_path / "in.mp3"
+    input_file.write_bytes(b"fake audio")
+
+    completed = Mock(stdout='"output_i": -18.1,\n"output_tp": -1.3,', stderr="")
+    with patch("ai_radio.audio.subprocess.run", return_value=completed) as mock_run, \
+            patch("ai_radio.audio.set_artist_metadata"):
+        result = normalize_audio(input_file, tmp_path / "out.mp3", two_pass=True)
+
+    assert mock_run.call_args[0][0][0] == "ffmpeg-normalize"
+    assert result == {"loudness_lufs": -18.1, "true_peak_dbtp": -1.3}
+
+
+def test_measure_loudness_parses_print_stats(tmp_path):
+    """measure_loudness should read input stats from ffmpeg-normalize output."""
+    input_file = tmp_path / "in.mp3"
+    input_file.write_bytes(b"fake audio")
+
+    stats = '[{"input_file": "in.mp3", "ebu_pass1": {"input_i": -21.7, "input_tp": -3.25,\n"output_i": -18.0}}]'
+    completed = Mock(stdout="", stderr=stats)
+    with patch("ai_radio.audio.subprocess.run", return_value=completed):
+        result = measure_loudness(input_file)
+
+    assert result == {"loudness_lufs": -21.7, "true_peak_dbtp": -3.25}
+
+
+SILENT_LOUDNORM_STDERR = """[Parsed_loudnorm_0 @ 0x55d5c8a0] 
+{
+	"input_i" : "-inf",
+	"input_tp" : "-inf",
+	"output_i" : "-inf",
+	"output_tp" : "-inf",
+	"normalization_type" : "dynamic"
+}
+"""
+
+
+def test_parse_loudness_stats_drops_non_finite():
+    """Silent input reports -inf, which should be treated as missing."""
+    assert parse_loudness_stats(SILENT_LOUDNORM_STDERR) == {}
+    assert parse_loudness_stats('"input_i": -20.5, "input_tp": inf') == {"input_i": -20.5}
+
+
+def test_normalize_audio_silent_input_falls_back_to_target(tmp_path):
+    """normalize_audio should report the targets, not -inf, for silent input."""
+    input_file = tmp_path / "silence.mp3"
+    input_file.write_bytes(b"fake audio")
+
+    completed = Mock(stdout="", stderr=SILENT_LOUDNORM_STDERR)
+    with patch("ai_radio.audio.subprocess.run", return_value=completed), \
+            patch("ai_radio.audio.set_artist_metadata"):
+        result = normalize_audio(input_file, tmp_path / "out.mp3")
+
+    assert result == {"loudness_lufs": -18.0, "true_peak_dbtp": -1.0}
+
+
+def test_measure_loudness_silent_input_raises(tmp_path):
+    """measure_loudness should reject -inf stats instead of returning them."""
+    input_file = tmp_path / "silence.mp3"
+    input_file.write_bytes(b"fake audio")
+
+    completed = Mock(stdout="", stderr=SILENT_LOUDNORM_STDERR)
+    with patch("ai_radio.audio.subprocess.run", return_value=completed):
+        with pytest.raises(ValueError, match="finite"):
+            measure_loudness(input_file)
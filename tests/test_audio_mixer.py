@@ -16,9 +16,17 @@ import subprocess
 
 import pytest
 
-from ai_radio.audio_mixer import AudioMixer, MixedAudio, mix_voice_with_bed
+from ai_radio.audio_mixer import AudioMixer, MixedAudio, mix_voice_with_bed, prepare_bed
 
 
+@pytest.fixture
+def no_bed_cache():
+    """Mix straight from the bed file so ffmpeg calls are just probe + mix."""
+    with patch.object(AudioMixer, "_ensure_bed_raw", return_value=None):
+        yield
+
+
+@pytest.mark.usefixtures("no_bed_cache")
 class TestAudioMixer:
     """Tests for AudioMixer."""
 
@@ -78,6 +86,31 @@ class TestAudioMixer:
             assert result.voice_file == voice_path
             assert result.bed_file == bed_path
 
+    def test_mix_with_bed_return_stats(self, tmp_path):
+        """mix_with_bed(return_stats=True) should report loudnorm's output stats."""
+        voice_path = tmp_path / "voice.mp3"
+        bed_path = tmp_path / "bed.mp3"
+        output_path = tmp_path / "mixed.mp3"
+        voice_path.write_bytes(b"fake voice audio")
+        bed_path.write_bytes(b"fake bed audio")
+
+        mixer = AudioMixer()
+
+        with patch("subprocess.run") as mock_run:
+            mock_probe_result = Mock(returncode=0, stdout="45.5")
+            mock_ffmpeg_result = Mock(
+                returncode=0,
+                stderr='{\n\t"input_i" : "-24.10",\n\t"output_i" : "-18.02",\n\t"output_tp" : "-1.05"\n}\n',
+            )
+            mock_run.side_effect = [mock_probe_result, mock_ffmpeg_result]
+
+            result = mixer.mix_with_bed(voice_path, bed_path, output_path, return_stats=True)
+
+            filter_complex = " ".join(mock_run.call_args_list[1][0][0])
+            assert "print_format=json" in filter_complex
+            assert result.loudness_lufs == -18.02
+            assert result.true_peak_dbtp == -1.05
+
     def test_mix_with_bed_missing_voice(self, tmp_path):
         """mix_with_bed should return None if voice file missing."""
         voice_path = tmp_path / "missing.mp3"
@@ -241,6 +274,40 @@ class TestAudioMixer:
             assert "ffprobe" in cmd
             assert str(audio_path) in cmd
 
+    def test_get_audio_duration_cached_until_file_changes(self, tmp_path):
+        """get_audio_duration should reuse the probe result for an unchanged file."""
+        audio_path = tmp_path / "test.mp3"
+        audio_path.write_bytes(b"fake audio")
+
+        mixer = AudioMixer()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="12.5")
+
+            assert mixer.get_audio_duration(audio_path) == 12.5
+            assert mixer.get_audio_duration(audio_path) == 12.5
+            assert mock_run.call_count == 1
+
+            audio_path.write_bytes(b"longer fake audio")
+            mock_run.return_value = Mock(returncode=0, stdout="30.0")
+
+            assert mixer.get_audio_duration(audio_path) == 30.0
+            assert mock_run.call_count == 2
+
+    def test_get_audio_duration_reads_mp3_headers_without_ffprobe(self, tmp_path):
+        """get_audio_duration should read MP3 duration in-process via mutagen."""
+        # 100 silent MPEG-1 Layer III frames (128 kbps, 44.1 kHz, 417 bytes each)
+        audio_path = tmp_path / "frames.mp3"
+        audio_path.write_bytes((b"\xff\xfb\x90\x64" + b"\x00" * 413) * 100)
+
+        mixer = AudioMixer()
+
+        with patch("subprocess.run") as mock_run:
+            duration = mixer.get_audio_duration(audio_path)
+
+            assert duration == pytest.approx(100 * 1152 / 44100, abs=0.05)
+            mock_run.assert_not_called()
+
     def test_get_audio_duration_missing_file(self, tmp_path):
         """get_audio_duration should return None for missing files."""
         audio_path = tmp_path / "missing.mp3"
@@ -268,6 +335,76 @@ class TestAudioMixer:
             assert duration is None
 
 
+class TestBedCache:
+    """Tests for the decoded-bed PCM cache."""
+
+    def test_bed_decoded_once_and_fed_as_raw(self, tmp_path):
+        """The bed should be decoded on first mix and reused as raw PCM afterwards."""
+        voice_path = tmp_path / "voice.mp3"
+        bed_path = tmp_path / "bed.mp3"
+        voice_path.write_bytes(b"fake voice audio")
+        bed_path.write_bytes(b"fake bed audio")
+
+        mixer = AudioMixer()
+        mixer.bed_cache_path = tmp_path / "bed_cache"
+
+        def fake_run(cmd, **kwargs):
+            if cmd[0] == "ffprobe":
+                return Mock(returncode=0, stdout="10.0", stderr="")
+            Path(cmd[-1]).write_bytes(b"pcm")
+            return Mock(returncode=0, stdout="", stderr="")
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            mixer.mix_with_bed(voice_path, bed_path, tmp_path / "out1.mp3")
+            mixer.mix_with_bed(voice_path, bed_path, tmp_path / "out2.mp3")
+
+        ffmpeg_cmds = [c[0][0] for c in mock_run.call_args_list if c[0][0][0] == "ffmpeg"]
+        decodes = [cmd for cmd in ffmpeg_cmds if "-filter_complex" not in cmd]
+        mixes = [cmd for cmd in ffmpeg_cmds if "-filter_complex" in cmd]
+
+        assert len(decodes) == 1
+        assert len(mixes) == 2
+        raw_files = list((tmp_path / "bed_cache").glob("bed.*.raw"))
+        assert len(raw_files) == 1
+
+        for cmd in mixes:
+            assert str(raw_files[0]) in cmd
+            assert str(bed_path) not in cmd
+            assert "s16le" in cmd
+
+    def test_prepare_bed_warms_cache(self, tmp_path):
+        """prepare_bed should decode the bed so the next mix reuses it."""
+        bed_path = tmp_path / "bed.mp3"
+        bed_path.write_bytes(b"fake bed audio")
+
+        def fake_run(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"pcm")
+            return Mock(returncode=0, stdout="", stderr="")
+
+        with patch("ai_radio.audio_mixer.config") as mock_config, \
+             patch("subprocess.run", side_effect=fake_run) as mock_run:
+            mock_config.paths.tmp_path = tmp_path
+            raw_path = prepare_bed(bed_path)
+            assert prepare_bed(bed_path) == raw_path
+
+        assert mock_run.call_count == 1
+        assert raw_path.parent == tmp_path / "bed_cache"
+        assert raw_path.read_bytes() == b"pcm"
+
+    def test_bed_decode_failure_falls_back_to_bed_file(self, tmp_path):
+        """A failed decode should mix directly from the bed file."""
+        bed_path = tmp_path / "bed.mp3"
+        bed_path.write_bytes(b"fake bed audio")
+
+        mixer = AudioMixer()
+        mixer.bed_cache_path = tmp_path / "bed_cache"
+
+        with patch("subprocess.run", return_value=Mock(returncode=1, stderr="bad input")):
+            assert mixer._ensure_bed_raw(bed_path) is None
+
+        assert list((tmp_path / "bed_cache").iterdir()) == []
+
+
 class TestMixVoiceWithBedConvenience:
     """Tests for mix_voice_with_bed() convenience function."""
 
@@ -0,0 +1,46 @@
+"""Tests for concurrent ingestion in batch_ingest_assets.py."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add scripts directory to path so we can import batch_ingest_assets
+scripts_dir = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(scripts_dir))
+
+import batch_ingest_assets
+
+
+@pytest.fixture
+def bumpers(tmp_path, mocker):
+    """Three bumper files, two of them with identical content."""
+    for name in ("a.mp3", "b.mp3", "c.mp3"):
+        (tmp_path / name).write_bytes(b"x")
+    mock_cfg = MagicMock()
+    mock_cfg.paths.bumpers_path = tmp_path
+    mock_cfg.paths.db_path = tmp_path / "radio.db"
+    mocker.patch("batch_ingest_assets.config", mock_cfg)
+    mocker.patch("batch_ingest_assets.get_asset_by_path", return_value=None)
+    ids = {"a.mp3": "id-a", "b.mp3": "id-a", "c.mp3": "id-c"}
+    mocker.patch(
+        "batch_ingest_assets.extract_metadata",
+        side_effect=lambda path: MagicMock(sha256_id=ids[path.name]),
+    )
+    return tmp_path
+
+
+def test_batch_ingest_runs_workers_and_skips_duplicate_content(bumpers):
+    """Files with the same content should be ingested once; the rest all run."""
+    def fake_ingest(source_path, **kwargs):
+        if source_path.name == "c.mp3":
+            raise ValueError("boom")
+        return {"id": source_path.stem}
+
+    with patch("batch_ingest_assets.ingest_audio_file", side_effect=fake_ingest) as mock_ingest:
+        result = batch_ingest_assets.batch_ingest(bumpers, "bumper", workers=4)
+
+    ingested = sorted(call.kwargs["source_path"].name for call in mock_ingest.call_args_list)
+    assert ingested == ["a.mp3", "c.mp3"]
+    assert result == (1, 1, 1)
@@ -9,6 +9,9 @@ Test coverage:
 - Output file naming and archival
 """
 
+import os
+import re
+import threading
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch, call
@@ -16,7 +19,7 @@ import hashlib
 
 import pytest
 
-from ai_radio.break_generator import BreakGenerator, GeneratedBreak, generate_break
+from ai_radio.break_generator import BreakGenerationInProgress, BreakGenerator, GeneratedBreak, cleanup_old_temp_files, format_break_title, generate_break
 from ai_radio.weather import WeatherData
 from ai_radio.news import NewsData, NewsHeadline
 from ai_radio.script_writer import BulletinScript
@@ -25,6 +28,33 @@ from ai_radio.audio_mixer import MixedAudio
 from conftest import create_test_weather_data
 
 
+@pytest.fixture(autouse=True)
+def no_bed_prep():
+    """Don't decode beds into the real bed cache during pipeline tests."""
+    with patch("ai_radio.break_generator.prepare_bed", return_value=None) as mock_prep:
+        yield mock_prep
+
+
+@pytest.fixture(autouse=True)
+def isolated_tmp_path(tmp_path):
+    """Keep the generation lock and temp files out of the real tmp directory."""
+    original_init = BreakGenerator.__init__
+
+    def init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self.tmp_path = tmp_path / "tmp"
+
+    with patch.object(BreakGenerator, "__init__", init):
+        yield tmp_path / "tmp"
+
+
+@pytest.fixture(autouse=True)
+def no_housekeeping():
+    """Don't sweep the real tmp and breaks directories during pipeline tests."""
+    with patch.object(BreakGenerator, "_housekeeping") as mock_housekeeping:
+        yield mock_housekeeping
+
+
 class TestBreakGenerator:
     """Tests for BreakGenerator."""
 
@@ -34,9 +64,10 @@ class TestBreakGenerator:
 
         assert generator.breaks_path is not None
         assert generator.beds_path is not None
+        assert generator.archive_path == generator.breaks_path / "archive"
         assert generator.freshness_minutes == 50
 
-    def test_generate_full_pipeline_success(self, tmp_path):
+    def test_generate_full_pipeline_success(self, tmp_path, no_bed_prep):
         """generate should execute full pipeline successfully."""
         # Mock weather data
         mock_weather = create_test_weather_data(temperature=72, conditions="Sunny")
@@ -112,6 +143,11 @@ class TestBreakGenerator:
             mock_gen_bulletin.assert_called_once_with(weather=mock_weather, news=mock_news)
             mock_synthesize.assert_called_once()
             mock_mix.assert_called_once()
+            no_bed_prep.assert_called_once_with(bed_path)
+
+            # Title names the top of the next hour in station time
+            title = mock_mix.call_args.kwargs["metadata_title"]
+            assert re.fullmatch(r"\w{3} \w{3} \d{2}, \d{4} (1[0-2]|[1-9]) (AM|PM) News Break", title)
 
             # Verify result
             assert result is not None
@@ -233,6 +269,64 @@ class TestBreakGenerator:
 
             assert result is None
 
+    def test_generate_fetches_weather_and_news_concurrently(self):
+        """generate should run the weather and news fetches at the same time."""
+        # Each fetch waits for the other; sequential fetches would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(value):
+            barrier.wait()
+            return value
+
+        with patch("ai_radio.break_generator.get_weather", side_effect=lambda: fetch(None)), \
+             patch("ai_radio.break_generator.get_news", side_effect=lambda: fetch(None)):
+
+            generator = BreakGenerator()
+            result = generator.generate()
+
+            assert result is None
+            assert not barrier.broken
+
+    def test_generate_runs_housekeeping_even_when_fetch_fails(self, no_housekeeping):
+        """Housekeeping runs with the data fetch, not after a successful mix."""
+        with patch("ai_radio.break_generator.get_weather", return_value=None), \
+             patch("ai_radio.break_generator.get_news", return_value=None):
+
+            result = BreakGenerator().generate()
+
+        assert result is None
+        no_housekeeping.assert_called_once_with()
+
+    def test_generate_skips_when_already_in_progress(self, tmp_path):
+        """generate raises without fetching when another run holds the lock."""
+        with patch("ai_radio.break_generator.fasteners.InterProcessLock") as mock_lock_class, \
+             patch("ai_radio.break_generator.get_weather") as mock_get_weather:
+            mock_lock_class.return_value.acquire.return_value = False
+
+            generator = BreakGenerator()
+            generator.tmp_path = tmp_path
+            with pytest.raises(BreakGenerationInProgress):
+                generator.generate()
+
+        mock_lock_class.assert_called_once_with(tmp_path / "generate.lock")
+        mock_get_weather.assert_not_called()
+        mock_lock_class.return_value.release.assert_not_called()
+
+    def test_generate_releases_lock_after_failure(self, tmp_path):
+        """The generation lock is released even when the pipeline fails."""
+        with patch("ai_radio.break_generator.fasteners.InterProcessLock") as mock_lock_class, \
+             patch("ai_radio.break_generator.get_weather", return_value=None), \
+             patch("ai_radio.break_generator.get_news", return_value=None):
+            mock_lock_class.return_value.acquire.return_value = True
+
+            generator = BreakGenerator()
+            generator.tmp_path = tmp_path
+            result = generator.generate()
+
+        assert result is None
+        mock_lock_class.return_value.acquire.assert_called_once_with(blocking=False)
+        mock_lock_class.return_value.release.assert_called_once_with()
+
     def test_generate_script_generation_fails(self):
         """generate should return None when script generation fails."""
         mock_weather = create_test_weather_data(temperature=70, conditions="Clear")
@@ -279,6 +373,36 @@ class TestBreakGenerator:
 
             assert result is None
 
+    def test_generate_uses_unique_voice_filenames(self, tmp_path):
+        """Each generate call synthesizes to a distinct pid-tagged temp file."""
+        mock_script = BulletinScript(
+            script_text="Test",
+            word_count=1,
+            timestamp=datetime.now(),
+            includes_weather=True,
+            includes_news=False,
+        )
+
+        with patch("ai_radio.break_generator.get_weather") as mock_get_weather, \
+             patch("ai_radio.break_generator.get_news") as mock_get_news, \
+             patch("ai_radio.break_generator.generate_bulletin") as mock_gen_bulletin, \
+             patch("ai_radio.break_generator.synthesize_bulletin") as mock_synthesize:
+
+            mock_get_weather.return_value = create_test_weather_data()
+            mock_get_news.return_value = None
+            mock_gen_bulletin.return_value = mock_script
+            mock_synthesize.return_value = None
+
+            generator = BreakGenerator()
+            generator.tmp_path = tmp_path / "tmp"
+            generator.generate()
+            generator.generate()
+
+        first, second = (c.args[1] for c in mock_synthesize.call_args_list)
+        assert first != second
+        assert first.name.startswith(f"voice_{os.getpid()}_")
+        assert first.suffix == ".wav"
+
     def test_generate_mixing_fails(self, tmp_path):
         """generate should return None when audio mixing fails."""
         mock_weather = create_test_weather_data(temperature=60, conditions="Windy")
@@ -381,6 +505,88 @@ class TestBreakGenerator:
             assert bed_arg.name in ["bed1.mp3", "bed2.mp3", "bed3.mp3"]
             assert result is not None
 
+    def test_select_random_bed_ignores_non_audio_entries(self, tmp_path):
+        """_select_random_bed should only pick MP3/WAV files."""
+        beds_dir = tmp_path / "beds"
+        beds_dir.mkdir()
+        (beds_dir / "notes.txt").write_text("not a bed")
+        (beds_dir / "archive.mp3").mkdir()
+        (beds_dir / "bed1.wav").write_bytes(b"bed1")
+
+        generator = BreakGenerator()
+        generator.beds_path = beds_dir
+
+        assert generator._select_random_bed() == beds_dir / "bed1.wav"
+
+        (beds_dir / "bed1.wav").unlink()
+        assert generator._select_random_bed() is None
+
+    def test_select_random_bed_reuses_listing_until_dir_changes(self, tmp_path):
+        """The beds directory is only re-scanned when its mtime changes."""
+        beds_dir = tmp_path / "beds"
+        beds_dir.mkdir()
+        (beds_dir / "bed1.mp3").write_bytes(b"bed1")
+        os.utime(beds_dir, ns=(0, 1))  # Settled: outside the racy window
+
+        generator = BreakGenerator()
+        generator.beds_path = beds_dir
+
+        with patch("ai_radio.break_generator.os.scandir", wraps=os.scandir) as mock_scandir:
+            assert generator._select_random_bed() == beds_dir / "bed1.mp3"
+            assert generator._select_random_bed() == beds_dir / "bed1.mp3"
+            assert mock_scandir.call_count == 1
+
+            (beds_dir / "bed1.mp3").rename(beds_dir / "bed2.mp3")
+            os.utime(beds_dir, ns=(0, 2))  # Ensure a distinct dir mtime
+            assert generator._select_random_bed() == beds_dir / "bed2.mp3"
+            assert mock_scandir.call_count == 2
+
+    def test_select_random_bed_rescans_recently_modified_dir(self, tmp_path):
+        """A listing taken right after the beds dir changed isn't reused."""
+        beds_dir = tmp_path / "beds"
+        beds_dir.mkdir()
+        (beds_dir / "bed1.mp3").write_bytes(b"bed1")
+
+        generator = BreakGenerator()
+        generator.beds_path = beds_dir
+
+        with patch("ai_radio.break_generator.os.scandir", wraps=os.scandir) as mock_scandir:
+            generator._select_random_bed()
+            generator._select_random_bed()
+
+        assert mock_scandir.call_count == 2
+
+    def test_archive_old_breaks(self, tmp_path):
+        """Overflow breaks are archived; the oldest beyond archive_keep are deleted."""
+        breaks_dir = tmp_path / "breaks"
+        archive_dir = breaks_dir / "archive"
+        archive_dir.mkdir(parents=True)
+        now = datetime.now().timestamp()
+
+        def make_break(directory, name, age_minutes):
+            path = directory / name
+            path.write_bytes(b"audio")
+            mtime = now - age_minutes * 60
+            os.utime(path, (mtime, mtime))
+            return path
+
+        active = [make_break(breaks_dir, f"break_a{i}.mp3", age_minutes=i * 10) for i in range(5)]
+        archived = [make_break(archive_dir, f"break_z{i}.mp3", age_minutes=35 + i * 10) for i in range(3)]
+
+        generator = BreakGenerator()
+        generator.breaks_path = breaks_dir
+        generator.archive_path = archive_dir
+        generator._archive_old_breaks(keep=2, archive_keep=4)
+
+        # Newest two stay active
+        assert sorted(p.name for p in breaks_dir.glob("break_*.mp3")) == ["break_a0.mp3", "break_a1.mp3"]
+        # Archive keeps the four newest of a2-a4 (20-40 min) and z0-z2 (35-55 min)
+        assert sorted(p.name for p in archive_dir.glob("break_*.mp3")) == [
+            "break_a2.mp3", "break_a3.mp3", "break_a4.mp3", "break_z0.mp3",
+        ]
+        assert not archived[1].exists() and not archived[2].exists()
+        assert not active[2].exists()
+
 
 class TestGenerateBreakConvenience:
     """Tests for generate_break() convenience function."""
@@ -415,3 +621,55 @@ class TestGenerateBreakConvenience:
             result = generate_break()
 
             assert result is None
+
+
+class TestFormatBreakTitle:
+    """Tests for format_break_title()."""
+
+    @pytest.mark.parametrize(
+        "hour,expected",
+        [
+            (0, "Tue Dec 30, 2025 12 AM News Break"),
+            (9, "Tue Dec 30, 2025 9 AM News Break"),
+            (12, "Tue Dec 30, 2025 12 PM News Break"),
+            (16, "Tue Dec 30, 2025 4 PM News Break"),
+        ],
+    )
+    def test_formats_hour_only(self, hour, expected):
+        """Titles show the 12-hour clock hour without minutes."""
+        assert format_break_title(datetime(2025, 12, 30, hour)) == expected
+
+    def test_memoizes_per_hour(self):
+        """Repeated calls for the same hour hit the cache."""
+        format_break_title.cache_clear()
+        first = format_break_title(datetime(2025, 12, 30, 16))
+        second = format_break_title(datetime(2025, 12, 30, 16))
+
+        assert first is second
+        assert format_break_title.cache_info().hits == 1
+
+
+class TestCleanupOldTempFiles:
+    """Tests for cleanup_old_temp_files()."""
+
+    def test_removes_only_old_voice_files(self, tmp_path):
+        """Old voice_*.wav/.mp3 files are deleted; fresh and unrelated files stay."""
+        old_wav = tmp_path / "voice_20260101_000000.wav"
+        old_mp3 = tmp_path / "voice_20260101_000001.mp3"
+        fresh_wav = tmp_path / "voice_20260101_000002.wav"
+        other = tmp_path / "bed_cache.raw"
+        for path in (old_wav, old_mp3, fresh_wav, other):
+            path.write_bytes(b"data")
+        old = datetime.now().timestamp() - 2 * 3600
+        for path in (old_wav, old_mp3, other):
+            os.utime(path, (old, old))
+
+        with patch("ai_radio.break_generator.config") as mock_config:
+            mock_config.paths.tmp_path = tmp_path
+            cleaned = cleanup_old_temp_files(max_age_minutes=60)
+
+        assert cleaned == 2
+        assert not old_wav.exists()
+        assert not old_mp3.exists()
+        assert fresh_wav.exists()
+        assert other.exists()
@@ -0,0 +1,36 @@
+"""Tests for SQLite connection helpers."""
+
+import pytest
+
+from ai_radio.db import connect, transaction
+
+
+def test_connect_enables_wal_and_busy_timeout(tmp_path):
+    """connect() should apply the tuned PRAGMAs to the connection."""
+    conn = connect(tmp_path / "radio.sqlite3")
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    finally:
+        conn.close()
+
+
+def test_transaction_commits_and_rolls_back(tmp_path):
+    """transaction() should commit on success and roll back on error."""
+    conn = connect(tmp_path / "radio.sqlite3")
+    try:
+        conn.execute("CREATE TABLE t (v INTEGER)")
+
+        with transaction(conn):
+            conn.execute("INSERT INTO t VALUES (1)")
+
+        with pytest.raises(RuntimeError):
+            with transaction(conn):
+                conn.execute("INSERT INTO t VALUES (2)")
+                raise RuntimeError("boom")
+
+        assert conn.execute("SELECT v FROM t").fetchall() == [(1,)]
+        assert not conn.in_transaction
+    finally:
+        conn.close()
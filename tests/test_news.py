@@ -7,8 +7,12 @@ Test coverage:
 - Feed parsing error handling
 - Empty feed handling
 - Network error handling
+- Concurrent feed fetching
+- Conditional requests against the saved feed cache
 """
 
+import json
+import threading
 from datetime import datetime
 from unittest.mock import Mock, patch
 from time import struct_time
@@ -109,6 +113,11 @@ class TestRSSNewsClient:
             assert news is not None
             assert len(news.headlines) >= 1
 
+            # Every feed is fetched through one pooled client
+            feed_count = sum(len(urls) for urls in client.categorized_feeds.values())
+            assert mock_client_class.call_count == 1
+            assert mock_client.get.call_count == feed_count
+
     def test_fetch_headlines_deduplication(self):
         """fetch_headlines should handle category-based selection."""
         client = RSSNewsClient()
@@ -150,7 +159,7 @@ class TestRSSNewsClient:
             assert news is not None
             assert len(news.headlines) >= 1
 
-    def test_fetch_headlines_parsing_error(self):
+    def test_fetch_headlines_parsing_error(self, tmp_path):
         """fetch_headlines should skip feeds with parsing errors."""
         # Mock config with multiple feeds so that one can fail and others succeed
         with patch("ai_radio.news.config") as mock_config:
@@ -161,6 +170,7 @@ class TestRSSNewsClient:
                 ],
             }
             mock_config.hallucinate_news = False
+            mock_config.paths.feed_cache_path = tmp_path / "feed_cache.json"
 
             client = RSSNewsClient()
 
@@ -199,7 +209,7 @@ class TestRSSNewsClient:
                 assert news is not None
                 assert len(news.headlines) >= 1
 
-    def test_fetch_headlines_empty_feed(self):
+    def test_fetch_headlines_empty_feed(self, tmp_path):
         """fetch_headlines should skip feeds with no entries."""
         # Mock config with multiple feeds
         with patch("ai_radio.news.config") as mock_config:
@@ -210,6 +220,7 @@ class TestRSSNewsClient:
                 ],
             }
             mock_config.hallucinate_news = False
+            mock_config.paths.feed_cache_path = tmp_path / "feed_cache.json"
 
             client = RSSNewsClient()
 
@@ -326,7 +337,7 @@ class TestRSSNewsClient:
             assert news is not None
             assert len(news.headlines) >= 1
 
-    def test_fetch_headlines_network_timeout(self):
+    def test_fetch_headlines_network_timeout(self, tmp_path):
         """fetch_headlines should handle network timeouts gracefully."""
         # Mock config with multiple feeds
         with patch("ai_radio.news.config") as mock_config:
@@ -337,6 +348,7 @@ class TestRSSNewsClient:
                 ],
             }
             mock_config.hallucinate_news = False
+            mock_config.paths.feed_cache_path = tmp_path / "feed_cache.json"
 
             client = RSSNewsClient()
 
@@ -376,6 +388,121 @@ class TestRSSNewsClient:
                 assert news is not None
                 assert len(news.headlines) >= 1
 
+    def test_fetch_headlines_fetches_feeds_concurrently(self, tmp_path):
+        """All feeds are in flight at once rather than fetched one by one."""
+        with patch("ai_radio.news.config") as mock_config:
+            mock_config.news_rss_feeds = {
+                "news": ["https://a.example.com/rss", "https://b.example.com/rss"],
+                "tech": ["https://c.example.com/rss"],
+            }
+            mock_config.hallucinate_news = False
+            mock_config.paths.feed_cache_path = tmp_path / "feed_cache.json"
+
+            client = RSSNewsClient()
+            today_str = datetime.now().strftime("%Y-%m-%dT%H:00:00Z")
+
+            # Each get() blocks until all three feeds are being fetched
+            barrier = threading.Barrier(3, timeout=5)
+
+            def mock_get_side_effect(url, headers):
+                barrier.wait()
+                mock_response = Mock()
+                mock_response.raise_for_status = Mock(return_value=None)
+                mock_response.content = f"""<?xml version="1.0"?>
+                    <rss><channel><title>Feed {url}</title>
+                    <item>
+                        <title>Story from {url}</title>
+                        <link>{url}/1</link>
+                        <pubDate>{today_str}</pubDate>
+                    </item>
+                    </channel></rss>""".encode()
+                return mock_response
+
+            with patch("httpx.Client") as mock_client_class:
+                mock_client = Mock()
+                mock_client.get = Mock(side_effect=mock_get_side_effect)
+                mock_client_class.return_value.__enter__.return_value = mock_client
+
+                news = client.fetch_headlines()
+
+                assert news is not None
+                assert news.source_count == 3
+                assert len(news.headlines) == 2  # One per category
+
+    def test_fetch_headlines_saves_validators(self, tmp_path):
+        """A full fetch saves the feed's ETag, Last-Modified and entries."""
+        cache_file = tmp_path / "feed_cache.json"
+        url = "https://a.example.com/rss"
+        today_str = datetime.now().strftime("%Y-%m-%dT%H:00:00Z")
+
+        with patch("ai_radio.news.config") as mock_config:
+            mock_config.news_rss_feeds = {"news": [url]}
+            mock_config.hallucinate_news = False
+            mock_config.paths.feed_cache_path = cache_file
+
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.headers = {"ETag": '"v1"', "Last-Modified": "Mon, 29 Dec 2025 16:00:00 GMT"}
+            mock_response.content = f"""<?xml version="1.0"?>
+                <rss><channel><title>Feed A</title>
+                <item><title>Story</title><link>{url}/1</link><pubDate>{today_str}</pubDate></item>
+                </channel></rss>""".encode()
+
+            with patch("httpx.Client") as mock_client_class:
+                mock_client = Mock()
+                mock_client.get.return_value = mock_response
+                mock_client_class.return_value.__enter__.return_value = mock_client
+
+                news = RSSNewsClient().fetch_headlines()
+
+        assert news is not None
+        record = json.loads(cache_file.read_text())[url]
+        assert record["etag"] == '"v1"'
+        assert record["last_modified"] == "Mon, 29 Dec 2025 16:00:00 GMT"
+        assert record["title"] == "Feed A"
+        assert [e["title"] for e in record["entries"]] == ["Story"]
+
+    def test_fetch_headlines_reuses_cached_entries_on_304(self, tmp_path):
+        """Unchanged feeds are revalidated and served from the cache without parsing."""
+        cache_file = tmp_path / "feed_cache.json"
+        url = "https://a.example.com/rss"
+        cache_file.write_text(json.dumps({
+            url: {
+                "etag": '"v1"',
+                "last_modified": "Mon, 29 Dec 2025 16:00:00 GMT",
+                "title": "Feed A",
+                "entries": [
+                    {"title": "Fresh", "link": f"{url}/1", "published": datetime.now().isoformat()},
+                    {"title": "Old", "link": f"{url}/2", "published": "2020-01-01T00:00:00"},
+                ],
+            }
+        }))
+
+        with patch("ai_radio.news.config") as mock_config:
+            mock_config.news_rss_feeds = {"news": [url]}
+            mock_config.hallucinate_news = False
+            mock_config.paths.feed_cache_path = cache_file
+
+            mock_response = Mock()
+            mock_response.status_code = 304
+
+            with patch("httpx.Client") as mock_client_class, \
+                 patch("feedparser.parse") as mock_parse:
+                mock_client = Mock()
+                mock_client.get.return_value = mock_response
+                mock_client_class.return_value.__enter__.return_value = mock_client
+
+                news = RSSNewsClient().fetch_headlines()
+
+        headers = mock_client.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Mon, 29 Dec 2025 16:00:00 GMT"
+        mock_parse.assert_not_called()
+        assert news is not None
+        assert news.source_count == 1
+        assert [h.title for h in news.headlines] == ["Fresh"]
+        assert news.headlines[0].source == "Feed A"
+
 
 class TestGetNewsConvenience:
     """Tests for get_news() convenience function."""
@@ -0,0 +1,85 @@
+"""Tests for play history helpers."""
+
+import sqlite3
+from datetime import datetime, timezone
+
+from ai_radio.play_history import hour_bucket, record_play, record_plays
+
+
+def test_hour_bucket_matches_truncated_isoformat():
+    """hour_bucket should equal the replace()-truncated ISO timestamp."""
+    now = datetime(2026, 1, 8, 17, 42, 13, 123456, tzinfo=timezone.utc)
+
+    expected = now.replace(minute=0, second=0, microsecond=0).isoformat()
+    assert hour_bucket(now) == expected == "2026-01-08T17:00:00+00:00"
+
+
+def test_hour_bucket_updates_when_hour_changes():
+    """Cached bucket must roll over at the hour boundary."""
+    before = datetime(2026, 1, 8, 17, 59, 59, tzinfo=timezone.utc)
+    after = datetime(2026, 1, 8, 18, 0, 0, tzinfo=timezone.utc)
+
+    assert hour_bucket(before) == "2026-01-08T17:00:00+00:00"
+    assert hour_bucket(after) == "2026-01-08T18:00:00+00:00"
+    assert hour_bucket(before) == "2026-01-08T17:00:00+00:00"
+
+
+def _create_play_history(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE play_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            asset_id TEXT NOT NULL,
+            played_at TEXT NOT NULL,
+            source TEXT NOT NULL,
+            hour_bucket TEXT
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+
+def test_record_plays_inserts_batch(tmp_path):
+    """record_plays should insert every row in one call."""
+    db_path = tmp_path / "radio.sqlite3"
+    _create_play_history(db_path)
+
+    plays = [
+        ("asset-a", "music", datetime(2026, 1, 8, 17, 5, tzinfo=timezone.utc)),
+        ("asset-b", "bumper", datetime(2026, 1, 8, 18, 1, tzinfo=timezone.utc)),
+    ]
+    assert record_plays(db_path, plays) == 2
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT asset_id, source, hour_bucket FROM play_history ORDER BY id"
+    ).fetchall()
+    conn.close()
+
+    assert rows == [
+        ("asset-a", "music", "2026-01-08T17:00:00+00:00"),
+        ("asset-b", "bumper", "2026-01-08T18:00:00+00:00"),
+    ]
+
+
+def test_record_play_returns_false_without_table(tmp_path):
+    """record_play should report failure instead of raising."""
+    assert record_play(tmp_path / "empty.sqlite3", "asset-a") is False
+
+
+def test_record_play_reuses_caller_connection(tmp_path):
+    """record_play should write through a connection the caller already holds."""
+    db_path = tmp_path / "radio.sqlite3"
+    _create_play_history(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("SELECT COUNT(*) FROM play_history").fetchone()
+        assert record_play(db_path, "asset-a", "music", conn=conn) is True
+        conn.commit()
+    finally:
+        conn.close()
+
+    check = sqlite3.connect(db_path)
+    assert check.execute("SELECT asset_id FROM play_history").fetchall() == [("asset-a",)]
+    check.close()
@@ -0,0 +1,117 @@
+"""Tests for the push daemon's export trigger socket."""
+
+import asyncio
+import socket
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add scripts directory to path so we can import push_daemon
+scripts_dir = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(scripts_dir))
+
+import push_daemon
+
+
+@pytest.fixture
+def sock_path(tmp_path, mocker):
+    """Point the daemon's export socket at a temporary path."""
+    path = tmp_path / "export.sock"
+    mock_cfg = MagicMock()
+    mock_cfg.paths.export_sock_path = path
+    mocker.patch("push_daemon.config", mock_cfg)
+    yield path
+    push_daemon.export_transport = None
+    push_daemon.export_failures = 0
+    push_daemon.export_rebind_handle = None
+
+
+def send_trigger(path: Path) -> None:
+    """Send the trigger datagram the way record_play.notify_push_daemon() does."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.sendto(b"export", str(path))
+
+
+class TestExportTrigger:
+    """Tests for export triggers and their failure path."""
+
+    def test_trigger_builds_and_broadcasts_state(self, sock_path):
+        """A successful export should be broadcast and keep the socket open."""
+        state = {"current": None}
+
+        async def run():
+            await push_daemon.start_export_listener(MagicMock())
+            with patch("export_now_playing.build_now_playing_state", return_value=state), \
+                 patch("push_daemon.schedule_broadcast") as mock_broadcast:
+                await push_daemon.run_exports()
+            push_daemon.close_export_listener()
+            return mock_broadcast
+
+        mock_broadcast = asyncio.run(run())
+
+        mock_broadcast.assert_called_once_with(state)
+
+    def test_single_failed_export_keeps_socket(self, sock_path):
+        """A transient export error should be logged, not close the socket."""
+        async def run():
+            await push_daemon.start_export_listener(MagicMock())
+            with patch(
+                "export_now_playing.build_now_playing_state",
+                side_effect=RuntimeError("database is locked"),
+            ):
+                await push_daemon.run_exports()
+            send_trigger(sock_path)  # still delivered
+            push_daemon.close_export_listener()
+
+        asyncio.run(run())
+
+        assert push_daemon.export_failures == 1
+        assert push_daemon.export_running is False
+
+    def test_success_resets_failure_count(self, sock_path):
+        """A successful export should clear earlier consecutive failures."""
+        push_daemon.export_failures = push_daemon.EXPORT_FAILURE_LIMIT - 1
+
+        async def run():
+            await push_daemon.start_export_listener(MagicMock())
+            with patch("export_now_playing.build_now_playing_state", return_value={}), \
+                 patch("push_daemon.schedule_broadcast"):
+                await push_daemon.run_exports()
+            assert sock_path.exists()
+            push_daemon.close_export_listener()
+
+        asyncio.run(run())
+
+        assert push_daemon.export_failures == 0
+
+    def test_repeated_failures_disable_socket_then_rebind(self, sock_path, monkeypatch):
+        """Consecutive failures should close the socket, then re-bind it after a delay."""
+        monkeypatch.setattr(push_daemon, "EXPORT_REBIND_DELAY_SEC", 0.01)
+        closed = {}
+
+        async def run():
+            await push_daemon.start_export_listener(MagicMock())
+            with patch(
+                "export_now_playing.build_now_playing_state",
+                side_effect=RuntimeError("attempt to write a readonly database"),
+            ):
+                for _ in range(push_daemon.EXPORT_FAILURE_LIMIT):
+                    await push_daemon.run_exports()
+
+            closed["transport"] = push_daemon.export_transport
+            closed["exists"] = sock_path.exists()
+            # The next trigger fails to send, which sends record_play.py down
+            # its in-process export path
+            with pytest.raises(OSError):
+                send_trigger(sock_path)
+
+            await asyncio.sleep(0.05)
+            assert sock_path.exists()
+            send_trigger(sock_path)  # delivered again after the re-bind
+            push_daemon.close_export_listener()
+
+        asyncio.run(run())
+
+        assert closed == {"transport": None, "exists": False}
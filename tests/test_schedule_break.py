@@ -4,6 +4,7 @@ Test coverage:
 - Stale break detection and rejection
 - Fresh break selection
 - Freshness threshold from config
+- Cached break listing
 """
 
 import time
@@ -12,7 +13,7 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from ai_radio.break_scheduler import get_fresh_break, StaleBreakError
+from ai_radio.break_scheduler import BreaksIndex, get_fresh_break, StaleBreakError
 
 
 class TestGetFreshBreak:
@@ -142,6 +143,63 @@ class TestGetFreshBreak:
         assert result == new_break
 
 
+class TestBreaksIndex:
+    """Tests for the cached break listing."""
+
+    def _settle(self, directory, age_seconds=60):
+        """Backdate the directory so its listing is outside the racy window."""
+        import os
+        old = time.time() - age_seconds
+        os.utime(directory, (old, old))
+
+    def test_entries_sorted_newest_first(self, tmp_path):
+        """Breaks are listed newest first; other files are ignored."""
+        import os
+        older = tmp_path / "break_20260108_100000.mp3"
+        newer = tmp_path / "break_20260108_110000.mp3"
+        older.write_bytes(b"a")
+        newer.write_bytes(b"b")
+        (tmp_path / "notes.txt").write_text("not a break")
+        os.utime(older, (time.time() - 600, time.time() - 600))
+
+        paths = [path for _, path in BreaksIndex(tmp_path).entries()]
+
+        assert paths == [newer, older]
+
+    def test_listing_reused_until_directory_changes(self, tmp_path):
+        """An unchanged directory is not re-scanned."""
+        import os
+        (tmp_path / "break_20260108_100000.mp3").write_bytes(b"a")
+        self._settle(tmp_path)
+        index = BreaksIndex(tmp_path)
+
+        with patch("ai_radio.break_scheduler.os.scandir", wraps=os.scandir) as mock_scandir:
+            first = index.entries()
+            assert index.entries() == first
+            assert mock_scandir.call_count == 1
+
+            (tmp_path / "break_20260108_110000.mp3").write_bytes(b"b")
+            self._settle(tmp_path, age_seconds=30)
+            assert len(index.entries()) == 2
+            assert mock_scandir.call_count == 2
+
+    def test_recently_modified_directory_not_cached(self, tmp_path):
+        """A listing taken right after a change is re-checked next time."""
+        import os
+        (tmp_path / "break_20260108_100000.mp3").write_bytes(b"a")
+        index = BreaksIndex(tmp_path)
+
+        with patch("ai_radio.break_scheduler.os.scandir", wraps=os.scandir) as mock_scandir:
+            index.entries()
+            index.entries()
+
+        assert mock_scandir.call_count == 2
+
+    def test_missing_directory_has_no_entries(self, tmp_path):
+        """A missing directory lists as empty."""
+        assert BreaksIndex(tmp_path / "missing").entries() == ()
+
+
 class TestStaleBreakError:
     """Tests for StaleBreakError exception."""
 
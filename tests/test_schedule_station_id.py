@@ -0,0 +1,144 @@
+"""Tests for station ID slot claiming in schedule_station_id.py."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts directory to path so we can import schedule_station_id
+scripts_dir = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(scripts_dir))
+
+import schedule_station_id
+from ai_radio.db import connect
+
+SCHEMA = (Path(__file__).parent.parent / "db" / "migrations" / "004_add_scheduler_state.sql").read_text()
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """Autocommit connection (as used by the script) with scheduler_state."""
+    conn = connect(tmp_path / "radio.db")
+    conn.executescript(SCHEMA)
+    yield conn
+    conn.close()
+
+
+def stored_value(conn, key=schedule_station_id.STATE_KEY):
+    row = conn.execute("SELECT value FROM scheduler_state WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+class TestClaimSchedulerState:
+    """Tests for the conditional-upsert slot claim."""
+
+    def test_first_claim_inserts_slot(self, conn):
+        """Claiming an unrecorded slot should succeed and store it."""
+        assert schedule_station_id.claim_scheduler_state(conn, "k", "14:15") is True
+        assert stored_value(conn, "k") == "14:15"
+
+    def test_same_slot_already_claimed(self, conn):
+        """Claiming the stored slot again should return False (no RETURNING row)."""
+        schedule_station_id.claim_scheduler_state(conn, "k", "14:15")
+        updated_at = conn.execute("SELECT updated_at FROM scheduler_state").fetchone()[0]
+
+        assert schedule_station_id.claim_scheduler_state(conn, "k", "14:15") is False
+        # The losing claim must not touch the row
+        assert conn.execute("SELECT updated_at FROM scheduler_state").fetchone()[0] == updated_at
+
+    def test_new_slot_replaces_previous(self, conn):
+        """Claiming a different slot should overwrite the previous one."""
+        schedule_station_id.claim_scheduler_state(conn, "k", "14:15")
+
+        assert schedule_station_id.claim_scheduler_state(conn, "k", "14:30") is True
+        assert stored_value(conn, "k") == "14:30"
+
+    def test_separate_connections_only_one_wins(self, conn, tmp_path):
+        """Two runs claiming the same slot: exactly one should win."""
+        other = connect(tmp_path / "radio.db")
+        try:
+            results = [
+                schedule_station_id.claim_scheduler_state(conn, "k", "14:45"),
+                schedule_station_id.claim_scheduler_state(other, "k", "14:45"),
+            ]
+        finally:
+            other.close()
+
+        assert results == [True, False]
+
+
+class TestReleaseSchedulerState:
+    """Tests for releasing a claimed slot."""
+
+    def test_release_deletes_claimed_slot(self, conn):
+        """Releasing the claimed slot should allow it to be claimed again."""
+        schedule_station_id.claim_scheduler_state(conn, "k", "14:15")
+
+        schedule_station_id.release_scheduler_state(conn, "k", "14:15")
+
+        assert stored_value(conn, "k") is None
+        assert schedule_station_id.claim_scheduler_state(conn, "k", "14:15") is True
+
+    def test_release_leaves_other_slot(self, conn):
+        """Releasing a stale slot must not delete a newer claim."""
+        schedule_station_id.claim_scheduler_state(conn, "k", "14:30")
+
+        schedule_station_id.release_scheduler_state(conn, "k", "14:15")
+
+        assert stored_value(conn, "k") == "14:30"
+
+
+class TestShouldScheduleStationId:
+    """Tests for the scheduling window check."""
+
+    def test_claims_slot_once_per_window(self, conn):
+        """Only the first run in the :14 window should schedule the :15 ID."""
+        with patch("schedule_station_id.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 1, 1, 14, 14)
+            first = schedule_station_id.should_schedule_station_id(conn)
+            second = schedule_station_id.should_schedule_station_id(conn)
+
+        assert first == (True, 15)
+        assert second == (False, None)
+        assert stored_value(conn) == "14:15"
+
+    def test_outside_window_claims_nothing(self, conn):
+        """Outside a scheduling window nothing should be claimed."""
+        with patch("schedule_station_id.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 1, 1, 14, 20)
+            result = schedule_station_id.should_schedule_station_id(conn)
+
+        assert result == (False, None)
+        assert stored_value(conn) is None
+
+
+class TestMain:
+    """Tests for releasing the claimed slot when queuing fails."""
+
+    @pytest.fixture
+    def db_path(self, conn, tmp_path):
+        """Path of the database behind the conn fixture."""
+        return tmp_path / "radio.db"
+
+    def run_main(self, db_path, push_side_effect):
+        with patch("schedule_station_id.datetime") as mock_datetime, \
+             patch("schedule_station_id.connect", side_effect=lambda _: connect(db_path)), \
+             patch("schedule_station_id.get_random_station_id", return_value=Path("/tmp/id.mp3")), \
+             patch("schedule_station_id.LiquidsoapClient") as mock_client:
+            mock_datetime.now.return_value = datetime(2026, 1, 1, 14, 14)
+            mock_client.return_value.push_track.side_effect = push_side_effect
+            with pytest.raises(SystemExit) as exc_info:
+                schedule_station_id.main()
+        return exc_info.value.code
+
+    def test_push_error_releases_slot(self, conn, db_path):
+        """An exception while queuing should free the slot for the next run."""
+        assert self.run_main(db_path, ConnectionRefusedError("socket gone")) == 1
+        assert stored_value(conn) is None
+
+    def test_successful_push_keeps_slot(self, conn, db_path):
+        """A queued station ID should keep its slot claimed."""
+        assert self.run_main(db_path, [True]) == 0
+        assert stored_value(conn) == "14:15"
@@ -7,16 +7,26 @@ Test coverage:
 - API error handling
 - Missing API key handling
 - Empty data handling
+- System prompt caching
+- Segment cache
 """
 
+import time
 from datetime import datetime
 from unittest.mock import Mock, patch
+from zoneinfo import ZoneInfo
 
 import pytest
 from anthropic import APIError
 
 from ai_radio.news import NewsData, NewsHeadline
-from ai_radio.script_writer import ClaudeScriptWriter, BulletinScript, generate_bulletin
+from ai_radio.script_writer import (
+    BulletinScript,
+    ClaudeScriptWriter,
+    generate_bulletin,
+    load_cached_segment,
+    store_cached_segment,
+)
 
 from conftest import create_test_weather_data
 
@@ -70,7 +80,7 @@ class TestClaudeScriptWriter:
                 with patch("ai_radio.script_writer.config") as mock_config:
                     mock_config.llm_api_key = "test-key"
                     mock_config.llm_model = "claude-3-5-sonnet-20241022"
-                    mock_config.station_tz = "UTC"
+                    mock_config.station.station_zone = ZoneInfo("UTC")
                     # Mock nested station config
                     mock_config.station.station_name = "Test Radio"
                     mock_config.station_location = "Test City"
@@ -117,7 +127,7 @@ class TestClaudeScriptWriter:
                 with patch("ai_radio.script_writer.config") as mock_config:
                     mock_config.llm_api_key = "test-key"
                     mock_config.llm_model = "claude-3-5-sonnet-20241022"
-                    mock_config.station_tz = "UTC"
+                    mock_config.station.station_zone = ZoneInfo("UTC")
                     # Mock nested station config
                     mock_config.station.station_name = "Test Radio"
                     mock_config.station_location = "Test City"
@@ -158,7 +168,7 @@ class TestClaudeScriptWriter:
         with patch("ai_radio.script_writer.config") as mock_config:
             mock_config.llm_api_key = "test-key"
             mock_config.llm_model = "claude-3-5-sonnet-20241022"
-            mock_config.station_tz = "UTC"
+            mock_config.station.station_zone = ZoneInfo("UTC")
             # Mock nested station config
             mock_config.station.station_name = "Test Radio"
             mock_config.station_location = "Test City"
@@ -213,7 +223,7 @@ class TestClaudeScriptWriter:
                 with patch("ai_radio.script_writer.config") as mock_config:
                     mock_config.llm_api_key = "test-key"
                     mock_config.llm_model = "claude-3-5-sonnet-20241022"
-                    mock_config.station_tz = "UTC"
+                    mock_config.station.station_zone = ZoneInfo("UTC")
                     # Mock nested station config
                     mock_config.station.station_name = "Test Radio"
                     mock_config.station_location = "Test City"
@@ -256,7 +266,7 @@ class TestClaudeScriptWriter:
         with patch("ai_radio.script_writer.config") as mock_config:
             mock_config.llm_api_key = "test-key"
             mock_config.llm_model = "claude-3-5-sonnet-20241022"
-            mock_config.station_tz = "UTC"
+            mock_config.station.station_zone = ZoneInfo("UTC")
             # Mock nested station config
             mock_config.station.station_name = "Test Radio"
             mock_config.station_location = "Test City"
@@ -284,6 +294,125 @@ class TestClaudeScriptWriter:
                 assert "Story 0" in prompt
                 assert "Story 9" in prompt  # Should include all headlines
 
+    @pytest.mark.parametrize("cache_enabled", [True, False])
+    def test_system_prompt_cache_control(self, cache_enabled):
+        """The static system prompt is sent as a cacheable block when enabled."""
+        news = NewsData(
+            headlines=[
+                NewsHeadline(title="Breaking story", source="News", link="https://example.com/1")
+            ],
+            timestamp=datetime.now(),
+            source_count=1,
+        )
+
+        with patch("ai_radio.script_writer.config") as mock_config:
+            mock_config.llm_api_key = "test-key"
+            mock_config.llm_model = "claude-3-5-sonnet-20241022"
+            mock_config.llm_prompt_cache_enabled = cache_enabled
+            mock_config.station.station_zone = ZoneInfo("UTC")
+            mock_config.station.station_name = "Test Radio"
+            mock_config.station_location = "Test City"
+            mock_config.news_script_temperature = 0.6
+
+            with patch("ai_radio.script_writer.Anthropic") as mock_anthropic_class:
+                mock_client = Mock()
+                mock_anthropic_class.return_value = mock_client
+
+                mock_response = Mock()
+                mock_content = Mock()
+                mock_content.text = "News bulletin script"
+                mock_response.content = [mock_content]
+                mock_client.messages.create.return_value = mock_response
+
+                writer = ClaudeScriptWriter()
+                writer.generate_bulletin(news=news)
+
+                system = mock_client.messages.create.call_args[1]["system"]
+                if cache_enabled:
+                    assert system == [{
+                        "type": "text",
+                        "text": writer.system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }]
+                else:
+                    assert system == writer.system_prompt
+
+
+class TestSegmentCache:
+    """Tests for the exact-prompt script segment cache."""
+
+    def test_round_trip_within_ttl(self, tmp_path):
+        """A stored segment is returned for the same key while fresh."""
+        with patch("ai_radio.script_writer.config") as mock_config:
+            mock_config.script_cache_ttl_minutes = 60
+            mock_config.paths.segment_cache_path = tmp_path / "segment_cache.json"
+
+            store_cached_segment("key-1", "Cached news segment")
+
+            assert load_cached_segment("key-1") == "Cached news segment"
+            assert load_cached_segment("key-2") is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Segments older than the TTL are not reused."""
+        with patch("ai_radio.script_writer.config") as mock_config:
+            mock_config.script_cache_ttl_minutes = 60
+            mock_config.paths.segment_cache_path = tmp_path / "segment_cache.json"
+            store_cached_segment("key-1", "Old segment")
+
+            with patch("ai_radio.script_writer.time.time", return_value=time.time() + 61 * 60):
+                assert load_cached_segment("key-1") is None
+
+    def test_disabled_by_default_ttl(self, tmp_path):
+        """A TTL of 0 turns the cache off entirely."""
+        cache_file = tmp_path / "segment_cache.json"
+        with patch("ai_radio.script_writer.config") as mock_config:
+            mock_config.script_cache_ttl_minutes = 0
+            mock_config.paths.segment_cache_path = cache_file
+
+            store_cached_segment("key-1", "Segment")
+
+            assert not cache_file.exists()
+            assert load_cached_segment("key-1") is None
+
+    def test_identical_news_prompt_skips_api_call(self, tmp_path):
+        """A repeated news prompt is served from the cache."""
+        news = NewsData(
+            headlines=[
+                NewsHeadline(title="Breaking story", source="News", link="https://example.com/1")
+            ],
+            timestamp=datetime.now(),
+            source_count=1,
+        )
+
+        with patch("ai_radio.script_writer.config") as mock_config:
+            mock_config.llm_api_key = "test-key"
+            mock_config.llm_model = "claude-3-5-sonnet-20241022"
+            mock_config.llm_prompt_cache_enabled = True
+            mock_config.script_cache_ttl_minutes = 60
+            mock_config.paths.segment_cache_path = tmp_path / "segment_cache.json"
+            mock_config.station.station_zone = ZoneInfo("UTC")
+            mock_config.station.station_name = "Test Radio"
+            mock_config.station_location = "Test City"
+            mock_config.news_script_temperature = 0.6
+
+            with patch("ai_radio.script_writer.Anthropic") as mock_anthropic_class:
+                mock_client = Mock()
+                mock_anthropic_class.return_value = mock_client
+
+                mock_response = Mock()
+                mock_content = Mock()
+                mock_content.text = "In the news today: breaking story develops."
+                mock_response.content = [mock_content]
+                mock_client.messages.create.return_value = mock_response
+
+                writer = ClaudeScriptWriter()
+                first = writer.generate_bulletin(news=news)
+                second = writer.generate_bulletin(news=news)
+
+                assert mock_client.messages.create.call_count == 1
+                assert "breaking story develops" in first.script_text
+                assert "breaking story develops" in second.script_text
+
 
 class TestGenerateBulletinConvenience:
     """Tests for generate_bulletin() convenience function with fallback chain."""
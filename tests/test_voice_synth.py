@@ -1,4 +1,4 @@
-"""Tests for OpenAI TTS voice synthesis.
+"""Tests for OpenAI and Gemini TTS voice synthesis.
 
 Test coverage:
 - Successful voice synthesis
@@ -11,12 +11,19 @@ Test coverage:
 
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import MagicMock, Mock, patch, mock_open
+
+import wave
 
 import pytest
 from openai import APIError
 
-from ai_radio.voice_synth import OpenAIVoiceSynthesizer, AudioFile, synthesize_bulletin
+from ai_radio.voice_synth import (
+    AudioFile,
+    GeminiVoiceSynthesizer,
+    OpenAIVoiceSynthesizer,
+    synthesize_bulletin,
+)
 
 
 class TestOpenAIVoiceSynthesizer:
@@ -53,19 +60,19 @@ class TestOpenAIVoiceSynthesizer:
             mock_config.tts_voice = "alloy"
 
             with patch("ai_radio.voice_synth.OpenAI") as mock_openai_class:
-                mock_client = Mock()
+                mock_client = MagicMock()
                 mock_openai_class.return_value = mock_client
 
                 # Mock TTS API response
                 mock_response = Mock()
                 mock_response.stream_to_file = Mock()
-                mock_client.audio.speech.create.return_value = mock_response
+                mock_client.audio.speech.with_streaming_response.create.return_value.__enter__.return_value = mock_response
 
                 synthesizer = OpenAIVoiceSynthesizer()
                 audio = synthesizer.synthesize(script, output_path)
 
                 # Verify API call
-                mock_client.audio.speech.create.assert_called_once_with(
+                mock_client.audio.speech.with_streaming_response.create.assert_called_once_with(
                     model="tts-1",
                     voice="alloy",
                     input=script,
@@ -83,6 +90,24 @@ class TestOpenAIVoiceSynthesizer:
                 assert audio.duration_estimate > 0
                 assert isinstance(audio.timestamp, datetime)
 
+    def test_synthesize_wav_output_requests_wav(self, tmp_path):
+        """synthesize should request WAV from the API for .wav output paths."""
+        output_path = tmp_path / "voice.wav"
+
+        with patch("ai_radio.voice_synth.config") as mock_config:
+            mock_config.tts_api_key = "test-key"
+            mock_config.tts_voice = "alloy"
+
+            with patch("ai_radio.voice_synth.OpenAI") as mock_openai_class:
+                mock_client = MagicMock()
+                mock_openai_class.return_value = mock_client
+
+                synthesizer = OpenAIVoiceSynthesizer()
+                audio = synthesizer.synthesize("Test bulletin.", output_path)
+
+                assert mock_client.audio.speech.with_streaming_response.create.call_args[1]["response_format"] == "wav"
+                assert audio.file_path == output_path
+
     def test_synthesize_duration_estimation(self, tmp_path):
         """synthesize should estimate duration based on word count (150 wpm)."""
         # 150 words should estimate to ~60 seconds
@@ -94,12 +119,12 @@ class TestOpenAIVoiceSynthesizer:
             mock_config.tts_voice = "alloy"
 
             with patch("ai_radio.voice_synth.OpenAI") as mock_openai_class:
-                mock_client = Mock()
+                mock_client = MagicMock()
                 mock_openai_class.return_value = mock_client
 
                 mock_response = Mock()
                 mock_response.stream_to_file = Mock()
-                mock_client.audio.speech.create.return_value = mock_response
+                mock_client.audio.speech.with_streaming_response.create.return_value.__enter__.return_value = mock_response
 
                 synthesizer = OpenAIVoiceSynthesizer()
                 audio = synthesizer.synthesize(script, output_path)
@@ -144,11 +169,11 @@ class TestOpenAIVoiceSynthesizer:
             mock_config.tts_voice = "alloy"
 
             with patch("ai_radio.voice_synth.OpenAI") as mock_openai_class:
-                mock_client = Mock()
+                mock_client = MagicMock()
                 mock_openai_class.return_value = mock_client
 
                 # Simulate API error (use generic Exception since APIError signature varies)
-                mock_client.audio.speech.create.side_effect = Exception("API rate limit")
+                mock_client.audio.speech.with_streaming_response.create.side_effect = Exception("API rate limit")
 
                 synthesizer = OpenAIVoiceSynthesizer()
                 audio = synthesizer.synthesize(script, output_path)
@@ -165,12 +190,12 @@ class TestOpenAIVoiceSynthesizer:
             mock_config.tts_voice = "alloy"
 
             with patch("ai_radio.voice_synth.OpenAI") as mock_openai_class:
-                mock_client = Mock()
+                mock_client = MagicMock()
                 mock_openai_class.return_value = mock_client
 
                 mock_response = Mock()
                 mock_response.stream_to_file = Mock()
-                mock_client.audio.speech.create.return_value = mock_response
+                mock_client.audio.speech.with_streaming_response.create.return_value.__enter__.return_value = mock_response
 
                 synthesizer = OpenAIVoiceSynthesizer()
                 audio = synthesizer.synthesize(script, nested_path)
@@ -189,18 +214,18 @@ class TestOpenAIVoiceSynthesizer:
             mock_config.tts_voice = "nova"  # Different voice
 
             with patch("ai_radio.voice_synth.OpenAI") as mock_openai_class:
-                mock_client = Mock()
+                mock_client = MagicMock()
                 mock_openai_class.return_value = mock_client
 
                 mock_response = Mock()
                 mock_response.stream_to_file = Mock()
-                mock_client.audio.speech.create.return_value = mock_response
+                mock_client.audio.speech.with_streaming_response.create.return_value.__enter__.return_value = mock_response
 
                 synthesizer = OpenAIVoiceSynthesizer()
                 audio = synthesizer.synthesize(script, output_path)
 
                 # Verify nova voice was used
-                call_kwargs = mock_client.audio.speech.create.call_args[1]
+                call_kwargs = mock_client.audio.speech.with_streaming_response.create.call_args[1]
                 assert call_kwargs["voice"] == "nova"
                 assert audio.voice == "nova"
 
@@ -244,3 +269,35 @@ class TestSynthesizeBulletinConvenience:
                 result = synthesize_bulletin("test", tmp_path / "test.mp3")
 
                 assert result is None
+
+
+class TestGeminiVoiceSynthesizer:
+    """Tests for GeminiVoiceSynthesizer."""
+
+    def test_synthesize_wav_output_skips_ffmpeg(self, tmp_path):
+        """synthesize should wrap Gemini PCM in a WAV header without running ffmpeg."""
+        output_path = tmp_path / "voice.wav"
+        pcm = b"\x01\x00" * 24000  # one second of 24kHz 16-bit mono
+
+        part = Mock()
+        part.inline_data.data = pcm
+        response = Mock()
+        response.candidates = [Mock()]
+        response.candidates[0].content.parts = [part]
+
+        with patch("ai_radio.voice_synth.config") as mock_config, \
+                patch("google.genai.Client") as mock_client_class, \
+                patch("subprocess.run") as mock_run:
+            mock_config.gemini_api_key = "test-key"
+            mock_client_class.return_value.models.generate_content.return_value = response
+
+            synthesizer = GeminiVoiceSynthesizer(model_name="test-model", voice="Kore")
+            audio = synthesizer.synthesize("Test bulletin.", output_path)
+
+            mock_run.assert_not_called()
+
+        assert audio.file_path == output_path
+        with wave.open(str(output_path), "rb") as wav_file:
+            assert wav_file.getframerate() == 24000
+            assert wav_file.getnchannels() == 1
+            assert wav_file.readframes(wav_file.getnframes()) == pcm